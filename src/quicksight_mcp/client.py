@@ -21,12 +21,18 @@ Environment variables:
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
+import random
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -37,6 +43,7 @@ from quicksight_mcp.exceptions import (
     ConcurrentModificationError,
     DestructiveChangeError,
 )
+from quicksight_mcp.safety.exceptions import THROTTLE_CODES, aws_error_code
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +53,15 @@ logger = logging.getLogger(__name__)
 
 _dataset_cache: Dict[str, Any] = {
     'data': None,
+    'index': None,  # [(lowercased name, summary)], built with 'data'
+    'searches': {},  # lowercased query -> matches, reset with 'data'
     'timestamp': 0,
     'ttl': 300,  # 5 minutes
 }
 
+# Distinct search strings remembered per list snapshot
+_MAX_CACHED_SEARCHES = 256
+
 _analysis_cache: Dict[str, Any] = {
     'data': None,
     'timestamp': 0,
@@ -65,6 +77,53 @@ _dashboard_cache: Dict[str, Any] = {
 # Keyed by analysis_id -> {'data': ..., 'timestamp': ...}
 _analysis_def_cache: Dict[str, Dict[str, Any]] = {}
 
+# Single-flight: analysis_id -> Future for a describe_analysis_definition
+# call already in progress, so concurrent cache misses share one request.
+# The per-analysis generation is bumped on every eviction so a describe
+# that started before a write cannot store its result afterwards.  Both
+# guarded by _analysis_def_inflight_lock.
+_analysis_def_inflight: Dict[str, Future] = {}
+_analysis_def_generation: Dict[str, int] = {}
+_analysis_def_inflight_lock = threading.Lock()
+
+# describe_data_set results for reads, keyed by dataset_id ->
+# {'data': ..., 'timestamp': ...}; least recently used entries are dropped
+# past _DATASET_DESCRIBE_MAX.  Write paths always describe fresh, since
+# they edit the returned dict in place.
+_dataset_describe_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+_dataset_describe_lock = threading.Lock()
+_DATASET_DESCRIBE_TTL = 60
+_DATASET_DESCRIBE_MAX = 512
+
+# Single-flight for describe_data_set cache misses, and a per-dataset
+# generation bumped on every eviction so a describe that started before a
+# write cannot store its result afterwards.  Both guarded by
+# _dataset_describe_lock.
+_dataset_describe_inflight: Dict[str, Future] = {}
+_dataset_generation: Dict[str, int] = {}
+
+# Keyed by dataset_id -> {'data': Custom SQL or None, 'timestamp': ...}.
+# Writes through this client store the SQL they wrote.  Guarded by
+# _dataset_describe_lock and stored subject to _dataset_generation.
+_dataset_sql_cache: Dict[str, Dict[str, Any]] = {}
+
+# dataset_id -> ingestion_id of the last SPICE refresh this process started
+# that has not yet been seen to finish.  _refresh_inflight_lock only guards
+# the dicts and is never held across an AWS call.  The per-dataset lock in
+# _refresh_locks is held across the status check and create_ingestion, so
+# concurrent refreshes of one dataset start one ingestion without holding
+# up other datasets.
+_refresh_inflight: Dict[str, str] = {}
+_refresh_locks: Dict[str, threading.Lock] = {}
+_refresh_inflight_lock = threading.Lock()
+
+# Keyed by analysis_id -> (CalculatedFields list, its length, {name: field}).
+# Rebuilt whenever the cached definition hands back a different list.
+_calc_field_index: Dict[str, Tuple[List[Dict], int, Dict[str, Dict]]] = {}
+
+# Keyed by dashboard_id -> {'data': ..., 'timestamp': ...}
+_dashboard_versions_cache: Dict[str, Dict[str, Any]] = {}
+
 # Default backup directory
 _DEFAULT_BACKUP_DIR = os.path.expanduser('~/.quicksight-mcp/backups')
 
@@ -81,6 +140,100 @@ _VISUAL_TYPES = [
 ]
 
 
+# QuickSight rejects CustomSql.SqlQuery values longer than this.
+_MAX_SQL_QUERY_LENGTH = 168_000
+
+
+def _check_sql_length(sql: str) -> None:
+    """Raise before any backup or API call if ``sql`` exceeds the API limit."""
+    if len(sql) > _MAX_SQL_QUERY_LENGTH:
+        raise ValueError(
+            f"SQL is {len(sql)} characters; QuickSight accepts at most "
+            f"{_MAX_SQL_QUERY_LENGTH}."
+        )
+
+
+# SPICE refresh polling: quick probes first, then a ramp to a plateau.
+_REFRESH_TERMINAL = frozenset({'COMPLETED', 'FAILED', 'CANCELLED'})
+_REFRESH_FAST_PROBES = 10
+_REFRESH_RAMP_STEPS = 20
+_REFRESH_MAX_DELAY = 30.0
+
+
+def _refresh_poll_delay(attempt: int) -> float:
+    """Seconds to wait before poll number ``attempt`` (0-based), with jitter."""
+    if attempt < _REFRESH_FAST_PROBES:
+        base = 1.0
+    else:
+        step = min(attempt - _REFRESH_FAST_PROBES + 1, _REFRESH_RAMP_STEPS)
+        base = 1.0 + (_REFRESH_MAX_DELAY - 1.0) * (step / _REFRESH_RAMP_STEPS) ** 0.7
+    return base * random.uniform(0.8, 1.2)
+
+
+_DATASET_OPTIONAL_KEYS = (
+    'ColumnGroups', 'FieldFolders', 'RowLevelPermissionDataSet',
+    'DataSetUsageConfiguration', 'ColumnLevelPermissionRules',
+    'RowLevelPermissionTagConfiguration',
+)
+
+
+def _same_dataset_payload(update_params: Dict[str, Any], current: Dict) -> bool:
+    """True if ``update_data_set`` with ``update_params`` would change nothing."""
+    for key in ('Name', 'PhysicalTableMap', 'LogicalTableMap', 'ImportMode'):
+        if update_params[key] != current.get(key):
+            return False
+    # update_data_set replaces the dataset, so a key left out is a removal
+    return all(
+        update_params.get(key) == current.get(key)
+        for key in _DATASET_OPTIONAL_KEYS
+    )
+
+
+def _forget_dataset_describe(dataset_id: str) -> None:
+    """Drop a dataset's cached describe and void any describe in flight.
+
+    Call after the dataset changed; reads already in flight then neither
+    store their result nor hand it to later callers.
+    """
+    with _dataset_describe_lock:
+        _dataset_generation[dataset_id] = _dataset_generation.get(dataset_id, 0) + 1
+        _dataset_describe_cache.pop(dataset_id, None)
+        _dataset_describe_inflight.pop(dataset_id, None)
+
+
+def _forget_dataset(dataset_id: str) -> None:
+    """Drop cached describe and SQL results for a dataset that changed."""
+    _forget_dataset_describe(dataset_id)
+    with _dataset_describe_lock:
+        _dataset_sql_cache.pop(dataset_id, None)
+
+
+def _refresh_lock(dataset_id: str) -> threading.Lock:
+    """Return the lock serializing refresh_dataset calls for one dataset."""
+    with _refresh_inflight_lock:
+        return _refresh_locks.setdefault(dataset_id, threading.Lock())
+
+
+def _forget_refresh(dataset_id: str, ingestion_id: str) -> None:
+    """Stop tracking ``ingestion_id`` as the dataset's in-flight refresh."""
+    with _refresh_inflight_lock:
+        if _refresh_inflight.get(dataset_id) == ingestion_id:
+            del _refresh_inflight[dataset_id]
+
+
+def _custom_sql(dataset: Dict) -> Optional[str]:
+    """Return the Custom SQL query of a described dataset, if it has one."""
+    for _table_id, table_def in dataset.get('PhysicalTableMap', {}).items():
+        if 'CustomSql' in table_def:
+            return table_def['CustomSql'].get('SqlQuery')
+    return None
+
+
+def _name_index(items: List[Dict]) -> List[Tuple[str, Dict]]:
+    """Pair each summary with its lowercased ``Name`` for substring search."""
+    return [((item.get('Name') or '').lower(), item) for item in items]
+
+
 class QuickSightClient:
     """Comprehensive AWS QuickSight client with caching, locking, and safety features.
 
@@ -144,7 +297,15 @@ class QuickSightClient:
             self.session = boto3.Session(region_name=self.region)
 
         from botocore.config import Config
-        retry_config = Config(retries={'max_attempts': 3, 'mode': 'adaptive'})
+        # Adaptive mode rate-limits client-side after throttles; 6 attempts
+        # absorbs bursts of ThrottlingException inside a single tool call.
+        # FastMCP runs sync tools on up to 40 worker threads, plus the
+        # fan-out pool, all sharing this client; botocore's default of 10
+        # pooled connections would make them queue for (or reopen) sockets.
+        retry_config = Config(
+            retries={'max_attempts': 6, 'mode': 'adaptive'},
+            max_pool_connections=50,
+        )
         self.client = self.session.client('quicksight', config=retry_config)
 
         # Auto-detect account ID from STS if not provided
@@ -381,38 +542,87 @@ class QuickSightClient:
         datasets = self._paginate('list_data_sets', 'DataSetSummaries')
 
         _dataset_cache['data'] = datasets
+        _dataset_cache['index'] = _name_index(datasets)
+        _dataset_cache['searches'] = {}
         _dataset_cache['timestamp'] = time.time()
         logger.debug("Dataset cache refreshed (%d datasets)", len(datasets))
         return datasets
 
     def search_datasets(self, name_contains: str) -> List[Dict]:
-        """Search datasets by name (server-side with client-side fallback).
+        """Search datasets by name (client-side filter on cached list).
+
+        Filtering the cached ``list_datasets`` result means repeated
+        searches cost one AWS call per cache window, and matches are not
+        capped at the 100 results ``search_data_sets`` returns.  Matches
+        are remembered per case-insensitive query until the list is
+        refreshed, so repeated lookups skip the scan.
 
         Args:
             name_contains: Substring to search for in dataset names.
         """
-        # Try server-side search first
-        try:
-            response = self._call('search_data_sets',
-                AwsAccountId=self.account_id,
-                Filters=[{
-                    'Operator': 'StringContains',
-                    'Name': 'DATASET_NAME',
-                    'Value': name_contains,
-                }],
-                MaxResults=100,
-            )
-            return response.get('DataSetSummaries', [])
-        except Exception:
-            logger.debug("Server-side dataset search failed, falling back to client-side")
-
-        # Client-side fallback
         all_datasets = self.list_datasets()
         needle = name_contains.lower()
-        return [d for d in all_datasets if needle in d.get('Name', '').lower()]
+        if _dataset_cache['data'] is not all_datasets or _dataset_cache['index'] is None:
+            return [d for name, d in _name_index(all_datasets) if needle in name]
+
+        searches = _dataset_cache['searches']
+        matches = searches.get(needle)
+        if matches is None:
+            if len(searches) >= _MAX_CACHED_SEARCHES:
+                searches.clear()
+            matches = [d for name, d in _dataset_cache['index'] if needle in name]
+            searches[needle] = matches
+        return list(matches)
+
+    def get_dataset(self, dataset_id: str, use_cache: bool = True) -> Dict:
+        """Get full dataset definition.
+
+        Cached for 60 seconds.  The cached dict is shared between callers,
+        so pass ``use_cache=False`` to get a copy that is safe to edit.
+        Concurrent cache misses for the same dataset wait on a single
+        AWS call.
+        """
+        if not use_cache:
+            return self._fetch_dataset(dataset_id)
 
-    def get_dataset(self, dataset_id: str) -> Dict:
-        """Get full dataset definition."""
+        with _dataset_describe_lock:
+            cached = _dataset_describe_cache.get(dataset_id)
+            if cached is not None and time.time() - cached['timestamp'] < _DATASET_DESCRIBE_TTL:
+                _dataset_describe_cache.move_to_end(dataset_id)
+                return cached['data']
+            future = _dataset_describe_inflight.get(dataset_id)
+            leader = future is None
+            if leader:
+                future = _dataset_describe_inflight[dataset_id] = Future()
+                generation = _dataset_generation.get(dataset_id, 0)
+        if not leader:
+            return future.result()
+
+        try:
+            dataset = self._fetch_dataset(dataset_id)
+            with _dataset_describe_lock:
+                # Skip caching if the dataset changed while we were reading
+                if _dataset_generation.get(dataset_id, 0) == generation:
+                    _dataset_describe_cache[dataset_id] = {
+                        'data': dataset,
+                        'timestamp': time.time(),
+                    }
+                    _dataset_describe_cache.move_to_end(dataset_id)
+                    if len(_dataset_describe_cache) > _DATASET_DESCRIBE_MAX:
+                        _dataset_describe_cache.popitem(last=False)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(dataset)
+            return dataset
+        finally:
+            with _dataset_describe_lock:
+                if _dataset_describe_inflight.get(dataset_id) is future:
+                    del _dataset_describe_inflight[dataset_id]
+
+    def _fetch_dataset(self, dataset_id: str) -> Dict:
+        """Call describe_data_set and return the ``DataSet`` payload."""
         self._ensure_account_id()
         response = self._call(
             'describe_data_set',
@@ -421,13 +631,25 @@ class QuickSightClient:
         )
         return response.get('DataSet', {})
 
-    def get_dataset_sql(self, dataset_id: str) -> Optional[str]:
-        """Extract the SQL query from a dataset's PhysicalTableMap."""
-        dataset = self.get_dataset(dataset_id)
-        for _table_id, table_def in dataset.get('PhysicalTableMap', {}).items():
-            if 'CustomSql' in table_def:
-                return table_def['CustomSql'].get('SqlQuery')
-        return None
+    def get_dataset_sql(self, dataset_id: str, use_cache: bool = True) -> Optional[str]:
+        """Extract the SQL query from a dataset's PhysicalTableMap.
+
+        Cached for 5 minutes; SQL written through this client replaces the
+        cached entry, so a read after an update does not describe again.
+        """
+        with _dataset_describe_lock:
+            if use_cache:
+                cached = _dataset_sql_cache.get(dataset_id)
+                if cached is not None and time.time() - cached['timestamp'] < 300:
+                    return cached['data']
+            generation = _dataset_generation.get(dataset_id, 0)
+
+        sql = _custom_sql(self.get_dataset(dataset_id, use_cache=use_cache))
+        with _dataset_describe_lock:
+            # A write since we started has stored (or evicted) newer SQL
+            if _dataset_generation.get(dataset_id, 0) == generation:
+                _dataset_sql_cache[dataset_id] = {'data': sql, 'timestamp': time.time()}
+        return sql
 
     def update_dataset_sql(
         self,
@@ -447,18 +669,32 @@ class QuickSightClient:
             verify: Verify the SQL was persisted after update.
 
         Raises:
+            ValueError: If ``new_sql`` is longer than QuickSight accepts.
             ChangeVerificationError: If verification is enabled and the SQL was not updated.
         """
+        _check_sql_length(new_sql)
+        # One describe serves both the backup and the update payload
+        dataset = self.get_dataset(dataset_id, use_cache=False)
         if backup_first:
-            self.backup_dataset(dataset_id, backup_dir or self._backup_dir())
+            self._write_dataset_backup(dataset_id, dataset, backup_dir)
 
-        dataset = self.get_dataset(dataset_id)
+        return self._write_dataset_sql(dataset_id, dataset, new_sql, verify)
 
+    def _write_dataset_sql(
+        self,
+        dataset_id: str,
+        dataset: Dict,
+        new_sql: str,
+        verify: Optional[bool] = None,
+    ) -> Dict:
+        """Write ``new_sql`` into an already-described dataset and save it."""
         # Find and update the CustomSql entry
         physical_map = dataset.get('PhysicalTableMap', {})
+        has_custom_sql = False
         for _table_id, table_def in physical_map.items():
             if 'CustomSql' in table_def:
                 table_def['CustomSql']['SqlQuery'] = new_sql
+                has_custom_sql = True
                 break
 
         # Build update payload
@@ -472,23 +708,28 @@ class QuickSightClient:
         }
 
         # Preserve optional top-level keys
-        for key in ('ColumnGroups', 'FieldFolders', 'RowLevelPermissionDataSet',
-                     'DataSetUsageConfiguration', 'ColumnLevelPermissionRules',
-                     'RowLevelPermissionTagConfiguration'):
+        for key in _DATASET_OPTIONAL_KEYS:
             if key in dataset:
                 update_params[key] = dataset[key]
 
         response = self._call('update_data_set', **update_params)
+        # Evict after the write so a read racing it cannot re-cache the old state
+        _forget_dataset(dataset_id)
+        self.clear_dataset_cache()
 
         if self._should_verify(verify):
             self._verify_dataset_sql(dataset_id, new_sql)
 
+        if has_custom_sql:
+            with _dataset_describe_lock:
+                _dataset_sql_cache[dataset_id] = {'data': new_sql, 'timestamp': time.time()}
+
         logger.info("Dataset %s SQL updated (%d chars)", dataset_id, len(new_sql))
         return response
 
     def _verify_dataset_sql(self, dataset_id: str, expected_sql: str) -> bool:
         """Verify dataset SQL matches expected value (whitespace-normalized)."""
-        actual_sql = self.get_dataset_sql(dataset_id)
+        actual_sql = self.get_dataset_sql(dataset_id, use_cache=False)
         expected_norm = ' '.join(expected_sql.split())
         actual_norm = ' '.join((actual_sql or '').split())
 
@@ -503,20 +744,48 @@ class QuickSightClient:
     def refresh_dataset(self, dataset_id: str) -> Dict:
         """Trigger a SPICE refresh (create_ingestion).
 
+        If a refresh this process started for the dataset is still queued
+        or running, no new ingestion is created; its ID is returned with
+        ``already_running`` set instead.
+
         Returns:
-            dict with ``ingestion_id``, ``status``, ``arn``.
+            dict with ``ingestion_id``, ``status``, ``arn``, and
+            ``already_running``.
         """
-        ingestion_id = f"refresh-{datetime.now():%Y%m%d-%H%M%S}"
-        response = self._call(
-            'create_ingestion',
-            AwsAccountId=self.account_id,
-            DataSetId=dataset_id,
-            IngestionId=ingestion_id,
-        )
+        with _refresh_lock(dataset_id):
+            with _refresh_inflight_lock:
+                running_id = _refresh_inflight.get(dataset_id)
+            if running_id is not None:
+                try:
+                    state = self.get_refresh_status(dataset_id, running_id)['status']
+                except Exception:
+                    # Unknown state: start a new refresh rather than block one
+                    logger.debug("Could not check refresh %s", running_id, exc_info=True)
+                    state = None
+                if state is not None and state not in _REFRESH_TERMINAL:
+                    return {
+                        'ingestion_id': running_id,
+                        'status': state,
+                        'arn': None,
+                        'already_running': True,
+                    }
+
+            ingestion_id = f"refresh-{datetime.now():%Y%m%d-%H%M%S}"
+            response = self._call(
+                'create_ingestion',
+                AwsAccountId=self.account_id,
+                DataSetId=dataset_id,
+                IngestionId=ingestion_id,
+            )
+            with _refresh_inflight_lock:
+                _refresh_inflight[dataset_id] = ingestion_id
+        # SPICE usage and status fields in the description change with the refresh
+        _forget_dataset_describe(dataset_id)
         return {
             'ingestion_id': ingestion_id,
             'status': response.get('IngestionStatus'),
             'arn': response.get('Arn'),
+            'already_running': False,
         }
 
     def get_refresh_status(self, dataset_id: str, ingestion_id: str) -> Dict:
@@ -528,6 +797,8 @@ class QuickSightClient:
             IngestionId=ingestion_id,
         )
         ingestion = response.get('Ingestion', {})
+        if ingestion.get('IngestionStatus') in _REFRESH_TERMINAL:
+            _forget_refresh(dataset_id, ingestion_id)
         return {
             'status': ingestion.get('IngestionStatus'),
             'error': ingestion.get('ErrorInfo'),
@@ -535,6 +806,45 @@ class QuickSightClient:
             'created': ingestion.get('CreatedTime'),
         }
 
+    def wait_for_refresh(
+        self, dataset_id: str, ingestion_id: str, timeout_seconds: int = 600,
+    ) -> Dict:
+        """Poll a SPICE refresh until it reaches a terminal status.
+
+        Polls every second for the first few checks (short refreshes finish
+        quickly), then backs off toward a 30-second interval. A throttled
+        check doubles the next wait instead of failing.
+
+        Returns:
+            The last ``get_refresh_status`` result plus ``polls`` and
+            ``timed_out``.
+        """
+        start = time.monotonic()
+        attempt = 0
+        status: Dict = {'status': None}
+        while True:
+            throttled = False
+            try:
+                status = self.get_refresh_status(dataset_id, ingestion_id)
+            except Exception as e:
+                if aws_error_code(e) not in THROTTLE_CODES:
+                    raise
+                throttled = True
+                logger.debug("Refresh status check throttled for %s", ingestion_id)
+            attempt += 1
+
+            if status.get('status') in _REFRESH_TERMINAL:
+                return {**status, 'polls': attempt, 'timed_out': False}
+
+            remaining = timeout_seconds - (time.monotonic() - start)
+            if remaining <= 0:
+                return {**status, 'polls': attempt, 'timed_out': True}
+
+            delay = _refresh_poll_delay(attempt - 1)
+            if throttled:
+                delay *= 2
+            time.sleep(min(delay, remaining))
+
     def list_recent_refreshes(self, dataset_id: str, limit: int = 5) -> List[Dict]:
         """List recent SPICE refreshes for a dataset, newest first."""
         response = self._call(
@@ -550,8 +860,27 @@ class QuickSightClient:
         """Clear the dataset list cache."""
         global _dataset_cache
         _dataset_cache['data'] = None
+        _dataset_cache['index'] = None
+        _dataset_cache['searches'] = {}
         _dataset_cache['timestamp'] = 0
 
+    def clear_dataset_details_cache(self, dataset_id: Optional[str] = None):
+        """Clear cached dataset descriptions and SQL.
+
+        Args:
+            dataset_id: Evict only this dataset.  Every dataset is evicted
+                when omitted.
+        """
+        if dataset_id:
+            _forget_dataset(dataset_id)
+            return
+        with _dataset_describe_lock:
+            for key in {*_dataset_describe_cache, *_dataset_describe_inflight, *_dataset_sql_cache}:
+                _dataset_generation[key] = _dataset_generation.get(key, 0) + 1
+            _dataset_describe_cache.clear()
+            _dataset_describe_inflight.clear()
+            _dataset_sql_cache.clear()
+
     def create_dataset(
         self,
         name: str,
@@ -575,6 +904,7 @@ class QuickSightClient:
         Returns:
             The new dataset ID.
         """
+        _check_sql_length(sql)
         self._ensure_account_id()
 
         dataset_id = str(uuid.uuid4())
@@ -643,20 +973,24 @@ class QuickSightClient:
             backup_dir: Override backup directory.
 
         Returns:
-            AWS API response dict.
+            AWS API response dict, or ``{'status': 'noop'}`` when the
+            definition matches the current dataset (nothing is written
+            and no backup is taken).
         """
         self._ensure_account_id()
 
-        if backup_first:
-            self.backup_dataset(dataset_id, backup_dir or self._backup_dir())
-
         # Validate required keys
         if not definition.get('PhysicalTableMap'):
             raise ValueError("definition must include a non-empty PhysicalTableMap")
         if not definition.get('LogicalTableMap'):
             raise ValueError("definition must include a non-empty LogicalTableMap")
+
+        # The backup needs the current dataset anyway; reuse it for the
+        # missing Name and to detect a write that would change nothing.
+        current = None
+        if backup_first or 'Name' not in definition:
+            current = self.get_dataset(dataset_id, use_cache=False)
         if 'Name' not in definition:
-            current = self.get_dataset(dataset_id)
             definition['Name'] = current['Name']
 
         update_params: Dict[str, Any] = {
@@ -669,16 +1003,22 @@ class QuickSightClient:
         }
 
         # Preserve optional top-level keys if present in the definition
-        for key in ('ColumnGroups', 'FieldFolders', 'RowLevelPermissionDataSet',
-                     'DataSetUsageConfiguration', 'ColumnLevelPermissionRules',
-                     'RowLevelPermissionTagConfiguration'):
+        for key in _DATASET_OPTIONAL_KEYS:
             if key in definition:
                 update_params[key] = definition[key]
 
+        if current is not None and _same_dataset_payload(update_params, current):
+            logger.info("Dataset %s definition unchanged; skipping update", dataset_id)
+            return {'status': 'noop'}
+
+        if backup_first:
+            self._write_dataset_backup(dataset_id, current, backup_dir)
+
         response = self._call('update_data_set', **update_params)
 
-        # Invalidate dataset list cache
+        # Invalidate dataset list, describe and SQL caches
         self.clear_dataset_cache()
+        _forget_dataset(dataset_id)
 
         logger.info("Dataset %s definition updated", dataset_id)
         return response
@@ -700,6 +1040,7 @@ class QuickSightClient:
             DataSetId=dataset_id,
             IngestionId=ingestion_id,
         )
+        _forget_refresh(dataset_id, ingestion_id)
         logger.info("Cancelled ingestion %s for dataset %s", ingestion_id, dataset_id)
         return response
 
@@ -711,11 +1052,13 @@ class QuickSightClient:
         backup_first: bool = True,
         backup_dir: Optional[str] = None,
         verify: Optional[bool] = None,
+        count: Optional[int] = None,
     ) -> Dict:
         """Find and replace text in dataset SQL without full get/edit/update.
 
         Convenience method that reads the current SQL, applies a string
-        replacement, and updates the dataset in a single operation.
+        replacement, and updates the dataset in a single operation.  The
+        dataset is described once and reused for the backup and update.
 
         Args:
             dataset_id: Dataset ID.
@@ -724,33 +1067,48 @@ class QuickSightClient:
             backup_first: Back up before writing (default ``True``).
             backup_dir: Override backup directory.
             verify: Verify the SQL was persisted after update.
+            count: Replace only the first ``count`` occurrences (default:
+                every occurrence).
 
         Returns:
             Update response dict.
 
         Raises:
-            ValueError: If ``find`` text is not present in the current SQL.
+            ValueError: If ``count`` is less than 1, ``find`` text is not
+                present in the current SQL, or the edited SQL is longer
+                than QuickSight accepts.
         """
-        current_sql = self.get_dataset_sql(dataset_id)
+        if count is not None and count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+
+        # Describe once: the same dataset supplies the SQL to edit, the
+        # backup, and the payload for the update.
+        dataset = self.get_dataset(dataset_id, use_cache=False)
+        current_sql = _custom_sql(dataset)
         if current_sql is None:
             raise ValueError(
                 f"Dataset {dataset_id} does not use Custom SQL. "
                 f"Cannot perform find/replace."
             )
 
-        if find not in current_sql:
+        # Locate the first match once and replace from there, so the SQL
+        # before it is not scanned a second time.
+        idx = current_sql.find(find)
+        if idx < 0:
             raise ValueError(
                 f"Text to find not present in current SQL. "
                 f"Find text ({len(find)} chars): {find[:100]}..."
             )
 
-        new_sql = current_sql.replace(find, replace)
-        return self.update_dataset_sql(
-            dataset_id, new_sql,
-            backup_first=backup_first,
-            backup_dir=backup_dir,
-            verify=verify,
+        new_sql = current_sql[:idx] + current_sql[idx:].replace(
+            find, replace, -1 if count is None else count,
         )
+        _check_sql_length(new_sql)
+
+        if backup_first:
+            self._write_dataset_backup(dataset_id, dataset, backup_dir)
+
+        return self._write_dataset_sql(dataset_id, dataset, new_sql, verify)
 
     # =========================================================================
     # ANALYSES
@@ -791,15 +1149,49 @@ class QuickSightClient:
     def get_analysis_definition(self, analysis_id: str, use_cache: bool = True) -> Dict:
         """Get full analysis definition (sheets, visuals, calculated fields).
 
-        Cached for 5 minutes to speed up repeated lookups.
+        Cached for 5 minutes to speed up repeated lookups. Concurrent
+        cache misses for the same analysis wait on a single AWS call;
+        ``use_cache=False`` always issues its own.
         """
         global _analysis_def_cache
 
-        if use_cache and analysis_id in _analysis_def_cache:
-            cached = _analysis_def_cache[analysis_id]
-            if time.time() - cached['timestamp'] < 300:
-                return cached['data']
+        if not use_cache:
+            return self._fetch_analysis_definition(analysis_id)
+
+        cached = _analysis_def_cache.get(analysis_id)
+        if cached is not None and time.time() - cached['timestamp'] < 300:
+            return cached['data']
 
+        with _analysis_def_inflight_lock:
+            future = _analysis_def_inflight.get(analysis_id)
+            leader = future is None
+            if leader:
+                future = _analysis_def_inflight[analysis_id] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            definition = self._fetch_analysis_definition(analysis_id)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(definition)
+            return definition
+        finally:
+            with _analysis_def_inflight_lock:
+                # A clear may already have replaced our entry
+                if _analysis_def_inflight.get(analysis_id) is future:
+                    del _analysis_def_inflight[analysis_id]
+
+    def _fetch_analysis_definition(self, analysis_id: str) -> Dict:
+        """Call describe_analysis_definition and refresh the cache entry.
+
+        The entry is left alone if the analysis was evicted while the
+        call was in flight.
+        """
+        with _analysis_def_inflight_lock:
+            generation = _analysis_def_generation.get(analysis_id, 0)
         response = self._call(
             'describe_analysis_definition',
             AwsAccountId=self.account_id,
@@ -807,10 +1199,12 @@ class QuickSightClient:
         )
         definition = response.get('Definition', {})
 
-        _analysis_def_cache[analysis_id] = {
-            'data': definition,
-            'timestamp': time.time(),
-        }
+        with _analysis_def_inflight_lock:
+            if _analysis_def_generation.get(analysis_id, 0) == generation:
+                _analysis_def_cache[analysis_id] = {
+                    'data': definition,
+                    'timestamp': time.time(),
+                }
         return definition
 
     def get_analysis_definition_with_version(self, analysis_id: str) -> Tuple[Dict, Any]:
@@ -824,12 +1218,25 @@ class QuickSightClient:
         return definition, analysis.get('LastUpdatedTime')
 
     def clear_analysis_def_cache(self, analysis_id: Optional[str] = None):
-        """Clear cached analysis definition(s)."""
-        global _analysis_def_cache
-        if analysis_id:
-            _analysis_def_cache.pop(analysis_id, None)
-        else:
+        """Clear cached analysis definition(s).
+
+        Describes already in flight for a cleared analysis neither store
+        their result nor hand it to callers that arrive afterwards.
+        """
+        with _analysis_def_inflight_lock:
+            if analysis_id:
+                _analysis_def_generation[analysis_id] = (
+                    _analysis_def_generation.get(analysis_id, 0) + 1
+                )
+                _analysis_def_cache.pop(analysis_id, None)
+                _analysis_def_inflight.pop(analysis_id, None)
+                _calc_field_index.pop(analysis_id, None)
+                return
+            for key in {*_analysis_def_cache, *_analysis_def_inflight}:
+                _analysis_def_generation[key] = _analysis_def_generation.get(key, 0) + 1
             _analysis_def_cache.clear()
+            _analysis_def_inflight.clear()
+            _calc_field_index.clear()
 
     def get_calculated_fields(self, analysis_id: str) -> List[Dict]:
         """Get all calculated fields in an analysis."""
@@ -982,8 +1389,8 @@ class QuickSightClient:
             return response
 
         # Poll for completion
-        start = time.time()
-        while time.time() - start < timeout_seconds:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout_seconds:
             time.sleep(2)
             refreshed = self.get_analysis(analysis_id)
             status = refreshed.get('Status', '')
@@ -1080,8 +1487,12 @@ class QuickSightClient:
     ) -> Dict:
         """Add a calculated field to an analysis.
 
+        If an identical field (same name, expression and dataset) already
+        exists, nothing is written and ``{'status': 'exists', ...}`` is
+        returned -- no backup, update, or verification round trip.
+
         Raises:
-            ValueError: If a field with the same name already exists.
+            ValueError: If a different field with the same name already exists.
             ChangeVerificationError: If verification is enabled and the field was not created.
         """
         definition, last_updated = self.get_analysis_definition_with_version(analysis_id)
@@ -1093,7 +1504,11 @@ class QuickSightClient:
         }
 
         calc_fields = definition.setdefault('CalculatedFields', [])
-        if any(f.get('Name') == name for f in calc_fields):
+        existing = next((f for f in calc_fields if f.get('Name') == name), None)
+        if existing is not None:
+            if (existing.get('Expression') == expression
+                    and existing.get('DataSetIdentifier') == data_set_identifier):
+                return {'status': 'exists', 'analysis_id': analysis_id, 'errors': None}
             raise ValueError(
                 f"Calculated field '{name}' already exists. "
                 f"Use update_calculated_field instead."
@@ -1123,6 +1538,10 @@ class QuickSightClient:
     ) -> Dict:
         """Update an existing calculated field's expression.
 
+        If the field already has ``new_expression``, nothing is written
+        and ``{'status': 'noop', ...}`` is returned -- no backup, update,
+        or verification round trip.
+
         Raises:
             ValueError: If the field is not found.
             ChangeVerificationError: If verification is enabled and the expression was not updated.
@@ -1132,6 +1551,8 @@ class QuickSightClient:
         found = False
         for field in definition.get('CalculatedFields', []):
             if field.get('Name') == name:
+                if field.get('Expression') == new_expression:
+                    return {'status': 'noop', 'analysis_id': analysis_id, 'errors': None}
                 field['Expression'] = new_expression
                 found = True
                 break
@@ -1188,12 +1609,139 @@ class QuickSightClient:
 
         return result
 
+    def batch_update_calculated_fields(
+        self,
+        analysis_id: str,
+        operations: List[Dict],
+        backup_first: bool = True,
+        use_optimistic_locking: Optional[bool] = None,
+        verify: Optional[bool] = None,
+    ) -> Dict:
+        """Apply several calculated-field changes with a single analysis write.
+
+        Each operation is a dict with ``action`` (``'add'``, ``'update'`` or
+        ``'delete'``) and ``name``; ``add`` also takes ``expression`` and
+        ``dataset_identifier``, ``update`` takes ``expression``. Operations
+        apply in order and are all checked before anything is written, so
+        a bad operation leaves the analysis untouched. One backup, one
+        update and one verification read cover the whole batch.
+
+        Returns:
+            dict with ``analysis_id``, ``results`` (``name``, ``action``,
+            ``status`` per operation) and ``update`` -- the update_analysis
+            result, or ``None`` when every operation was a no-op.
+
+        Raises:
+            ValueError: If an operation is unknown, targets a missing
+                field, or adds a name that exists with different content.
+            ChangeVerificationError: If verification is enabled and the
+                fields do not match after the write.
+        """
+        definition, last_updated = self.get_analysis_definition_with_version(analysis_id)
+
+        # Work on copies so a rejected batch never touches the cached definition
+        fields = [dict(f) for f in definition.get('CalculatedFields', [])]
+        by_name = {f.get('Name'): f for f in fields}
+        expected: Dict[str, Optional[str]] = {}
+        results: List[Dict] = []
+
+        for op in operations:
+            action, name = op.get('action'), op.get('name')
+            expression = op.get('expression')
+            current = by_name.get(name)
+
+            if action == 'add':
+                if current is not None:
+                    if (current.get('Expression') != expression
+                            or current.get('DataSetIdentifier') != op.get('dataset_identifier')):
+                        raise ValueError(
+                            f"Calculated field '{name}' already exists. "
+                            f"Use an 'update' operation instead."
+                        )
+                    status = 'exists'
+                else:
+                    new_field = {
+                        'DataSetIdentifier': op.get('dataset_identifier'),
+                        'Name': name,
+                        'Expression': expression,
+                    }
+                    fields.append(new_field)
+                    by_name[name] = new_field
+                    status = 'added'
+                expected[name] = expression
+            elif action == 'update':
+                if current is None:
+                    raise ValueError(f"Calculated field '{name}' not found")
+                if current.get('Expression') == expression:
+                    status = 'noop'
+                else:
+                    current['Expression'] = expression
+                    status = 'updated'
+                expected[name] = expression
+            elif action == 'delete':
+                if current is None:
+                    raise ValueError(f"Calculated field '{name}' not found")
+                fields.remove(current)
+                del by_name[name]
+                expected[name] = None
+                status = 'deleted'
+            else:
+                raise ValueError(f"Unknown calculated field action: {action!r}")
+
+            results.append({'name': name, 'action': action, 'status': status})
+
+        if not any(r['status'] in ('added', 'updated', 'deleted') for r in results):
+            return {'analysis_id': analysis_id, 'results': results, 'update': None}
+
+        definition = dict(definition, CalculatedFields=fields)
+        update = self.update_analysis(
+            analysis_id, definition, backup_first=backup_first,
+            expected_last_updated=(
+                last_updated if self._should_lock(use_optimistic_locking) else None
+            ),
+        )
+
+        if self._should_verify(verify):
+            self._verify_calculated_field_batch(analysis_id, expected)
+
+        return {'analysis_id': analysis_id, 'results': results, 'update': update}
+
+    def _verify_calculated_field_batch(
+        self, analysis_id: str, expected: Dict[str, Optional[str]],
+    ) -> bool:
+        """Check each field's expression (``None`` = deleted) after a batch."""
+        self.clear_analysis_def_cache(analysis_id)
+        current = {
+            f.get('Name'): f.get('Expression')
+            for f in self.get_calculated_fields(analysis_id)
+        }
+        wrong = [
+            name for name, expression in expected.items()
+            if current.get(name) != expression
+            or (expression is None and name in current)
+        ]
+        if wrong:
+            raise ChangeVerificationError(
+                'batch_update_calculated_fields', analysis_id,
+                f"Fields not in the expected state: {', '.join(wrong)}.",
+            )
+        return True
+
     def get_calculated_field(self, analysis_id: str, name: str) -> Optional[Dict]:
-        """Get a specific calculated field by name, or ``None``."""
-        for f in self.get_calculated_fields(analysis_id):
-            if f.get('Name') == name:
-                return f
-        return None
+        """Get a specific calculated field by name, or ``None``.
+
+        Uses a name index built once per cached definition, so repeated
+        lookups on the same analysis don't rescan every field.
+        """
+        fields = self.get_calculated_fields(analysis_id)
+        cached = _calc_field_index.get(analysis_id)
+        if cached is None or cached[0] is not fields or cached[1] != len(fields):
+            index: Dict[str, Dict] = {}
+            for f in fields:
+                index.setdefault(f.get('Name'), f)
+            cached = (fields, len(fields), index)
+            _calc_field_index[analysis_id] = cached
+        return cached[2].get(name)
 
     def _verify_calculated_field_exists(
         self, analysis_id: str, name: str, expected_expression: Optional[str] = None,
@@ -1498,11 +2046,19 @@ class QuickSightClient:
         logger.debug("Dashboard cache refreshed (%d dashboards)", len(dashboards))
         return dashboards
 
-    def search_dashboards(self, name_contains: str) -> List[Dict]:
-        """Search dashboards by name (client-side filter on cached list)."""
+    def search_dashboards(
+        self, name_contains: str, limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """Search dashboards by name (client-side filter on cached list).
+
+        Args:
+            name_contains: Case-insensitive substring to match.
+            limit: Stop scanning once this many matches are found.
+        """
         all_dashboards = self.list_dashboards()
         needle = name_contains.lower()
-        return [d for d in all_dashboards if needle in d.get('Name', '').lower()]
+        matches = (d for d in all_dashboards if needle in d.get('Name', '').lower())
+        return list(islice(matches, limit))
 
     def get_dashboard(self, dashboard_id: str) -> Dict:
         """Get dashboard details (describe_dashboard)."""
@@ -1513,8 +2069,20 @@ class QuickSightClient:
         )
         return response.get('Dashboard', {})
 
-    def get_dashboard_versions(self, dashboard_id: str, limit: int = 10) -> List[Dict]:
-        """Get dashboard version history, newest first."""
+    def get_dashboard_versions(
+        self, dashboard_id: str, limit: int = 10, use_cache: bool = True,
+    ) -> List[Dict]:
+        """Get dashboard version history, newest first.
+
+        Cached for 5 minutes; publish and rollback evict the entry.
+        """
+        global _dashboard_versions_cache
+
+        if use_cache and dashboard_id in _dashboard_versions_cache:
+            cached = _dashboard_versions_cache[dashboard_id]
+            if time.time() - cached['timestamp'] < 300:
+                return cached['data'][:limit]
+
         response = self._call(
             'list_dashboard_versions',
             AwsAccountId=self.account_id,
@@ -1522,6 +2090,11 @@ class QuickSightClient:
         )
         versions = response.get('DashboardVersionSummaryList', [])
         versions.sort(key=lambda x: x.get('VersionNumber', 0), reverse=True)
+
+        _dashboard_versions_cache[dashboard_id] = {
+            'data': versions,
+            'timestamp': time.time(),
+        }
         return versions[:limit]
 
     def get_current_dashboard_version(self, dashboard_id: str) -> Dict:
@@ -1582,6 +2155,7 @@ class QuickSightClient:
         # Extract the new version number and publish it
         # update_dashboard creates a DRAFT — must call update_dashboard_published_version
         # to make it live for viewers
+        retried = response.get('ResponseMetadata', {}).get('RetryAttempts', 0)
         version_arn = response.get('VersionArn', '')
         new_version = None
         if version_arn:
@@ -1591,21 +2165,24 @@ class QuickSightClient:
                 new_version = int(parts[-1])
 
         if new_version:
-            self._call(
+            published = self._call(
                 'update_dashboard_published_version',
                 AwsAccountId=self.account_id,
                 DashboardId=dashboard_id,
                 VersionNumber=new_version,
             )
+            retried += published.get('ResponseMetadata', {}).get('RetryAttempts', 0)
             logger.info(
                 "Dashboard %s published version %d", dashboard_id, new_version,
             )
 
+        self.clear_dashboard_cache(dashboard_id)
         return {
             'dashboard_id': dashboard_id,
             'version_arn': version_arn,
             'version_number': new_version,
             'status': response.get('CreationStatus'),
+            'retried': retried,
         }
 
     def _get_dataset_references(self, analysis_id: str) -> List[Dict]:
@@ -1637,16 +2214,27 @@ class QuickSightClient:
             DashboardId=dashboard_id,
             VersionNumber=version_number,
         )
+        self.clear_dashboard_cache(dashboard_id)
         return {
             'dashboard_id': response.get('DashboardId'),
             'status': f'Published version updated to {version_number}',
+            'retried': response.get('ResponseMetadata', {}).get('RetryAttempts', 0),
         }
 
-    def clear_dashboard_cache(self):
-        """Clear the dashboard list cache."""
-        global _dashboard_cache
+    def clear_dashboard_cache(self, dashboard_id: Optional[str] = None):
+        """Clear the dashboard list cache and cached version history.
+
+        Args:
+            dashboard_id: Evict only this dashboard's version history.
+                All version histories are cleared when omitted.
+        """
+        global _dashboard_cache, _dashboard_versions_cache
         _dashboard_cache['data'] = None
         _dashboard_cache['timestamp'] = 0
+        if dashboard_id:
+            _dashboard_versions_cache.pop(dashboard_id, None)
+        else:
+            _dashboard_versions_cache.clear()
 
     # =========================================================================
     # BACKUP & RESTORE
@@ -1660,10 +2248,17 @@ class QuickSightClient:
         Returns:
             Path to the backup file.
         """
+        return self._write_dataset_backup(
+            dataset_id, self.get_dataset(dataset_id, use_cache=False), backup_dir,
+        )
+
+    def _write_dataset_backup(
+        self, dataset_id: str, dataset: Dict, backup_dir: Optional[str] = None,
+    ) -> str:
+        """Write an already-described dataset to a timestamped backup file."""
         bdir = backup_dir or self._backup_dir()
         Path(bdir).mkdir(parents=True, exist_ok=True, mode=0o700)
 
-        dataset = self.get_dataset(dataset_id)
         name = dataset.get('Name', dataset_id).replace(' ', '_').replace('/', '_')
         ts = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{bdir}/dataset_{name}_{ts}.json"
@@ -1860,8 +2455,8 @@ class QuickSightClient:
         )
 
         # Poll for completion
-        start = time.time()
-        while time.time() - start < 60:
+        start = time.monotonic()
+        while time.monotonic() - start < 60:
             time.sleep(2)
             refreshed = self.get_analysis(analysis_id)
             status = refreshed.get('Status', '')
@@ -2618,8 +3213,6 @@ class QuickSightClient:
             dict with ``analysis_id``, ``sheet_id``, ``visual_count``,
             ``visual_types``.
         """
-        import copy as _copy
-
         definition, last_updated = self.get_analysis_definition_with_version(analysis_id)
 
         # Check sheet limit (QuickSight max is 20 sheets per analysis)
@@ -2666,14 +3259,14 @@ class QuickSightClient:
                 continue
 
             new_id = f'{id_prefix}{old_id}'
-            new_visual = _copy.deepcopy(v)
+            new_visual = copy.deepcopy(v)
             new_visual[visual_type]['VisualId'] = new_id
             new_visuals.append(new_visual)
             type_counts[visual_type] = type_counts.get(visual_type, 0) + 1
 
             # Copy layout
             if old_id in layout_map:
-                le = _copy.deepcopy(layout_map[old_id])
+                le = copy.deepcopy(layout_map[old_id])
                 le['ElementId'] = new_id
                 new_layout_elements.append(le)
             else:
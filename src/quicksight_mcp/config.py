@@ -88,7 +88,7 @@ class Settings:
     optimistic_locking_by_default: bool = True
 
     # API retry
-    max_api_retries: int = 3
+    max_api_retries: int = 6
     retry_mode: str = "adaptive"
 
     # Polling
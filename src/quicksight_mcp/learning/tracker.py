@@ -1,5 +1,6 @@
 """Usage tracker that logs tool calls and detects patterns for self-learning."""
 
+import copy
 import json
 import time
 import logging
@@ -25,6 +26,12 @@ class UsageTracker:
         self._error_log: List[Dict] = []
         self._sequence_buffer: List[str] = []
 
+        # (version, get_insights() result), valid until the next recorded
+        # call.  Replaced as one tuple so readers never pair a result with
+        # the wrong version.
+        self._version = 0
+        self._cached_insights = (-1, None)
+
         # Load persisted patterns
         self._patterns = self._load_json('patterns.json', default={
             'tool_counts': {},
@@ -48,6 +55,7 @@ class UsageTracker:
             'timestamp': time.time(),
         }
         self._call_log.append(entry)
+        self._version += 1
 
         # Track sequences (last 5 tools called)
         self._sequence_buffer.append(tool_name)
@@ -117,7 +125,18 @@ class UsageTracker:
         return 'unknown'
 
     def get_insights(self) -> dict:
-        """Get usage insights and suggestions."""
+        """Get usage insights and suggestions.
+
+        The result is reused until another call is recorded, so polling
+        it (and the optimizer, which reads it too) does not re-sort the
+        counters each time.  Each caller gets its own copy.
+        """
+        # Read the version first: a call recorded while we compute leaves
+        # the result tagged stale, so the next caller recomputes.
+        version = self._version
+        cached_version, cached = self._cached_insights
+        if cached_version == version:
+            return copy.deepcopy(cached)
         total_calls = sum(self._patterns.get('tool_counts', {}).values())
 
         # Top tools
@@ -131,13 +150,15 @@ class UsageTracker:
         # Suggestions based on patterns
         suggestions = self._generate_suggestions()
 
-        return {
+        insights = {
             'total_calls': total_calls,
             'most_used_tools': [{'tool': t, 'count': c} for t, c in top_tools],
             'common_workflows': [{'sequence': s, 'count': c} for s, c in top_sequences],
             'error_count': sum(e.get('count', 0) for e in self._error_patterns.values()),
             'suggestions': suggestions,
         }
+        self._cached_insights = (version, insights)
+        return copy.deepcopy(insights)
 
     def get_error_patterns(self) -> dict:
         """Get common errors and their frequencies."""
@@ -118,6 +118,23 @@ class QSRateLimitError(QSError):
         )
 
 
+# AWS error codes that mean "slow down" rather than "this request is wrong".
+THROTTLE_CODES = frozenset({
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+})
+
+
+def aws_error_code(e: BaseException) -> Optional[str]:
+    """Return the AWS error code carried by a botocore ``ClientError``, if any."""
+    response = getattr(e, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code") or None
+    return None
+
+
 class ConcurrentModificationError(QSError):
     """Analysis was modified by another session since it was read.
 
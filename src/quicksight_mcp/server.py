@@ -7,6 +7,7 @@ v1.1: Wired to use service layer + memory system instead of monolithic client.
 """
 
 import logging
+import threading
 
 from fastmcp import FastMCP
 
@@ -55,6 +56,7 @@ _memory: MemoryManager | None = None
 
 # Backward-compat: old client + tracker for tool files not yet migrated
 _client = None
+_client_lock = threading.Lock()
 _tracker = None
 
 
@@ -83,8 +85,11 @@ def get_client():
     """Backward-compat: get a QuickSightClient for tool files not yet migrated."""
     global _client
     if _client is None:
-        from quicksight_mcp.client import QuickSightClient
-        _client = QuickSightClient()
+        # Double-checked so concurrent first calls share one boto3 session
+        with _client_lock:
+            if _client is None:
+                from quicksight_mcp.client import QuickSightClient
+                _client = QuickSightClient()
     return _client
 
 
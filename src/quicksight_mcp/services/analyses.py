@@ -317,8 +317,8 @@ class AnalysisService:
 
         # Step 7: Poll for completion
         poll_interval = self._settings.update_poll_interval_seconds
-        start = time.time()
-        while time.time() - start < timeout:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
             time.sleep(poll_interval)
             refreshed = self.get(analysis_id)
             status = refreshed.get("Status", "")
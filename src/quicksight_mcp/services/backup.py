@@ -329,8 +329,8 @@ class BackupService:
         # Poll for completion
         poll_interval = self._settings.update_poll_interval_seconds
         timeout = self._settings.update_timeout_seconds
-        start = time.time()
-        while time.time() - start < timeout:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
             time.sleep(poll_interval)
             refreshed = self._analysis.get(analysis_id)
             status = refreshed.get("Status", "")
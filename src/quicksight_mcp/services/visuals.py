@@ -6,7 +6,7 @@ Handles getting, adding, deleting, and configuring visuals within sheets.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from quicksight_mcp.core.cache import TTLCache
 from quicksight_mcp.core.types import VISUAL_TYPES, extract_visual_id, parse_visual
@@ -40,6 +40,8 @@ class VisualService:
         self._aws = aws
         self._cache = cache
         self._analyses = analyses
+        # analysis_id -> (definition object, visual_id -> visual dict)
+        self._visual_indexes: Dict[str, Tuple[Dict, Dict[str, Dict]]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -56,13 +58,7 @@ class VisualService:
             The visual dict as stored in the analysis definition,
             or ``None`` if not found.
         """
-        definition = self._analyses.get_definition(analysis_id)
-        for sheet in definition.get("Sheets", []):
-            for v in sheet.get("Visuals", []):
-                for vtype in VISUAL_TYPES:
-                    if vtype in v and v[vtype].get("VisualId") == visual_id:
-                        return v
-        return None
+        return self._visual_index(analysis_id).get(visual_id)
 
     def add(
         self,
@@ -118,23 +114,28 @@ class VisualService:
                 layouts.append(
                     {"Configuration": {"GridLayout": {"Elements": []}}}
                 )
-            elements: List[Dict] = (
-                layouts[0]
-                .setdefault("Configuration", {})
-                .setdefault("GridLayout", {})
-                .setdefault("Elements", [])
-            )
+            try:
+                elements: List[Dict] = (
+                    layouts[0]["Configuration"]["GridLayout"]["Elements"]
+                )
+            except KeyError:
+                elements = (
+                    layouts[0]
+                    .setdefault("Configuration", {})
+                    .setdefault("GridLayout", {})
+                    .setdefault("Elements", [])
+                )
             if layout:
                 elements.append(layout)
             elif visual_id:
                 # Default: full-width, 12 rows high, appended below existing
-                max_row = max(
-                    (
+                if elements:
+                    max_row = max(
                         e.get("RowIndex", 0) + e.get("RowSpan", 0)
                         for e in elements
-                    ),
-                    default=0,
-                )
+                    )
+                else:
+                    max_row = 0
                 elements.append(
                     {
                         "ElementId": visual_id,
@@ -364,6 +365,37 @@ class VisualService:
             ),
         )
 
+    # ------------------------------------------------------------------
+    # Visual index
+    # ------------------------------------------------------------------
+
+    def _visual_index(self, analysis_id: str) -> Dict[str, Dict]:
+        """Return a ``visual_id -> visual`` map for the current definition.
+
+        The index is tied to the definition object handed out by
+        ``AnalysisService.get_definition`` and rebuilt only when that
+        object changes (i.e. after the definition cache was cleared), so
+        repeated lookups and post-write verification skip the sheet walk.
+        """
+        definition = self._analyses.get_definition(analysis_id)
+        entry = self._visual_indexes.get(analysis_id)
+        if entry is not None and entry[0] is definition:
+            return entry[1]
+        index = self._build_index(definition)
+        self._visual_indexes[analysis_id] = (definition, index)
+        return index
+
+    @staticmethod
+    def _build_index(definition: Dict) -> Dict[str, Dict]:
+        """Map every visual ID in *definition* to its visual dict."""
+        index: Dict[str, Dict] = {}
+        for sheet in definition.get("Sheets", []):
+            for v in sheet.get("Visuals", []):
+                for vtype in VISUAL_TYPES:
+                    if vtype in v:
+                        index.setdefault(v[vtype].get("VisualId"), v)
+        return index
+
     # ------------------------------------------------------------------
     # Verification helpers
     # ------------------------------------------------------------------
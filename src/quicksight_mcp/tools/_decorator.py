@@ -1,11 +1,13 @@
 """@qs_tool decorator — eliminates ~930 lines of repeated boilerplate.
 
 Wraps every MCP tool function with:
+- Optional input validation against a pydantic model
 - Timing (records duration in milliseconds)
 - Correlation ID generation (via contextvars, unique per call)
 - Structured JSON logging (start + complete events)
-- Memory recording (tool call + params)
+- Memory recording (tool call + params), on a background thread
 - Structured error formatting with recovery suggestions
+- Per-resource backoff after AWS throttling errors
 - Tool annotation registration (read-only, destructive, idempotent hints)
 """
 
@@ -13,10 +15,21 @@ from __future__ import annotations
 
 import functools
 import logging
+import threading
 import time
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
-from quicksight_mcp.safety.exceptions import QSError
+from pydantic import BaseModel, ValidationError
+
+from quicksight_mcp.safety.exceptions import (
+    THROTTLE_CODES,
+    QSError,
+    QSValidationError,
+    aws_error_code,
+)
+from quicksight_mcp.tools._models import validate
+from quicksight_mcp.tools._recorder import memory_lock, submit
+from quicksight_mcp.tools._response import truncate_if_needed
 from quicksight_mcp.logging_config import (
     new_correlation_id,
     set_tool_name,
@@ -26,8 +39,15 @@ from quicksight_mcp.logging_config import (
 
 logger = logging.getLogger(__name__)
 
-# Character limit for tool responses
-CHARACTER_LIMIT = 25_000
+_BACKOFF_BASE_S = 2.0
+_BACKOFF_MAX_S = 60.0
+
+# (tool_name, resource_id) -> (monotonic time calls may resume, throttle streak).
+# Boto3 has already retried by the time a throttle reaches the tool layer,
+# so repeat calls inside the window are answered without calling AWS.
+# Calls with no resource ID (lists, searches) are never tracked.
+_backoff: Dict[Tuple[str, str], Tuple[float, int]] = {}
+_backoff_lock = threading.Lock()
 
 
 def qs_tool(
@@ -38,6 +58,7 @@ def qs_tool(
     destructive: bool = False,
     idempotent: bool = False,
     open_world: bool = False,
+    input_model: Optional[Type[BaseModel]] = None,
 ):
     """Decorator that registers a function as an MCP tool with standard wrappers.
 
@@ -48,6 +69,8 @@ def qs_tool(
         destructive: Tool may delete or overwrite data.
         idempotent: Calling the tool twice with the same args has the same effect.
         open_world: Tool may interact with external systems.
+        input_model: Optional ``StrictModel`` subclass; keyword arguments
+            are validated against it before the tool body runs.
 
     Usage::
 
@@ -58,10 +81,11 @@ def qs_tool(
     """
 
     def decorator(fn: Callable) -> Callable:
+        tool_name = fn.__name__
+
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> dict:
-            tool_name = fn.__name__
-            start = time.time()
+            start = time.perf_counter_ns()
 
             # Set up correlation context for this call
             new_correlation_id()
@@ -78,103 +102,67 @@ def qs_tool(
             # Log start
             log_tool_start(tool_name, kwargs)
 
+            ok = False
+            err_msg: Optional[str] = None
+            err_type: Optional[str] = None
+            # Only per-resource calls back off; a throttled list or search
+            # must not lock out every other call to the same tool.
+            backoff_key = (tool_name, resource_id) if resource_id else None
             try:
-                result = fn(*args, **kwargs)
-                duration_ms = (time.time() - start) * 1000
-
-                # Record success in memory
-                if get_memory:
+                if input_model is not None:
                     try:
-                        memory = get_memory()
-                        if memory:
-                            memory.record_call(
-                                tool_name, kwargs, duration_ms, True
-                            )
-                    except Exception:
-                        logger.debug("Memory recording failed", exc_info=True)
-
-                # Log completion
-                log_tool_complete(
-                    tool_name, duration_ms, success=True,
-                    resource_id=resource_id,
-                )
+                        validate(input_model, kwargs)
+                    except ValidationError as ve:
+                        raise QSValidationError(
+                            _validation_message(ve), resource_id=resource_id,
+                        ) from ve
+                wait = _backoff_remaining(backoff_key)
+                if wait > 0:
+                    err_msg, err_type = "Backing off after AWS throttling", "rate_limited"
+                    return _throttled_response(err_msg, wait)
+                result = fn(*args, **kwargs)
+                ok = True
+                if _backoff and backoff_key is not None:
+                    with _backoff_lock:
+                        _backoff.pop(backoff_key, None)
 
                 # Truncate if too long
-                result = _truncate_response(result, tool_name)
-                return result
+                return _truncate_response(result, tool_name)
 
             except QSError as e:
-                duration_ms = (time.time() - start) * 1000
-
-                # Record error in memory
-                if get_memory:
-                    try:
-                        memory = get_memory()
-                        if memory:
-                            memory.record_call(
-                                tool_name, kwargs, duration_ms, False, str(e)
-                            )
-                    except Exception:
-                        logger.debug("Memory recording failed", exc_info=True)
-
-                # Log failure
-                log_tool_complete(
-                    tool_name, duration_ms, success=False,
-                    resource_id=resource_id,
-                    error=str(e), error_type=e.error_type,
-                )
-
-                # Build structured error response
-                error_response = {
-                    "isError": True,
-                    "error_type": e.error_type,
-                    "error": str(e),
-                    "suggestions": e.suggestions,
-                    "metadata": e.metadata,
-                }
-
-                # Add recovery suggestions from memory
-                if get_memory:
-                    try:
-                        memory = get_memory()
-                        if memory:
-                            past = memory.get_recovery_suggestions(
-                                e.resource_id, e.error_type
-                            )
-                            if past:
-                                error_response["past_recovery"] = past
-                    except Exception:
-                        logger.debug("Memory recording failed", exc_info=True)
-
-                return error_response
+                err_msg, err_type = str(e), e.error_type
+                return _qserror_response(e, get_memory)
 
             except Exception as e:
-                duration_ms = (time.time() - start) * 1000
-
-                # Record error in memory
-                if get_memory:
-                    try:
-                        memory = get_memory()
-                        if memory:
-                            memory.record_call(
-                                tool_name, kwargs, duration_ms, False, str(e)
-                            )
-                    except Exception:
-                        logger.debug("Memory recording failed", exc_info=True)
-
-                # Log failure
-                log_tool_complete(
-                    tool_name, duration_ms, success=False,
-                    resource_id=resource_id,
-                    error=str(e), error_type="unexpected",
-                )
-
+                err_msg = str(e)
+                code = aws_error_code(e)
+                if code in THROTTLE_CODES:
+                    err_type = "rate_limited"
+                    return _throttled_response(
+                        err_msg, _start_backoff(backoff_key), code,
+                    )
+                if code:
+                    err_type = "api_error"
+                    return {
+                        "isError": True,
+                        "error_type": "api_error",
+                        "error_code": code,
+                        "error": err_msg,
+                    }
+                err_type = "unexpected"
                 return {
                     "isError": True,
                     "error_type": "unexpected",
-                    "error": str(e),
+                    "error": err_msg,
                 }
 
+            finally:
+                _record(
+                    get_memory, tool_name, kwargs, resource_id,
+                    (time.perf_counter_ns() - start) / 1_000_000,
+                    ok, err_msg, err_type,
+                )
+
         # Register with MCP using tool annotations
         annotations = {}
         if read_only:
@@ -198,57 +186,124 @@ def qs_tool(
     return decorator
 
 
-def _truncate_response(result: Any, tool_name: str) -> Any:
-    """Truncate overly large responses with guidance."""
-    if not isinstance(result, dict):
-        return result
+def _record(
+    get_memory: Optional[Callable],
+    tool_name: str,
+    kwargs: dict,
+    resource_id: str,
+    duration_ms: float,
+    ok: bool,
+    err_msg: Optional[str],
+    err_type: Optional[str],
+) -> None:
+    """Queue the memory record for a finished call and emit the completion log."""
+    if get_memory:
+        try:
+            memory = get_memory()
+            if memory:
+                if ok:
+                    submit(memory.record_call, tool_name, kwargs, duration_ms, True)
+                else:
+                    submit(
+                        memory.record_call,
+                        tool_name, kwargs, duration_ms, False, err_msg,
+                    )
+        except Exception:
+            logger.debug("Memory recording failed", exc_info=True)
+
+    if ok:
+        log_tool_complete(
+            tool_name, duration_ms, success=True, resource_id=resource_id,
+        )
+    else:
+        log_tool_complete(
+            tool_name, duration_ms, success=False,
+            resource_id=resource_id,
+            error=err_msg, error_type=err_type,
+        )
+
+
+def _validation_message(ve: ValidationError) -> str:
+    """One-line summary of *ve*, without pydantic's docs URLs."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'input'}: {err['msg']}"
+        for err in ve.errors(include_url=False)
+    )
 
-    import json
 
-    try:
-        serialized = json.dumps(result, default=str)
-    except (TypeError, ValueError):
-        return result
+def _backoff_remaining(key: Optional[Tuple[str, str]]) -> float:
+    """Seconds until *key* may call AWS again (0 when not backing off)."""
+    if key is None:
+        return 0.0
+    entry = _backoff.get(key)
+    if entry is None:
+        return 0.0
+    return max(0.0, entry[0] - time.monotonic())
 
-    if len(serialized) <= CHARACTER_LIMIT:
-        return result
 
-    # Actually truncate: try removing list items from the largest list value
-    # until we're under the limit, then add truncation metadata
-    truncated = dict(result)
-    for key in sorted(
-        truncated.keys(),
-        key=lambda k: len(json.dumps(truncated[k], default=str))
-        if isinstance(truncated[k], (list, dict))
-        else 0,
-        reverse=True,
-    ):
-        val = truncated[key]
-        if isinstance(val, list) and len(val) > 1:
-            # Keep only enough items to stay under limit
-            while len(val) > 1:
-                val = val[: len(val) // 2]
-                truncated[key] = val
-                check = json.dumps(truncated, default=str)
-                if len(check) <= CHARACTER_LIMIT - 200:
-                    break
-            if len(json.dumps(truncated, default=str)) <= CHARACTER_LIMIT:
-                break
-
-    truncated["_truncated"] = True
-    truncated["_note"] = (
-        f"Response exceeded {CHARACTER_LIMIT} characters and was truncated. "
-        f"Use more specific queries or limit/offset parameters."
-    )
+def _start_backoff(key: Optional[Tuple[str, str]]) -> float:
+    """Record a throttle for *key* and return the wait, doubling per streak.
+
+    Calls without a resource (``key`` is ``None``) are not tracked and
+    get the base wait.
+    """
+    if key is None:
+        return _BACKOFF_BASE_S
+    with _backoff_lock:
+        streak = _backoff.get(key, (0.0, 0))[1] + 1
+        wait = min(_BACKOFF_BASE_S * 2 ** (streak - 1), _BACKOFF_MAX_S)
+        _backoff[key] = (time.monotonic() + wait, streak)
+    return wait
+
+
+def _throttled_response(
+    message: str, retry_after_s: float, code: Optional[str] = None,
+) -> dict:
+    """Build the error response for a throttled or backed-off call."""
+    response = {
+        "isError": True,
+        "error_type": "rate_limited",
+        "error": message,
+        "retry_after_s": round(retry_after_s, 1),
+        "suggestions": [
+            f"Wait {retry_after_s:.0f} seconds before calling this tool again",
+            "Reduce the frequency of API calls",
+        ],
+    }
+    if code:
+        response["error_code"] = code
+    return response
+
+
+def _qserror_response(e: QSError, get_memory: Optional[Callable]) -> dict:
+    """Build the structured error response for a ``QSError``."""
+    error_response = {
+        "isError": True,
+        "error_type": e.error_type,
+        "error": str(e),
+        "suggestions": e.suggestions,
+        "metadata": e.metadata,
+    }
+
+    # Add recovery suggestions from memory
+    if get_memory:
+        try:
+            memory = get_memory()
+            if memory:
+                with memory_lock:
+                    past = memory.get_recovery_suggestions(
+                        e.resource_id, e.error_type
+                    )
+                if past:
+                    error_response["past_recovery"] = past
+        except Exception:
+            logger.debug("Memory lookup failed", exc_info=True)
+
+    return error_response
 
-    # Final safety check: if still too large, replace with a summary string
-    if len(json.dumps(truncated, default=str)) > CHARACTER_LIMIT:
-        return {
-            "_truncated": True,
-            "_note": (
-                f"Response from '{tool_name}' exceeded {CHARACTER_LIMIT} characters "
-                f"even after truncation. Use more specific queries or filters."
-            ),
-        }
-
-    return truncated
+
+def _truncate_response(result: Any, tool_name: str) -> Any:
+    """Truncate overly large responses with guidance."""
+    if not isinstance(result, dict):
+        return result
+    return truncate_if_needed(result, tool_name)
@@ -0,0 +1,44 @@
+"""Parsing for JSON-string tool arguments.
+
+Several tools take a QuickSight definition as a JSON string.  Parsing
+them here keeps the size limit and the error shape the same everywhere.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import orjson
+
+from quicksight_mcp.safety.exceptions import QSValidationError
+
+# Far above any single filter, parameter or visual definition
+MAX_JSON_ARG_BYTES = 1_048_576
+
+
+def parse_json_arg(value: Any, name: str, resource_id: Optional[str] = None) -> Any:
+    """Parse a JSON-string argument, passing already-parsed values through.
+
+    Raises:
+        QSValidationError: If *value* is more than ``MAX_JSON_ARG_BYTES``
+            bytes as UTF-8, or is not valid JSON.
+    """
+    if not isinstance(value, (str, bytes)):
+        return value
+    size = len(value)
+    # A str of up to a quarter of the limit fits even if every character
+    # is four bytes of UTF-8; only longer ones need encoding to measure.
+    if isinstance(value, str) and MAX_JSON_ARG_BYTES // 4 < size <= MAX_JSON_ARG_BYTES:
+        size = len(value.encode("utf-8", "surrogatepass"))
+    if size > MAX_JSON_ARG_BYTES:
+        raise QSValidationError(
+            f"{name} is too large (over the {MAX_JSON_ARG_BYTES:,}-byte limit)",
+            resource_id=resource_id,
+        )
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError as e:
+        raise QSValidationError(
+            f"{name} is not valid JSON: {e}",
+            resource_id=resource_id,
+        ) from e
@@ -6,9 +6,17 @@ Models are organized by domain section.
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 
 # =========================================================================
@@ -17,9 +25,46 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 
 
 class StrictModel(BaseModel):
-    """Base model that rejects extra fields."""
+    """Base model that rejects extra fields.
 
-    model_config = ConfigDict(extra="forbid")
+    Inputs are immutable once validated, so attribute assignment never
+    triggers re-validation.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+# Shared field types: each constraint set is declared once and reused
+# by every model below.
+DatasetId = Annotated[str, StringConstraints(min_length=1, max_length=256)]
+AnalysisId = Annotated[str, StringConstraints(min_length=1, max_length=256)]
+DashboardId = Annotated[str, StringConstraints(min_length=1, max_length=256)]
+SheetId = Annotated[str, StringConstraints(min_length=1, max_length=256)]
+VisualId = Annotated[str, StringConstraints(min_length=1, max_length=256)]
+
+Aggregation = Literal["SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"]
+Orientation = Literal["VERTICAL", "HORIZONTAL"]
+DateGranularity = Literal["DAY", "WEEK", "MONTH", "QUARTER", "YEAR"]
+
+
+M = TypeVar("M", bound=BaseModel)
+
+# One TypeAdapter per model class, built on first use and reused for
+# every subsequent call so validation goes straight to the compiled
+# pydantic-core validator.
+_ADAPTERS: Dict[type, TypeAdapter] = {}
+
+
+def validate(model: Type[M], data: Dict[str, Any]) -> M:
+    """Validate *data* against *model* using a cached ``TypeAdapter``.
+
+    Raises:
+        pydantic.ValidationError: If *data* does not satisfy the model.
+    """
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ADAPTERS.setdefault(model, TypeAdapter(model))
+    return adapter.validate_python(data)
 
 
 # =========================================================================
@@ -36,31 +81,31 @@ class SearchInput(StrictModel):
 class DatasetIdInput(StrictModel):
     """Input requiring a dataset_id."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
 
 
 class UpdateDatasetSqlInput(StrictModel):
     """Input for update_dataset_sql."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
-    new_sql: str = Field(..., min_length=1, description="Must contain SELECT or WITH")
+    dataset_id: DatasetId
+    new_sql: str = Field(..., min_length=1, description="New SQL query")
     backup_first: bool = Field(True, description="Create backup before updating")
 
     @field_validator("new_sql")
     @classmethod
-    def sql_must_be_valid(cls, v: str) -> str:
-        upper = v.strip().upper()
-        if not (upper.startswith("SELECT") or upper.startswith("WITH")):
-            raise ValueError("SQL must start with SELECT or WITH")
+    def sql_must_not_be_blank(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("SQL must not be blank")
         return v
 
 
 class ModifyDatasetSqlInput(StrictModel):
     """Input for modify_dataset_sql (find/replace)."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
     find: str = Field(..., min_length=1, description="Exact text to find")
     replace: str = Field(..., description="Replacement text")
+    count: Optional[int] = Field(None, ge=1, description="Occurrences to replace")
 
 
 class CreateDatasetInput(StrictModel):
@@ -68,35 +113,68 @@ class CreateDatasetInput(StrictModel):
 
     name: str = Field(..., min_length=1, max_length=256)
     sql: str = Field(..., min_length=1)
-    data_source_arn: str = Field(..., min_length=1)
+    data_source_arn: str = Field(
+        ...,
+        pattern=r"^arn:aws[a-z-]*:quicksight:[a-z0-9-]+:\d{12}:datasource/.+$",
+        description="arn:aws:quicksight:<region>:<account>:datasource/<id>",
+    )
     import_mode: Literal["SPICE", "DIRECT_QUERY"] = "SPICE"
 
 
 class UpdateDatasetDefinitionInput(StrictModel):
     """Input for update_dataset_definition."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
     definition_json: str = Field(..., min_length=2, description="JSON string")
 
 
 class RefreshStatusInput(StrictModel):
     """Input for get_refresh_status."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
     ingestion_id: str = Field(..., min_length=1)
 
 
+class RefreshStatusesInput(StrictModel):
+    """Input for get_refresh_statuses."""
+
+    ingestions: List[RefreshStatusInput] = Field(..., min_length=1, max_length=100)
+
+
+class GetDatasetInput(StrictModel):
+    """Input for get_dataset."""
+
+    dataset_id: DatasetId
+    max_columns: int = Field(50, ge=1, le=2000)
+
+
+class GetDatasetsInput(StrictModel):
+    """Input for get_datasets."""
+
+    dataset_ids: List[DatasetId] = Field(..., min_length=1, max_length=100)
+    max_columns: int = Field(50, ge=1, le=2000)
+    include_sql: bool = False
+
+
+class WaitForRefreshInput(StrictModel):
+    """Input for wait_for_refresh."""
+
+    dataset_id: DatasetId
+    ingestion_id: str = Field(..., min_length=1)
+    timeout_seconds: int = Field(600, ge=1, le=3600)
+
+
 class CancelRefreshInput(StrictModel):
     """Input for cancel_refresh."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
     ingestion_id: str = Field(..., min_length=1)
 
 
 class ListRefreshesInput(StrictModel):
     """Input for list_recent_refreshes."""
 
-    dataset_id: str = Field(..., min_length=1, max_length=256)
+    dataset_id: DatasetId
     limit: int = Field(5, ge=1, le=100)
 
 
@@ -108,7 +186,7 @@ class ListRefreshesInput(StrictModel):
 class AnalysisIdInput(StrictModel):
     """Input requiring an analysis_id."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
 
 
 # =========================================================================
@@ -119,7 +197,7 @@ class AnalysisIdInput(StrictModel):
 class AddCalcFieldInput(StrictModel):
     """Input for add_calculated_field."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     name: str = Field(..., min_length=1, max_length=256)
     expression: str = Field(..., min_length=1)
     dataset_identifier: str = Field(..., min_length=1)
@@ -128,7 +206,7 @@ class AddCalcFieldInput(StrictModel):
 class UpdateCalcFieldInput(StrictModel):
     """Input for update_calculated_field."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     name: str = Field(..., min_length=1, max_length=256)
     new_expression: str = Field(..., min_length=1)
 
@@ -136,15 +214,48 @@ class UpdateCalcFieldInput(StrictModel):
 class DeleteCalcFieldInput(StrictModel):
     """Input for delete_calculated_field."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     name: str = Field(..., min_length=1, max_length=256)
 
 
 class GetCalcFieldInput(StrictModel):
     """Input for get_calculated_field."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    name: str = Field(..., min_length=1, max_length=256)
+
+
+class GetCalcFieldsInput(StrictModel):
+    """Input for get_calculated_fields."""
+
+    analysis_id: AnalysisId
+    names: List[
+        Annotated[str, StringConstraints(min_length=1, max_length=256)]
+    ] = Field(..., min_length=1)
+
+
+class CalcFieldOperation(StrictModel):
+    """One operation for batch_update_calculated_fields."""
+
+    action: Literal["add", "update", "delete"]
     name: str = Field(..., min_length=1, max_length=256)
+    expression: str = ""
+    dataset_identifier: str = ""
+
+    @model_validator(mode="after")
+    def fields_match_action(self) -> "CalcFieldOperation":
+        if self.action in ("add", "update") and not self.expression:
+            raise ValueError(f"'{self.action}' requires an expression.")
+        if self.action == "add" and not self.dataset_identifier:
+            raise ValueError("'add' requires a dataset_identifier.")
+        return self
+
+
+class BatchCalcFieldInput(StrictModel):
+    """Input for batch_update_calculated_fields."""
+
+    analysis_id: AnalysisId
+    operations: List[CalcFieldOperation] = Field(..., min_length=1)
 
 
 # =========================================================================
@@ -155,28 +266,28 @@ class GetCalcFieldInput(StrictModel):
 class DashboardIdInput(StrictModel):
     """Input requiring a dashboard_id."""
 
-    dashboard_id: str = Field(..., min_length=1, max_length=256)
+    dashboard_id: DashboardId
 
 
 class DashboardVersionsInput(StrictModel):
     """Input for get_dashboard_versions."""
 
-    dashboard_id: str = Field(..., min_length=1, max_length=256)
+    dashboard_id: DashboardId
     limit: int = Field(10, ge=1, le=100)
 
 
 class PublishDashboardInput(StrictModel):
     """Input for publish_dashboard."""
 
-    dashboard_id: str = Field(..., min_length=1, max_length=256)
-    source_analysis_id: str = Field(..., min_length=1, max_length=256)
+    dashboard_id: DashboardId
+    source_analysis_id: AnalysisId
     version_description: str = ""
 
 
 class RollbackDashboardInput(StrictModel):
     """Input for rollback_dashboard."""
 
-    dashboard_id: str = Field(..., min_length=1, max_length=256)
+    dashboard_id: DashboardId
     version_number: int = Field(..., ge=1)
 
 
@@ -188,45 +299,45 @@ class RollbackDashboardInput(StrictModel):
 class AddSheetInput(StrictModel):
     """Input for add_sheet."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     name: str = Field(..., min_length=1, max_length=256)
 
 
 class DeleteSheetInput(StrictModel):
     """Input for delete_sheet."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
 
 
 class RenameSheetInput(StrictModel):
     """Input for rename_sheet."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     new_name: str = Field(..., min_length=1, max_length=256)
 
 
 class ReplicateSheetInput(StrictModel):
     """Input for replicate_sheet."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    source_sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    source_sheet_id: SheetId
     target_sheet_name: str = Field(..., min_length=1, max_length=256)
 
 
 class DeleteEmptySheetsInput(StrictModel):
     """Input for delete_empty_sheets."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     name_contains: str = ""
 
 
 class ListSheetVisualsInput(StrictModel):
     """Input for list_sheet_visuals."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
 
 
 # =========================================================================
@@ -237,38 +348,38 @@ class ListSheetVisualsInput(StrictModel):
 class GetVisualDefInput(StrictModel):
     """Input for get_visual_definition."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    visual_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    visual_id: VisualId
 
 
 class AddVisualInput(StrictModel):
     """Input for add_visual."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     visual_definition: str = Field(..., min_length=2, description="JSON string")
 
 
 class DeleteVisualInput(StrictModel):
     """Input for delete_visual."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    visual_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    visual_id: VisualId
 
 
 class SetVisualTitleInput(StrictModel):
     """Input for set_visual_title."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    visual_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    visual_id: VisualId
     title: str = Field(..., min_length=1)
 
 
 class SetVisualLayoutInput(StrictModel):
     """Input for set_visual_layout."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    visual_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    visual_id: VisualId
     column_index: int = Field(..., ge=0, le=35)
     column_span: int = Field(..., ge=1, le=36)
     row_index: int = Field(..., ge=0)
@@ -283,21 +394,21 @@ class SetVisualLayoutInput(StrictModel):
 class AddParameterInput(StrictModel):
     """Input for add_parameter."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     parameter_definition: str = Field(..., min_length=2, description="JSON string")
 
 
 class DeleteParameterInput(StrictModel):
     """Input for delete_parameter."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     parameter_name: str = Field(..., min_length=1, max_length=256)
 
 
 class AddFilterGroupInput(StrictModel):
     """Input for add_filter_group."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     filter_group_definition: str = Field(
         ..., min_length=2, description="JSON string"
     )
@@ -306,7 +417,7 @@ class AddFilterGroupInput(StrictModel):
 class DeleteFilterGroupInput(StrictModel):
     """Input for delete_filter_group."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     filter_group_id: str = Field(..., min_length=1, max_length=256)
 
 
@@ -352,7 +463,7 @@ class RestoreInput(StrictModel):
 class CloneAnalysisInput(StrictModel):
     """Input for clone_analysis."""
 
-    source_analysis_id: str = Field(..., min_length=1, max_length=256)
+    source_analysis_id: AnalysisId
     new_name: str = Field(..., min_length=1, max_length=256)
 
 
@@ -364,13 +475,13 @@ class CloneAnalysisInput(StrictModel):
 class SnapshotInput(StrictModel):
     """Input for snapshot_analysis."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
 
 
 class DiffInput(StrictModel):
     """Input for diff_analysis."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
     snapshot_id: str = Field(..., min_length=1)
 
 
@@ -382,13 +493,11 @@ class DiffInput(StrictModel):
 class CreateKpiInput(StrictModel):
     """Input for create_kpi."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     column: str = Field(..., min_length=1)
-    aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    aggregation: Aggregation
     dataset_identifier: str = Field(..., min_length=1)
     format_string: str = ""
     conditional_format: str = ""
@@ -397,16 +506,14 @@ class CreateKpiInput(StrictModel):
 class CreateBarChartInput(StrictModel):
     """Input for create_bar_chart."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     category_column: str = Field(..., min_length=1)
     value_column: str = Field(..., min_length=1)
-    value_aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    value_aggregation: Aggregation
     dataset_identifier: str = Field(..., min_length=1)
-    orientation: Literal["VERTICAL", "HORIZONTAL"] = "VERTICAL"
+    orientation: Orientation = "VERTICAL"
     format_string: str = ""
     show_data_labels: bool = False
 
@@ -414,18 +521,14 @@ class CreateBarChartInput(StrictModel):
 class CreateLineChartInput(StrictModel):
     """Input for create_line_chart."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     date_column: str = Field(..., min_length=1)
     value_column: str = Field(..., min_length=1)
-    value_aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    value_aggregation: Aggregation
     dataset_identifier: str = Field(..., min_length=1)
-    date_granularity: Literal[
-        "DAY", "WEEK", "MONTH", "QUARTER", "YEAR"
-    ] = "WEEK"
+    date_granularity: DateGranularity = "WEEK"
     format_string: str = ""
     show_data_labels: bool = False
 
@@ -433,8 +536,8 @@ class CreateLineChartInput(StrictModel):
 class CreatePivotTableInput(StrictModel):
     """Input for create_pivot_table."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     row_columns: str = Field(
         ..., min_length=1,
@@ -454,8 +557,8 @@ class CreatePivotTableInput(StrictModel):
 class CreateTableInput(StrictModel):
     """Input for create_table."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     columns: str = Field(
         ..., min_length=1,
@@ -467,18 +570,14 @@ class CreateTableInput(StrictModel):
 class CreateComboChartInput(StrictModel):
     """Input for create_combo_chart."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     category_column: str = Field(..., min_length=1)
     bar_column: str = Field(..., min_length=1)
-    bar_aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    bar_aggregation: Aggregation
     line_column: str = Field(..., min_length=1)
-    line_aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    line_aggregation: Aggregation
     dataset_identifier: str = Field(..., min_length=1)
     bar_format_string: str = ""
     line_format_string: str = ""
@@ -488,13 +587,11 @@ class CreateComboChartInput(StrictModel):
 class CreatePieChartInput(StrictModel):
     """Input for create_pie_chart."""
 
-    analysis_id: str = Field(..., min_length=1, max_length=256)
-    sheet_id: str = Field(..., min_length=1, max_length=256)
+    analysis_id: AnalysisId
+    sheet_id: SheetId
     title: str = Field(..., min_length=1)
     group_column: str = Field(..., min_length=1)
     value_column: str = Field(..., min_length=1)
-    value_aggregation: Literal[
-        "SUM", "COUNT", "AVG", "MIN", "MAX", "DISTINCT_COUNT"
-    ]
+    value_aggregation: Aggregation
     dataset_identifier: str = Field(..., min_length=1)
     format_string: str = ""
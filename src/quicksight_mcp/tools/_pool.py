@@ -0,0 +1,22 @@
+"""Shared thread pool for tools that fan out independent AWS calls.
+
+boto3 blocks, so running independent lookups on threads lets their
+round trips overlap instead of running back to back; botocore releases
+the GIL while each thread waits on its socket.  The QuickSight client's
+connection pool is sized for these workers plus FastMCP's own.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+MAX_WORKERS = 8
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="qs-tools")
+
+
+def submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    """Run *fn* on the shared pool, keeping the caller's correlation context."""
+    return _EXECUTOR.submit(contextvars.copy_context().run, fn, *args, **kwargs)
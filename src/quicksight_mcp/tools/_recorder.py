@@ -0,0 +1,88 @@
+"""Background recording of tool calls.
+
+``MemoryManager.record_call`` updates several stores and periodically
+flushes them to disk.  Running it on a single daemon thread keeps that
+work off the tool response path; the decorator only enqueues a job.
+
+The queue is bounded.  When it is full the oldest job is dropped (and
+counted in ``dropped``) so a stalled disk can never grow memory without
+limit or block a tool call.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 10_000
+
+# Held while a job runs.  Code that reads the same memory objects from a
+# tool thread (e.g. recovery suggestions) takes it too.
+memory_lock = threading.RLock()
+
+# Number of jobs discarded because the queue was full.
+dropped = 0
+
+_queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+_worker: Optional[threading.Thread] = None
+_start_lock = threading.Lock()
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> None:
+    """Queue ``fn(*args)`` to run on the recorder thread."""
+    global dropped
+    _ensure_worker()
+    job = (fn, args)
+    try:
+        _queue.put_nowait(job)
+    except queue.Full:
+        # Ring-buffer semantics: make room by discarding the oldest job
+        try:
+            _queue.get_nowait()
+            _queue.task_done()
+            dropped += 1
+        except queue.Empty:
+            pass
+        try:
+            _queue.put_nowait(job)
+        except queue.Full:
+            dropped += 1
+
+
+def drain() -> None:
+    """Block until every queued job has run."""
+    if _worker is not None:
+        _queue.join()
+
+
+def _run() -> None:
+    while True:
+        fn, args = _queue.get()
+        try:
+            with memory_lock:
+                fn(*args)
+        except Exception:
+            logger.debug("Background recording failed", exc_info=True)
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    if _worker is not None:
+        return
+    with _start_lock:
+        if _worker is None:
+            worker = threading.Thread(
+                target=_run, name="qs-tool-recorder", daemon=True,
+            )
+            worker.start()
+            # Registered after the MemoryManager's own atexit flush (it is
+            # created before the first job), so the queue drains first.
+            atexit.register(drain)
+            _worker = worker
@@ -5,10 +5,52 @@ Provides pagination, truncation, and structured error formatting.
 
 from __future__ import annotations
 
+import heapq
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 CHARACTER_LIMIT = 25_000
 
+_ENCODE_ERRORS = (orjson.JSONEncodeError, TypeError, ValueError)
+
+# Below this rough size a response fits even if every character is escaped
+_SKIP_BUDGET = CHARACTER_LIMIT // 6
+
+
+def _json_size(obj: Any) -> int:
+    """Return the length in bytes of *obj* serialized as JSON."""
+    return len(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _approx_size(obj: Any, budget: int) -> int:
+    """Roughly estimate the JSON size of *obj* without serializing it.
+
+    Walks the structure iteratively and returns as soon as the running
+    total exceeds *budget*, so large payloads cost only a partial walk.
+    """
+    acc = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            acc += len(item) + 3
+        elif isinstance(item, dict):
+            acc += 2
+            for k, v in item.items():
+                acc += len(k) + 4 if isinstance(k, str) else 24
+                stack.append(v)
+        elif isinstance(item, (list, tuple)):
+            acc += 2 + len(item)
+            stack.extend(item)
+        elif item is None or isinstance(item, (bool, int, float)):
+            acc += 24
+        else:
+            acc += len(str(item)) + 3
+        if acc > budget:
+            return acc
+    return acc
+
 
 def paginate_list(
     items: List[Any],
@@ -17,13 +59,19 @@ def paginate_list(
 ) -> Dict[str, Any]:
     """Apply limit/offset pagination to a list of items.
 
+    When the page spans the whole list, *items* itself is returned as the
+    page rather than a copy.
+
     Returns:
         dict with ``items``, ``total_count``, ``has_more``, ``next_offset``.
     """
     limit = max(1, limit)
     offset = max(0, offset)
     total = len(items)
-    page = items[offset : offset + limit]
+    if offset == 0 and limit >= total:
+        page = items
+    else:
+        page = items[offset : offset + limit]
     has_more = offset + limit < total
 
     result: Dict[str, Any] = {
@@ -39,33 +87,87 @@ def paginate_list(
 
 
 def truncate_if_needed(result: Dict[str, Any], tool_name: str = "") -> Dict[str, Any]:
-    """Truncate oversized dict responses to fit within CHARACTER_LIMIT."""
-    import json as _json
+    """Truncate oversized dict responses to fit within CHARACTER_LIMIT.
+
+    The full response is serialized once up front.  The longest list is
+    halved until the response fits, tracked with a heap keyed by item
+    count.  Only the dropped half of each list is serialized; its size is
+    subtracted from the running total instead of re-serializing the
+    response.  A real serialization is done only to confirm a total that
+    fits.  Truncation works on a shallow copy, so *result* itself is
+    never modified.
+
+    Responses whose rough size is under a sixth of the limit are
+    returned without serializing at all.  No character grows by more
+    than that when JSON-encoded: control characters become six-byte
+    ``\\u00XX`` escapes.
+
+    A response that is still too large once every list is down to one
+    item is replaced with a short note naming *tool_name*.
+    """
+    if _approx_size(result, _SKIP_BUDGET) <= _SKIP_BUDGET:
+        return result
 
     try:
-        serialized = _json.dumps(result, default=str)
-    except (TypeError, ValueError):
+        total = _json_size(result)
+    except _ENCODE_ERRORS:
         return result
 
-    if len(serialized) <= CHARACTER_LIMIT:
+    if total <= CHARACTER_LIMIT:
         return result
 
-    # Truncate the largest list values
-    for key in sorted(result, key=lambda k: len(str(result[k])), reverse=True):
-        if isinstance(result[key], list) and len(result[key]) > 5:
-            result[key] = result[key][: len(result[key]) // 2]
+    result = dict(result)
+    # Max-heap of (-item_count, key): the longest list is always halved
+    # next, and a halved list goes back in while it still has > 1 item.
+    heap = [
+        (-len(v), k) for k, v in result.items()
+        if isinstance(v, list) and len(v) > 1
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_count, key = heapq.heappop(heap)
+        count = -neg_count
+        val = result[key]
+        keep = count // 2
+        try:
+            # "[a,b]" drops its brackets but the comma before it goes too
+            removed = _json_size(val[keep:]) - 1
+        except _ENCODE_ERRORS:
+            continue
+        result[key] = val[:keep]
+        total -= removed
+        if keep > 1:
+            heapq.heappush(heap, (-keep, key))
+        if not result.get("_truncated"):
             result["_truncated"] = True
             result["_note"] = (
                 f"Response truncated to fit {CHARACTER_LIMIT} character limit. "
                 f"Use limit/offset parameters for full results."
             )
+            total += len(result["_note"]) + 40
+        if total <= CHARACTER_LIMIT:
             try:
-                if len(_json.dumps(result, default=str)) <= CHARACTER_LIMIT:
-                    return result
-            except (TypeError, ValueError):
-                pass
+                total = _json_size(result)
+            except _ENCODE_ERRORS:
+                return result
+            if total <= CHARACTER_LIMIT:
+                return result
 
-    return result
+    # The running total is a slight overestimate; confirm before giving up
+    try:
+        if _json_size(result) <= CHARACTER_LIMIT:
+            return result
+    except _ENCODE_ERRORS:
+        return result
+
+    return {
+        "_truncated": True,
+        "_note": (
+            f"Response from '{tool_name}' exceeded {CHARACTER_LIMIT} characters "
+            f"even after truncation. Use more specific queries or filters."
+        ),
+    }
 
 
 def format_error_response(
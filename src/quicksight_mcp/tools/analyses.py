@@ -5,6 +5,8 @@ including their sheets, visuals, calculated fields, parameters, and filters.
 """
 
 import logging
+from heapq import nlargest
+from operator import itemgetter
 from typing import Callable
 
 from fastmcp import FastMCP
@@ -90,22 +92,19 @@ def register_analysis_tools(mcp: FastMCP, get_client: Callable, get_tracker: Cal
         analysis = client.get_analysis(analysis_id)
 
         # Extract sheets summary
-        sheets_raw = definition.get("Sheets", [])
-        sheets = []
-        for s in sheets_raw:
-            visuals = s.get("Visuals", [])
-            sheets.append(
-                {
-                    "name": s.get("Name", ""),
-                    "id": s.get("SheetId", ""),
-                    "visual_count": len(visuals),
-                }
-            )
-
-        calc_fields = definition.get("CalculatedFields", [])
-        params = definition.get("ParameterDeclarations", [])
-        filter_groups = definition.get("FilterGroups", [])
-        ds_id_decls = definition.get("DataSetIdentifierDeclarations", [])
+        sheets = [
+            {
+                "name": s.get("Name", ""),
+                "id": s.get("SheetId", ""),
+                "visual_count": len(s.get("Visuals", ())),
+            }
+            for s in definition.get("Sheets", ())
+        ]
+
+        calc_fields = definition.get("CalculatedFields", ())
+        params = definition.get("ParameterDeclarations", ())
+        filter_groups = definition.get("FilterGroups", ())
+        ds_id_decls = definition.get("DataSetIdentifierDeclarations", ())
 
         return {
             "analysis_id": analysis_id,
@@ -167,27 +166,32 @@ def register_analysis_tools(mcp: FastMCP, get_client: Callable, get_tracker: Cal
         }
 
     @qs_tool(mcp, get_memory, read_only=True)
-    def get_columns_used(analysis_id: str) -> dict:
+    def get_columns_used(analysis_id: str, top_k: int = 100) -> dict:
         """Get a frequency map of columns used across an analysis.
 
         Args:
             analysis_id: The QuickSight analysis ID.
+            top_k: Return only the K most-used columns (default 100).
+                   Use 0 to return every column.
 
         Returns a dict mapping column names to the number of times they
         appear in visuals, calculated fields, filters, etc. Useful for
         understanding which columns are most important and for impact
-        analysis before modifying a dataset.
+        analysis before modifying a dataset. ``unique_columns`` is always
+        the total number of distinct columns, even when ``top_k`` limits
+        the map.
         """
         client = get_client()
         usage = client.get_columns_used(analysis_id)
-        # Sort by frequency descending
-        sorted_usage = dict(
-            sorted(usage.items(), key=lambda x: x[1], reverse=True)
-        )
+        # Most frequent first
+        if top_k > 0:
+            top = nlargest(top_k, usage.items(), key=itemgetter(1))
+        else:
+            top = sorted(usage.items(), key=itemgetter(1), reverse=True)
         return {
             "analysis_id": analysis_id,
-            "unique_columns": len(sorted_usage),
-            "columns": sorted_usage,
+            "unique_columns": len(usage),
+            "columns": dict(top),
         }
 
     @qs_tool(mcp, get_memory, read_only=True)
@@ -5,11 +5,12 @@ fields within QuickSight analyses.
 """
 
 import logging
-from typing import Callable
+from typing import Callable, Dict, List
 
 from fastmcp import FastMCP
 
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._models import BatchCalcFieldInput, GetCalcFieldsInput
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,37 @@ def register_calculated_field_tools(
             **field,
         }
 
+    @qs_tool(mcp, get_memory, read_only=True, input_model=GetCalcFieldsInput)
+    def get_calculated_fields(analysis_id: str, names: List[str]) -> dict:
+        """Get several calculated fields from an analysis in one call.
+
+        Prefer this over repeated get_calculated_field calls when
+        inspecting more than one field -- the analysis definition is
+        read once for the whole batch.
+
+        Args:
+            analysis_id: The QuickSight analysis ID.
+            names: Exact names of the calculated fields to fetch.
+
+        Returns a ``fields`` map of name to field details for every field
+        found, plus ``found`` and ``missing`` name lists.
+        """
+        client = get_client()
+        fields = {}
+        missing = []
+        for name in names:
+            field = client.get_calculated_field(analysis_id, name)
+            if field is None:
+                missing.append(name)
+            else:
+                fields[name] = field
+        return {
+            "analysis_id": analysis_id,
+            "found": list(fields),
+            "missing": missing,
+            "fields": fields,
+        }
+
     @qs_tool(mcp, get_memory, destructive=True)
     def add_calculated_field(
         analysis_id: str,
@@ -74,12 +106,21 @@ def register_calculated_field_tools(
                                 to. Find available identifiers using
                                 describe_analysis (look at dataset_identifiers).
 
-        Returns confirmation with the created field details.
+        Returns confirmation with the created field details. If an
+        identical field already exists, nothing is written and status is
+        "exists".
         """
         client = get_client()
-        client.add_calculated_field(
+        result = client.add_calculated_field(
             analysis_id, name, expression, dataset_identifier
         )
+        if result.get("status") == "exists":
+            return {
+                "status": "exists",
+                "analysis_id": analysis_id,
+                "field_name": name,
+                "note": "An identical field already exists. Nothing was changed.",
+            }
         return {
             "status": "success",
             "analysis_id": analysis_id,
@@ -108,12 +149,21 @@ def register_calculated_field_tools(
             new_expression: The new QuickSight expression. Uses the same
                             syntax as add_calculated_field.
 
-        Returns confirmation with the updated expression.
+        Returns confirmation with the updated expression. If the field
+        already has this expression, nothing is written (no backup) and
+        status is "noop".
         """
         client = get_client()
-        client.update_calculated_field(
+        result = client.update_calculated_field(
             analysis_id, name, new_expression
         )
+        if result.get("status") == "noop":
+            return {
+                "status": "noop",
+                "analysis_id": analysis_id,
+                "field_name": name,
+                "note": "Field already has this expression. Nothing was changed.",
+            }
         return {
             "status": "success",
             "analysis_id": analysis_id,
@@ -151,3 +201,42 @@ def register_calculated_field_tools(
                 "Use backup_analysis to restore if needed."
             ),
         }
+
+    @qs_tool(mcp, get_memory, destructive=True, input_model=BatchCalcFieldInput)
+    def batch_update_calculated_fields(
+        analysis_id: str, operations: List[Dict]
+    ) -> dict:
+        """Add, update, and delete several calculated fields in one write.
+
+        WARNING: This modifies the analysis definition. Prefer this over
+        repeated add/update/delete_calculated_field calls when changing
+        more than one field: the whole batch costs one backup, one
+        update, and one verification instead of one of each per field.
+
+        Operations apply in order. If any operation is invalid (unknown
+        field, conflicting add), nothing is written.
+
+        Args:
+            analysis_id: The QuickSight analysis ID.
+            operations: List of operations, each one of:
+                - {"action": "add", "name": ..., "expression": ...,
+                   "dataset_identifier": ...}
+                - {"action": "update", "name": ..., "expression": ...}
+                - {"action": "delete", "name": ...}
+
+        Returns per-operation status (added, updated, deleted, or
+        exists/noop when the field already matched).
+        """
+        client = get_client()
+        result = client.batch_update_calculated_fields(analysis_id, operations)
+        return {
+            "status": "success" if result["update"] is not None else "noop",
+            "analysis_id": analysis_id,
+            "results": result["results"],
+            "note": (
+                "Changes applied in a single update. "
+                "Publish dashboard to propagate to viewers."
+                if result["update"] is not None
+                else "Every field already matched. Nothing was changed."
+            ),
+        }
@@ -10,6 +10,8 @@ from typing import Callable
 from fastmcp import FastMCP
 
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._pool import submit
+from quicksight_mcp.tools._response import paginate_list
 
 logger = logging.getLogger(__name__)
 
@@ -20,51 +22,62 @@ def register_dashboard_tools(
     """Register all dashboard-related MCP tools."""
 
     @qs_tool(mcp, get_memory, read_only=True)
-    def list_dashboards() -> dict:
-        """List all QuickSight dashboards with their names, IDs, and publish status.
+    def list_dashboards(limit: int = 50, offset: int = 0) -> dict:
+        """List QuickSight dashboards with their names, IDs, and publish status.
 
-        Returns every dashboard in the account. Results are cached for
-        5 minutes. Dashboards are the published, viewer-facing version
-        of analyses.
+        Returns one page of the account's dashboards. The full list is
+        cached for 5 minutes, so paging through it does not call AWS
+        again. Dashboards are the published, viewer-facing version of
+        analyses.
+
+        Args:
+            limit: Maximum dashboards to return (default 50).
+            offset: Number of dashboards to skip. Pass the previous
+                    response's next_offset to fetch the next page.
 
         Each entry includes:
         - name: Dashboard display name
         - id: Dashboard ID (use this for other dashboard operations)
         - published_version: Current published version number
+
+        The response also carries total_count, has_more and, when more
+        pages remain, next_offset.
         """
         client = get_client()
-        dashboards = client.list_dashboards()
-        return {
-            "count": len(dashboards),
-            "dashboards": [
-                {
-                    "name": d.get("Name"),
-                    "id": d.get("DashboardId"),
-                    "published_version": d.get("Version", {}).get(
-                        "VersionNumber"
-                    )
-                    if isinstance(d.get("Version"), dict)
-                    else None,
-                }
-                for d in dashboards
-            ],
-        }
+        page = paginate_list(client.list_dashboards(), limit=limit, offset=offset)
+        page["dashboards"] = [
+            {
+                "name": d.get("Name"),
+                "id": d.get("DashboardId"),
+                "published_version": d.get("PublishedVersionNumber"),
+            }
+            for d in page.pop("items")
+        ]
+        return page
 
     @qs_tool(mcp, get_memory, read_only=True)
-    def search_dashboards(name: str) -> dict:
+    def search_dashboards(name: str, limit: int = 100) -> dict:
         """Search QuickSight dashboards by name (case-insensitive partial match).
 
         Args:
             name: Search string to match against dashboard names.
                   Example: "Sales" matches "T&O Sales", "Sales KPIs", etc.
+            limit: Maximum matches to return (default 100). The search
+                   stops scanning once the limit is reached.
 
-        Returns matching dashboards with their IDs.
+        Returns matching dashboards with their IDs. has_more is True
+        when further matches exist beyond the limit.
         """
         client = get_client()
-        results = client.search_dashboards(name)
+        limit = max(1, limit)
+        # Fetch one extra match to learn whether more exist
+        results = client.search_dashboards(name, limit=limit + 1)
+        has_more = len(results) > limit
+        results = results[:limit]
         return {
             "query": name,
             "count": len(results),
+            "has_more": has_more,
             "dashboards": [
                 {
                     "name": d.get("Name"),
@@ -87,11 +100,18 @@ def register_dashboard_tools(
         a version number to rollback to.
         """
         client = get_client()
-        versions = client.get_dashboard_versions(dashboard_id, limit=limit)
-        current = client.get_current_dashboard_version(dashboard_id)
+        # Both lookups are independent -- overlap the two AWS round trips
+        versions_future = submit(
+            client.get_dashboard_versions, dashboard_id, limit=limit
+        )
+        current_future = submit(
+            client.get_current_dashboard_version, dashboard_id
+        )
+        versions = versions_future.result()
+        current = current_future.result()
         return {
             "dashboard_id": dashboard_id,
-            "current_version": current.get("VersionNumber"),
+            "current_version": current.get("version_number"),
             "version_count": len(versions),
             "versions": versions,
         }
@@ -122,7 +142,7 @@ def register_dashboard_tools(
                                  (e.g., "Added revenue breakdown chart").
         """
         client = get_client()
-        client.publish_dashboard(
+        result = client.publish_dashboard(
             dashboard_id,
             source_analysis_id,
             version_description=version_description or None,
@@ -132,6 +152,7 @@ def register_dashboard_tools(
             "dashboard_id": dashboard_id,
             "source_analysis_id": source_analysis_id,
             "version_description": version_description,
+            "retried": result.get("retried", 0),
             "note": (
                 "Dashboard updated. All viewers will see the new version. "
                 "Use rollback_dashboard if you need to revert."
@@ -155,11 +176,12 @@ def register_dashboard_tools(
                             Use get_dashboard_versions to find valid numbers.
         """
         client = get_client()
-        client.rollback_dashboard(dashboard_id, version_number)
+        result = client.rollback_dashboard(dashboard_id, version_number)
         return {
             "status": "rolled_back",
             "dashboard_id": dashboard_id,
             "restored_version": version_number,
+            "retried": result.get("retried", 0),
             "note": (
                 "Dashboard rolled back successfully. "
                 "All viewers now see the restored version."
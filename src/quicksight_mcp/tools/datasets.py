@@ -4,94 +4,212 @@ Provides tools for listing, searching, inspecting, and modifying
 QuickSight datasets and their underlying SQL, plus SPICE refresh management.
 """
 
-import json
 import logging
-from typing import Callable
+from collections import Counter
+from typing import Callable, Dict, List, Optional
 
 from fastmcp import FastMCP
 
+from quicksight_mcp.safety.exceptions import QSValidationError
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._json import parse_json_arg
+from quicksight_mcp.tools._models import (
+    CreateDatasetInput,
+    GetDatasetInput,
+    GetDatasetsInput,
+    ModifyDatasetSqlInput,
+    RefreshStatusInput,
+    RefreshStatusesInput,
+    UpdateDatasetSqlInput,
+    WaitForRefreshInput,
+)
+from quicksight_mcp.tools._pool import submit
+from quicksight_mcp.tools._response import paginate_list
 
 logger = logging.getLogger(__name__)
 
 
+def _preview(text: str, limit: int = 100) -> str:
+    """Return at most ``limit`` characters of ``text``, marking any cut."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _describe_dataset(dataset_id: str, dataset: dict, max_columns: int) -> dict:
+    """Project a describe_data_set result to the fields tools report.
+
+    Only the first ``max_columns`` output columns are listed; wider
+    datasets also get ``columns_truncated`` and a ``column_types`` count
+    covering every column.
+    """
+    columns = dataset.get("OutputColumns", [])
+    result = {
+        "dataset_id": dataset_id,
+        "name": dataset.get("Name"),
+        "import_mode": dataset.get("ImportMode"),
+        "physical_table_count": len(dataset.get("PhysicalTableMap", {})),
+        "logical_table_count": len(dataset.get("LogicalTableMap", {})),
+        "total_columns": len(columns),
+        "output_columns": [
+            {"name": c.get("Name"), "type": c.get("Type")}
+            for c in columns[:max_columns]
+        ],
+    }
+    if len(columns) > max_columns:
+        result["columns_truncated"] = True
+        result["column_types"] = dict(Counter(c.get("Type") for c in columns))
+    return result
+
+
 def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Callable, get_memory=None):
     """Register all dataset-related MCP tools."""
 
     @qs_tool(mcp, get_memory, read_only=True)
-    def list_datasets() -> dict:
-        """List all QuickSight datasets with their names, IDs, and import mode.
+    def list_datasets(
+        limit: int = 50, offset: int = 0, prefetch_details: bool = False
+    ) -> dict:
+        """List QuickSight datasets with their names, IDs, and import mode.
 
-        Returns every dataset in the account with:
+        Returns one page of the account's datasets, each with:
         - name: Human-readable dataset name
         - id: Dataset ID (use this for other dataset operations)
         - import_mode: SPICE (cached) or DIRECT_QUERY (live)
 
-        Results are cached for 5 minutes. Use this to discover datasets
-        before calling get_dataset_sql or update_dataset_sql.
+        Args:
+            limit: Maximum datasets to return (default 50).
+            offset: Number of datasets to skip. Pass the previous
+                    response's next_offset to fetch the next page.
+            prefetch_details: Also describe every dataset on the page
+                (concurrently) and add output_columns and
+                physical_table_count to each entry. Saves a get_dataset
+                call per dataset when you need columns for many of them.
+
+        The full list is cached for 5 minutes, so paging through it does
+        not call AWS again. The response also carries total_count,
+        has_more and, when more pages remain, next_offset. Use this to
+        discover datasets before calling get_dataset_sql or
+        update_dataset_sql.
         """
         client = get_client()
-        datasets = client.list_datasets()
-        return {
-            "count": len(datasets),
-            "datasets": [
-                {
-                    "name": d.get("Name"),
-                    "id": d.get("DataSetId"),
-                    "import_mode": d.get("ImportMode"),
-                }
-                for d in datasets
-            ],
-        }
+        page = paginate_list(client.list_datasets(), limit=limit, offset=offset)
+        entries = [
+            {
+                "name": d.get("Name"),
+                "id": d.get("DataSetId"),
+                "import_mode": d.get("ImportMode"),
+            }
+            for d in page.pop("items")
+        ]
+        if prefetch_details:
+            futures = [submit(client.get_dataset, e["id"]) for e in entries]
+            for entry, future in zip(entries, futures):
+                try:
+                    detail = future.result()
+                except Exception as e:
+                    # One unreadable dataset should not sink the whole listing
+                    entry["error"] = str(e)
+                    continue
+                entry["physical_table_count"] = len(detail.get("PhysicalTableMap", {}))
+                entry["output_columns"] = [
+                    {"name": c.get("Name"), "type": c.get("Type")}
+                    for c in detail.get("OutputColumns", [])
+                ]
+        page["datasets"] = entries
+        return page
 
     @qs_tool(mcp, get_memory, read_only=True)
-    def search_datasets(name: str) -> dict:
+    def search_datasets(name: str, limit: int = 100, offset: int = 0) -> dict:
         """Search QuickSight datasets by name (case-insensitive partial match).
 
         Args:
             name: Search string to match against dataset names.
                   Example: "wbr" matches "WBR Weekly", "wbr_ingest", etc.
+            limit: Maximum matches to return (default 100).
+            offset: Number of matches to skip. Pass the previous
+                    response's next_offset to fetch the next page.
 
-        Returns matching datasets with their IDs and import modes.
+        Returns matching datasets with their IDs and import modes, plus
+        total_count, has_more and, when more matches remain, next_offset.
         Useful when you know part of a dataset name but not the exact ID.
         """
         client = get_client()
-        results = client.search_datasets(name)
-        return {
-            "query": name,
-            "count": len(results),
-            "datasets": [
-                {
-                    "name": d.get("Name"),
-                    "id": d.get("DataSetId"),
-                    "import_mode": d.get("ImportMode"),
-                }
-                for d in results
-            ],
-        }
-
-    @qs_tool(mcp, get_memory, read_only=True)
-    def get_dataset(dataset_id: str) -> dict:
+        page = paginate_list(client.search_datasets(name), limit=limit, offset=offset)
+        page["query"] = name
+        page["datasets"] = [
+            {
+                "name": d.get("Name"),
+                "id": d.get("DataSetId"),
+                "import_mode": d.get("ImportMode"),
+            }
+            for d in page.pop("items")
+        ]
+        return page
+
+    @qs_tool(mcp, get_memory, read_only=True, input_model=GetDatasetInput)
+    def get_dataset(dataset_id: str, max_columns: int = 50) -> dict:
         """Get full metadata for a QuickSight dataset.
 
         Args:
             dataset_id: The QuickSight dataset ID.
+            max_columns: List at most this many output columns (default 50).
+                         Wider datasets also report columns_truncated and
+                         column_types, a count of columns per type.
+
+        Returns dataset information including name, import mode, table
+        counts, total_columns, and the output columns with their types.
+        Descriptions are cached for 60 seconds and refreshed after any
+        change made through this server.
+        """
+        client = get_client()
+        return _describe_dataset(
+            dataset_id, client.get_dataset(dataset_id), max_columns
+        )
 
-        Returns complete dataset information including name, columns,
-        import mode, data source, row-level permissions, and more.
+    @qs_tool(mcp, get_memory, read_only=True, input_model=GetDatasetsInput)
+    def get_datasets(
+        dataset_ids: List[str], max_columns: int = 50, include_sql: bool = False
+    ) -> dict:
+        """Get metadata for several QuickSight datasets in one call.
+
+        Prefer this over repeated get_dataset / get_dataset_sql calls --
+        the datasets are described concurrently and returned together.
+
+        Args:
+            dataset_ids: Dataset IDs to describe (up to 100).
+            max_columns: List at most this many output columns per
+                         dataset (default 50).
+            include_sql: Also return each dataset's Custom SQL as ``sql``
+                         (None for direct table references). Read from
+                         the same describe, so it costs no extra calls.
+
+        Returns ``datasets`` in request order, each with the same fields
+        as get_dataset, plus an ``errors`` map of dataset ID to message
+        for any that could not be read.
         """
         client = get_client()
-        dataset = client.get_dataset(dataset_id)
+
+        def fetch(dataset_id):
+            result = _describe_dataset(
+                dataset_id, client.get_dataset(dataset_id), max_columns
+            )
+            if include_sql:
+                result["sql"] = client.get_dataset_sql(dataset_id)
+            return result
+
+        ids = list(dict.fromkeys(dataset_ids))
+        futures = [submit(fetch, dataset_id) for dataset_id in ids]
+        datasets = []
+        errors = {}
+        for dataset_id, future in zip(ids, futures):
+            try:
+                datasets.append(future.result())
+            except Exception as e:
+                errors[dataset_id] = str(e)
         return {
-            "dataset_id": dataset_id,
-            "name": dataset.get("Name"),
-            "import_mode": dataset.get("ImportMode"),
-            "physical_table_count": len(dataset.get("PhysicalTableMap", {})),
-            "logical_table_count": len(dataset.get("LogicalTableMap", {})),
-            "output_columns": [
-                {"name": c.get("Name"), "type": c.get("Type")}
-                for c in dataset.get("OutputColumns", [])
-            ],
+            "count": len(datasets),
+            "datasets": datasets,
+            "errors": errors,
         }
 
     @qs_tool(mcp, get_memory, read_only=True)
@@ -104,6 +222,8 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
         Returns the SQL query string if the dataset uses Custom SQL,
         or indicates if it uses a direct table reference instead.
         Use this to understand what data feeds a dataset before modifying it.
+        The SQL is cached for 5 minutes and updated by this server's own
+        SQL writes.
         """
         client = get_client()
         sql = client.get_dataset_sql(dataset_id)
@@ -115,7 +235,7 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
             )
         return result
 
-    @qs_tool(mcp, get_memory, destructive=True)
+    @qs_tool(mcp, get_memory, destructive=True, input_model=UpdateDatasetSqlInput)
     def update_dataset_sql(
         dataset_id: str, new_sql: str, backup_first: bool = True
     ) -> dict:
@@ -158,24 +278,31 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
         Args:
             dataset_id: The QuickSight dataset ID to refresh.
 
-        Returns an ingestion_id you can pass to get_refresh_status to
-        monitor progress. Typical SPICE refreshes take 30 seconds to
+        If a refresh started here is still queued or running, no new one
+        is started: status is "already_running" and ingestion_id is the
+        running refresh.
+
+        Returns an ingestion_id you can pass to wait_for_refresh or
+        get_refresh_status to monitor progress. Typical SPICE refreshes take 30 seconds to
         several minutes depending on data volume.
         """
         client = get_client()
         result = client.refresh_dataset(dataset_id)
         return {
-            "status": "refresh_triggered",
+            "status": (
+                "already_running" if result.get("already_running")
+                else "refresh_triggered"
+            ),
             "dataset_id": dataset_id,
             "ingestion_id": result.get("ingestion_id"),
             "ingestion_status": result.get("status"),
             "note": (
-                "Use get_refresh_status with the ingestion_id "
-                "to monitor progress."
+                "Use wait_for_refresh with the ingestion_id to block "
+                "until it finishes, or get_refresh_status to check once."
             ),
         }
 
-    @qs_tool(mcp, get_memory, read_only=True)
+    @qs_tool(mcp, get_memory, read_only=True, input_model=RefreshStatusInput)
     def get_refresh_status(dataset_id: str, ingestion_id: str) -> dict:
         """Check the status of a SPICE dataset refresh.
 
@@ -198,6 +325,80 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
             "error": result.get("error"),
         }
 
+    @qs_tool(mcp, get_memory, read_only=True, input_model=RefreshStatusesInput)
+    def get_refresh_statuses(ingestions: List[Dict[str, str]]) -> dict:
+        """Check the status of several SPICE refreshes in one call.
+
+        Prefer this over repeated get_refresh_status calls -- the checks
+        run concurrently and are returned together.
+
+        Args:
+            ingestions: Up to 100 entries, each with dataset_id and
+                        ingestion_id (as returned by refresh_dataset).
+
+        Returns ``statuses`` in request order, each with the same fields
+        as get_refresh_status. A refresh that could not be checked has
+        an ``error`` message and no status.
+        """
+        client = get_client()
+        futures = [
+            submit(client.get_refresh_status, i["dataset_id"], i["ingestion_id"])
+            for i in ingestions
+        ]
+        statuses = []
+        for item, future in zip(ingestions, futures):
+            entry = {
+                "dataset_id": item["dataset_id"],
+                "ingestion_id": item["ingestion_id"],
+            }
+            try:
+                result = future.result()
+            except Exception as e:
+                entry["status"] = None
+                entry["error"] = str(e)
+            else:
+                entry["status"] = result.get("status")
+                entry["rows_ingested"] = result.get("row_count")
+                entry["error"] = result.get("error")
+            statuses.append(entry)
+        return {
+            "count": len(statuses),
+            "statuses": statuses,
+        }
+
+    @qs_tool(mcp, get_memory, read_only=True, input_model=WaitForRefreshInput)
+    def wait_for_refresh(
+        dataset_id: str, ingestion_id: str, timeout_seconds: int = 600
+    ) -> dict:
+        """Wait for a SPICE dataset refresh to finish.
+
+        Use this instead of calling get_refresh_status in a loop. Polls
+        every second at first, then backs off to every ~30 seconds, and
+        returns as soon as the refresh is COMPLETED, FAILED, or CANCELLED.
+
+        Args:
+            dataset_id: The QuickSight dataset ID.
+            ingestion_id: The ingestion ID returned by refresh_dataset.
+            timeout_seconds: Give up waiting after this long (default 600,
+                             max 3600). The refresh keeps running.
+
+        Returns the same fields as get_refresh_status, plus timed_out
+        (True if the refresh was still running at the timeout) and polls.
+        """
+        client = get_client()
+        result = client.wait_for_refresh(
+            dataset_id, ingestion_id, timeout_seconds=timeout_seconds
+        )
+        return {
+            "dataset_id": dataset_id,
+            "ingestion_id": ingestion_id,
+            "status": result.get("status"),
+            "rows_ingested": result.get("row_count"),
+            "error": result.get("error"),
+            "timed_out": result.get("timed_out"),
+            "polls": result.get("polls"),
+        }
+
     @qs_tool(mcp, get_memory, read_only=True)
     def list_recent_refreshes(dataset_id: str, limit: int = 5) -> dict:
         """List recent SPICE refresh history for a dataset.
@@ -208,16 +409,52 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
 
         Useful for checking if a dataset is refreshing normally, diagnosing
         failures, or finding previous ingestion IDs.
+
+        Each refresh already carries its status, rows_ingested, and error,
+        so there is no need to call get_refresh_status for each one.
         """
         client = get_client()
         refreshes = client.list_recent_refreshes(dataset_id, limit=limit)
         return {
             "dataset_id": dataset_id,
             "count": len(refreshes),
-            "refreshes": refreshes,
+            "refreshes": [
+                {
+                    "ingestion_id": r.get("IngestionId"),
+                    "status": r.get("IngestionStatus"),
+                    "rows_ingested": (r.get("RowInfo") or {}).get("RowsIngested"),
+                    "error": r.get("ErrorInfo"),
+                    "created": r.get("CreatedTime"),
+                    "duration_seconds": r.get("IngestionTimeInSeconds"),
+                    "request_type": r.get("RequestType"),
+                }
+                for r in refreshes
+            ],
         }
 
-    @qs_tool(mcp, get_memory, destructive=True)
+    @qs_tool(mcp, get_memory, idempotent=True)
+    def clear_dataset_cache(dataset_id: Optional[str] = None) -> dict:
+        """Forget cached dataset listings, descriptions, and SQL.
+
+        Changes made through this server already refresh the cache. Call
+        this after a dataset was changed somewhere else (QuickSight
+        console, another tool) to read it fresh instead of waiting for
+        the cache to expire (up to 5 minutes).
+
+        Args:
+            dataset_id: Only forget this dataset's description and SQL.
+                        Omit to forget every dataset. The dataset list is
+                        cleared either way.
+        """
+        client = get_client()
+        client.clear_dataset_cache()
+        client.clear_dataset_details_cache(dataset_id)
+        return {
+            "status": "success",
+            "scope": dataset_id or "all",
+        }
+
+    @qs_tool(mcp, get_memory, destructive=True, input_model=CreateDatasetInput)
     def create_dataset(
         name: str, sql: str, data_source_arn: str, import_mode: str = "SPICE"
     ) -> dict:
@@ -266,13 +503,34 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
                 Obtain the current definition from get_dataset first.
 
         Use this for structural changes (adding joins, calculated columns,
-        changing column types) that go beyond simple SQL updates.
+        changing column types) that go beyond simple SQL updates. If the
+        definition matches the current dataset, nothing is written (no
+        backup) and status is "noop".
         """
+        definition = parse_json_arg(definition_json, "definition_json", dataset_id)
+        if not isinstance(definition, dict):
+            raise QSValidationError(
+                "definition_json must be a JSON object",
+                resource_id=dataset_id,
+            )
+        for key in ("PhysicalTableMap", "LogicalTableMap"):
+            if not definition.get(key):
+                raise QSValidationError(
+                    f"definition_json must include a non-empty {key}",
+                    resource_id=dataset_id,
+                )
+
         client = get_client()
-        definition = json.loads(definition_json)
-        client.update_dataset_definition(
+        result = client.update_dataset_definition(
             dataset_id, definition, backup_first=True
         )
+        if result.get("status") == "noop":
+            return {
+                "status": "noop",
+                "dataset_id": dataset_id,
+                "backup_created": False,
+                "note": "Definition matches the current dataset. Nothing was changed.",
+            }
         return {
             "status": "success",
             "dataset_id": dataset_id,
@@ -304,8 +562,10 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
             "note": "Ingestion cancelled. You can now trigger a new refresh.",
         }
 
-    @qs_tool(mcp, get_memory, destructive=True)
-    def modify_dataset_sql(dataset_id: str, find: str, replace: str) -> dict:
+    @qs_tool(mcp, get_memory, destructive=True, input_model=ModifyDatasetSqlInput)
+    def modify_dataset_sql(
+        dataset_id: str, find: str, replace: str, count: Optional[int] = None
+    ) -> dict:
         """Find and replace text in a dataset's SQL query.
 
         Convenience tool that reads the current SQL, applies a string
@@ -315,20 +575,22 @@ def register_dataset_tools(mcp: FastMCP, get_client: Callable, get_tracker: Call
             dataset_id: The QuickSight dataset ID.
             find: Exact text to search for in the current SQL.
             replace: Replacement text.
+            count: Replace only the first N occurrences. Omit to replace
+                   every occurrence.
 
         Raises an error if the find text is not present in the current SQL.
         After modifying a SPICE dataset, call refresh_dataset to reload data.
         """
         client = get_client()
         client.modify_dataset_sql(
-            dataset_id, find, replace, backup_first=True
+            dataset_id, find, replace, backup_first=True, count=count
         )
         return {
             "status": "success",
             "dataset_id": dataset_id,
             "backup_created": True,
-            "find": find[:100] + ("..." if len(find) > 100 else ""),
-            "replace": replace[:100] + ("..." if len(replace) > 100 else ""),
+            "find": _preview(find),
+            "replace": _preview(replace),
             "note": (
                 "SQL updated. If this is a SPICE dataset, call "
                 "refresh_dataset to reload data."
@@ -5,13 +5,14 @@ QuickSight analyses. Filter groups control what data is shown
 and can be scoped to specific sheets or visuals.
 """
 
-import json
 import logging
 from typing import Callable
 
 from fastmcp import FastMCP
 
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._json import parse_json_arg
+from quicksight_mcp.tools._models import AddFilterGroupInput
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ def register_filter_tools(
 ):
     """Register all filter-related MCP tools."""
 
-    @qs_tool(mcp, get_memory)
+    @qs_tool(mcp, get_memory, input_model=AddFilterGroupInput)
     def add_filter_group(analysis_id: str, filter_group_definition: str) -> dict:
         """Add a filter group to a QuickSight analysis.
 
@@ -50,7 +51,9 @@ def register_filter_tools(
         Returns confirmation with the filter group ID.
         """
         client = get_client()
-        parsed_def = json.loads(filter_group_definition) if isinstance(filter_group_definition, str) else filter_group_definition
+        parsed_def = parse_json_arg(
+            filter_group_definition, "filter_group_definition", analysis_id
+        )
         result = client.add_filter_group(analysis_id, parsed_def)
         return {
             "status": "success",
@@ -5,13 +5,14 @@ within QuickSight analyses. Parameters drive dynamic filters
 and controls in dashboards.
 """
 
-import json
 import logging
 from typing import Callable
 
 from fastmcp import FastMCP
 
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._json import parse_json_arg
+from quicksight_mcp.tools._models import AddParameterInput
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ def register_parameter_tools(
 ):
     """Register all parameter-related MCP tools."""
 
-    @qs_tool(mcp, get_memory)
+    @qs_tool(mcp, get_memory, input_model=AddParameterInput)
     def add_parameter(analysis_id: str, parameter_definition: str) -> dict:
         """Add a parameter to a QuickSight analysis.
 
@@ -46,7 +47,9 @@ def register_parameter_tools(
         Returns confirmation with the parameter name.
         """
         client = get_client()
-        parsed_def = json.loads(parameter_definition) if isinstance(parameter_definition, str) else parameter_definition
+        parsed_def = parse_json_arg(
+            parameter_definition, "parameter_definition", analysis_id
+        )
         result = client.add_parameter(analysis_id, parsed_def)
         return {
             "status": "success",
@@ -4,13 +4,13 @@ Provides tools for inspecting, adding, deleting visuals and
 managing their layout and titles within analyses.
 """
 
-import json
 import logging
 from typing import Callable
 
 from fastmcp import FastMCP
 
 from quicksight_mcp.tools._decorator import qs_tool
+from quicksight_mcp.tools._json import parse_json_arg
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ def register_visual_tools(mcp: FastMCP, get_client: Callable, get_tracker: Calla
         Returns confirmation with the visual ID.
         """
         client = get_client()
-        parsed_def = json.loads(visual_definition) if isinstance(visual_definition, str) else visual_definition
+        parsed_def = parse_json_arg(visual_definition, "visual_definition", analysis_id)
         result = client.add_visual_to_sheet(
             analysis_id, sheet_id, parsed_def
         )
@@ -200,7 +200,10 @@ def register_visual_tools(mcp: FastMCP, get_client: Callable, get_tracker: Calla
                 Leave empty for no conditional formatting.
         """
         client = get_client()
-        cf = json.loads(conditional_format) if conditional_format else None
+        cf = (
+            parse_json_arg(conditional_format, "conditional_format", analysis_id)
+            if conditional_format else None
+        )
         result = client.create_kpi(
             analysis_id, sheet_id, title, column, aggregation, dataset_identifier,
             format_string=format_string or None,
@@ -0,0 +1,14 @@
+"""Shared test helpers."""
+
+from unittest.mock import MagicMock
+
+
+def registered_tools(register, client):
+    """Register tools against a mock MCP and return them by name.
+
+    ``register`` is one of the ``register_*_tools`` functions; the tools
+    call ``client`` through their ``get_client`` callable.
+    """
+    mcp = MagicMock()
+    register(mcp, lambda: client, MagicMock())
+    return {c.args[0].__name__: c.args[0] for c in mcp.tool.call_args_list}
@@ -276,13 +276,13 @@ class TestE10MemoryLearning:
 class TestPydanticValidation:
     """Input validation catches bad inputs before they hit AWS."""
 
-    def test_sql_must_start_with_select(self):
+    def test_sql_must_not_be_blank(self):
         from quicksight_mcp.tools._models import UpdateDatasetSqlInput
 
         with pytest.raises(Exception):
             UpdateDatasetSqlInput(
                 dataset_id="ds-001",
-                new_sql="DROP TABLE foo",
+                new_sql="   ",
                 backup_first=True,
             )
 
@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock
 
+from tests.conftest import registered_tools
+
 
 class TestAnalysisClientInteractions:
     """Test analysis operations against the client mock."""
@@ -134,3 +136,116 @@ class TestAnalysisClientInteractions:
 
         with pytest.raises(Exception, match="Analysis not found"):
             self.mock_client.describe_analysis("bad-id")
+
+
+class TestGetColumnsUsedTool:
+    """Test the get_columns_used tool body."""
+
+    def setup_method(self):
+        from quicksight_mcp.tools.analyses import register_analysis_tools
+
+        self.client = MagicMock()
+        self.client.get_columns_used.return_value = {
+            "a": 1, "b": 5, "c": 3, "d": 2,
+        }
+        self.tools = registered_tools(register_analysis_tools, self.client)
+
+    def test_top_k_limits_columns(self):
+        result = self.tools["get_columns_used"](analysis_id="an-1", top_k=2)
+        assert list(result["columns"].items()) == [("b", 5), ("c", 3)]
+        assert result["unique_columns"] == 4
+
+    def test_top_k_zero_returns_all_sorted(self):
+        result = self.tools["get_columns_used"](analysis_id="an-1", top_k=0)
+        assert list(result["columns"]) == ["b", "c", "d", "a"]
+
+
+class TestDescribeAnalysisTool:
+    """Test the describe_analysis tool body."""
+
+    def test_sheet_summary_and_counts(self):
+        from quicksight_mcp.tools.analyses import register_analysis_tools
+
+        client = MagicMock()
+        client.get_analysis.return_value = {"Name": "Ops", "Status": "OK"}
+        client.get_analysis_definition.return_value = {
+            "Sheets": [
+                {"Name": "S1", "SheetId": "s1", "Visuals": [{}, {}]},
+                {"Name": "S2", "SheetId": "s2"},
+            ],
+            "CalculatedFields": [{}],
+        }
+        tools = registered_tools(register_analysis_tools, client)
+
+        result = tools["describe_analysis"](analysis_id="an-1")
+        assert result["sheets"] == [
+            {"name": "S1", "id": "s1", "visual_count": 2},
+            {"name": "S2", "id": "s2", "visual_count": 0},
+        ]
+        assert result["calculated_fields_count"] == 1
+        assert result["parameters_count"] == 0
+        assert result["dataset_identifiers"] == []
+
+
+class TestJsonArgumentTools:
+    """Test parsing of JSON-string definitions in analysis-editing tools."""
+
+    def test_filter_group_parsed(self):
+        from quicksight_mcp.tools.filters import register_filter_tools
+
+        client = MagicMock()
+        client.add_filter_group.return_value = {"filter_group_id": "fg-1"}
+        tools = registered_tools(register_filter_tools, client)
+
+        result = tools["add_filter_group"](
+            analysis_id="an-1", filter_group_definition='{"FilterGroupId": "fg-1"}',
+        )
+        assert result["filter_group_id"] == "fg-1"
+        client.add_filter_group.assert_called_once_with("an-1", {"FilterGroupId": "fg-1"})
+
+    def test_invalid_parameter_json_is_validation_error(self):
+        from quicksight_mcp.tools.parameters import register_parameter_tools
+
+        client = MagicMock()
+        tools = registered_tools(register_parameter_tools, client)
+
+        result = tools["add_parameter"](analysis_id="an-1", parameter_definition="{oops")
+        assert result["isError"] is True
+        assert result["error_type"] == "validation"
+        assert "parameter_definition is not valid JSON" in result["error"]
+        client.add_parameter.assert_not_called()
+
+    def test_oversized_definition_rejected_before_parsing(self):
+        from quicksight_mcp.tools._json import MAX_JSON_ARG_BYTES
+        from quicksight_mcp.tools.filters import register_filter_tools
+
+        client = MagicMock()
+        tools = registered_tools(register_filter_tools, client)
+
+        result = tools["add_filter_group"](
+            analysis_id="an-1",
+            filter_group_definition="[" + " " * MAX_JSON_ARG_BYTES + "]",
+        )
+        assert result["error_type"] == "validation"
+        assert "too large" in result["error"]
+        client.add_filter_group.assert_not_called()
+
+    def test_limit_counts_utf8_bytes_not_characters(self):
+        from quicksight_mcp.tools._json import MAX_JSON_ARG_BYTES, parse_json_arg
+        from quicksight_mcp.safety.exceptions import QSValidationError
+
+        # Half the limit in characters, twice the limit in bytes
+        value = '"' + "\U0001F600" * (MAX_JSON_ARG_BYTES // 2) + '"'
+        with pytest.raises(QSValidationError, match="too large"):
+            parse_json_arg(value, "filter_group_definition")
+        assert parse_json_arg('"\U0001F600"', "filter_group_definition") == "\U0001F600"
+
+    def test_missing_analysis_id_rejected(self):
+        from quicksight_mcp.tools.filters import register_filter_tools
+
+        client = MagicMock()
+        tools = registered_tools(register_filter_tools, client)
+
+        result = tools["add_filter_group"](analysis_id="", filter_group_definition="{}")
+        assert result["error_type"] == "validation"
+        client.add_filter_group.assert_not_called()
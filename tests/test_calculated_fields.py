@@ -0,0 +1,104 @@
+"""Test calculated field tools."""
+
+from unittest.mock import MagicMock
+
+from quicksight_mcp.tools.calculated_fields import register_calculated_field_tools
+from tests.conftest import registered_tools
+
+
+class TestGetCalculatedFields:
+    """Test the batched get_calculated_fields tool."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.fields = {
+            "Margin": {"Name": "Margin", "Expression": "{a} - {b}"},
+            "Rate": {"Name": "Rate", "Expression": "{a} / {b}"},
+        }
+        self.client.get_calculated_field.side_effect = (
+            lambda analysis_id, name: self.fields.get(name)
+        )
+        self.tools = registered_tools(register_calculated_field_tools, self.client)
+
+    def test_splits_found_and_missing(self):
+        result = self.tools["get_calculated_fields"](
+            analysis_id="an-1", names=["Rate", "Nope", "Margin"]
+        )
+        assert result["found"] == ["Rate", "Margin"]
+        assert result["missing"] == ["Nope"]
+        assert result["fields"]["Rate"]["Expression"] == "{a} / {b}"
+
+    def test_empty_names_rejected(self):
+        result = self.tools["get_calculated_fields"](analysis_id="an-1", names=[])
+        assert result["error_type"] == "validation"
+        self.client.get_calculated_field.assert_not_called()
+
+
+class TestCalculatedFieldWrites:
+    """Test no-op handling in add/update tools."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.tools = registered_tools(register_calculated_field_tools, self.client)
+
+    def test_update_noop(self):
+        self.client.update_calculated_field.return_value = {"status": "noop"}
+        result = self.tools["update_calculated_field"](
+            analysis_id="an-1", name="Rate", new_expression="{a} / {b}"
+        )
+        assert result["status"] == "noop"
+
+    def test_update_success(self):
+        self.client.update_calculated_field.return_value = {
+            "status": "UPDATE_SUCCESSFUL"
+        }
+        result = self.tools["update_calculated_field"](
+            analysis_id="an-1", name="Rate", new_expression="{a} * 2"
+        )
+        assert result["status"] == "success"
+
+    def test_add_existing_identical(self):
+        self.client.add_calculated_field.return_value = {"status": "exists"}
+        result = self.tools["add_calculated_field"](
+            analysis_id="an-1", name="Rate", expression="{a} / {b}",
+            dataset_identifier="ds1",
+        )
+        assert result["status"] == "exists"
+
+
+class TestBatchUpdateCalculatedFields:
+    """Test the batch_update_calculated_fields tool."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.tools = registered_tools(register_calculated_field_tools, self.client)
+
+    def test_passes_operations_and_reports_results(self):
+        ops = [
+            {"action": "update", "name": "Rate", "expression": "{a} * 2"},
+            {"action": "delete", "name": "Old"},
+        ]
+        self.client.batch_update_calculated_fields.return_value = {
+            "analysis_id": "an-1",
+            "results": [
+                {"name": "Rate", "action": "update", "status": "updated"},
+                {"name": "Old", "action": "delete", "status": "deleted"},
+            ],
+            "update": {"status": "UPDATE_SUCCESSFUL"},
+        }
+        result = self.tools["batch_update_calculated_fields"](
+            analysis_id="an-1", operations=ops
+        )
+        self.client.batch_update_calculated_fields.assert_called_once_with(
+            "an-1", ops
+        )
+        assert result["status"] == "success"
+        assert [r["status"] for r in result["results"]] == ["updated", "deleted"]
+
+    def test_add_without_dataset_rejected(self):
+        result = self.tools["batch_update_calculated_fields"](
+            analysis_id="an-1",
+            operations=[{"action": "add", "name": "X", "expression": "1"}],
+        )
+        assert result["error_type"] == "validation"
+        self.client.batch_update_calculated_fields.assert_not_called()
@@ -296,3 +296,38 @@ class TestAwsClient:
             "list_data_sets", AwsAccountId="123"
         )
         assert result["DataSetSummaries"][0]["Name"] == "test"
+
+
+class TestVisualIndex:
+    """VisualService looks visuals up through a per-definition index."""
+
+    def _make_service(self, definitions):
+        from quicksight_mcp.services.visuals import VisualService
+
+        analyses = MagicMock()
+        analyses.get_definition.side_effect = definitions
+        return VisualService(MagicMock(), TTLCache(), analyses)
+
+    @staticmethod
+    def _definition(*visual_ids):
+        return {
+            "Sheets": [{
+                "SheetId": "s1",
+                "Visuals": [
+                    {"KPIVisual": {"VisualId": vid}} for vid in visual_ids
+                ],
+            }],
+        }
+
+    def test_index_reused_for_same_definition(self):
+        definition = self._definition("v1", "v2")
+        svc = self._make_service([definition, definition])
+        assert svc.get_definition("a1", "v2") == {"KPIVisual": {"VisualId": "v2"}}
+        with patch.object(svc, "_build_index") as build:
+            assert svc.get_definition("a1", "v1") is not None
+            build.assert_not_called()
+
+    def test_index_rebuilt_when_definition_refetched(self):
+        svc = self._make_service([self._definition("v1"), self._definition()])
+        assert svc.get_definition("a1", "v1") is not None
+        assert svc.get_definition("a1", "v1") is None
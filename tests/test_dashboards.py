@@ -0,0 +1,119 @@
+"""Test dashboard tools."""
+
+import threading
+from unittest.mock import MagicMock
+
+from quicksight_mcp.tools.dashboards import register_dashboard_tools
+from tests.conftest import registered_tools
+
+
+class TestListDashboards:
+    """Test the list_dashboards tool."""
+
+    def test_projects_summary_fields(self):
+        client = MagicMock()
+        client.list_dashboards.return_value = [
+            {"Name": "Ops", "DashboardId": "db-1", "PublishedVersionNumber": 7},
+            {"Name": "Draft", "DashboardId": "db-2"},
+        ]
+        result = registered_tools(register_dashboard_tools, client)["list_dashboards"]()
+        assert result["count"] == 2
+        assert result["has_more"] is False
+        assert result["dashboards"] == [
+            {"name": "Ops", "id": "db-1", "published_version": 7},
+            {"name": "Draft", "id": "db-2", "published_version": None},
+        ]
+
+
+    def test_pages_through_cached_list(self):
+        client = MagicMock()
+        client.list_dashboards.return_value = [
+            {"Name": f"D{i}", "DashboardId": f"db-{i}"} for i in range(5)
+        ]
+        tools = registered_tools(register_dashboard_tools, client)
+
+        first = tools["list_dashboards"](limit=2)
+        assert [d["id"] for d in first["dashboards"]] == ["db-0", "db-1"]
+        assert first["total_count"] == 5
+        assert first["next_offset"] == 2
+
+        last = tools["list_dashboards"](limit=2, offset=4)
+        assert [d["id"] for d in last["dashboards"]] == ["db-4"]
+        assert last["has_more"] is False
+        assert "next_offset" not in last
+
+
+class TestSearchDashboards:
+    """Test the search_dashboards tool."""
+
+    def test_limit_reports_more_matches(self):
+        client = MagicMock()
+        client.search_dashboards.return_value = [
+            {"Name": f"Sales {i}", "DashboardId": f"db-{i}"} for i in range(3)
+        ]
+        result = registered_tools(register_dashboard_tools, client)["search_dashboards"](
+            name="sales", limit=2
+        )
+        client.search_dashboards.assert_called_once_with("sales", limit=3)
+        assert result["count"] == 2
+        assert result["has_more"] is True
+
+
+class TestGetDashboardVersions:
+    """Test the get_dashboard_versions tool."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.tools = registered_tools(register_dashboard_tools, self.client)
+
+    def test_combines_versions_and_current(self):
+        self.client.get_dashboard_versions.return_value = [
+            {"VersionNumber": 3}, {"VersionNumber": 2},
+        ]
+        self.client.get_current_dashboard_version.return_value = {
+            "version_number": 3, "status": "CREATION_SUCCESSFUL",
+        }
+        result = self.tools["get_dashboard_versions"](dashboard_id="db-1", limit=2)
+        assert result["current_version"] == 3
+        assert result["version_count"] == 2
+        self.client.get_dashboard_versions.assert_called_once_with("db-1", limit=2)
+
+    def test_lookups_run_concurrently(self):
+        # Each call waits for the other; a serial implementation would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def versions(dashboard_id, limit):
+            barrier.wait()
+            return []
+
+        def current(dashboard_id):
+            barrier.wait()
+            return {"version_number": 1}
+
+        self.client.get_dashboard_versions.side_effect = versions
+        self.client.get_current_dashboard_version.side_effect = current
+        result = self.tools["get_dashboard_versions"](dashboard_id="db-1")
+        assert result["current_version"] == 1
+
+    def test_client_error_surfaces(self):
+        self.client.get_dashboard_versions.side_effect = RuntimeError("boom")
+        self.client.get_current_dashboard_version.return_value = {}
+        result = self.tools["get_dashboard_versions"](dashboard_id="db-1")
+        assert result["isError"] is True
+        assert result["error"] == "boom"
+
+
+class TestDashboardWrites:
+    """Test publish/rollback tool responses."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.tools = registered_tools(register_dashboard_tools, self.client)
+
+    def test_rollback_reports_retries(self):
+        self.client.rollback_dashboard.return_value = {"retried": 2}
+        result = self.tools["rollback_dashboard"](
+            dashboard_id="db-1", version_number=4
+        )
+        assert result["status"] == "rolled_back"
+        assert result["retried"] == 2
@@ -3,6 +3,9 @@
 from unittest.mock import MagicMock
 from fastmcp import FastMCP
 
+from quicksight_mcp.tools.datasets import register_dataset_tools
+from tests.conftest import registered_tools
+
 
 class TestDatasetToolRegistration:
     """Test that dataset tools register correctly."""
@@ -144,3 +147,433 @@ class TestDatasetClientInteractions:
         result = self.mock_client.get_dataset("ds-001")
         assert result["Name"] == "My Dataset"
         assert len(result["OutputColumns"]) == 2
+
+
+class TestListDatasetsPrefetch:
+    """Test list_datasets with prefetch_details."""
+
+    def setup_method(self):
+        self.client = MagicMock()
+        self.client.list_datasets.return_value = [
+            {"Name": "Sales", "DataSetId": "ds-1", "ImportMode": "SPICE"},
+            {"Name": "Costs", "DataSetId": "ds-2", "ImportMode": "SPICE"},
+        ]
+        self.tools = registered_tools(register_dataset_tools, self.client)
+
+    def test_default_skips_describe(self):
+        result = self.tools["list_datasets"]()
+        assert result["count"] == 2
+        assert "output_columns" not in result["datasets"][0]
+        self.client.get_dataset.assert_not_called()
+
+    def test_prefetch_attaches_details_in_order(self):
+        def describe(dataset_id):
+            if dataset_id == "ds-2":
+                raise RuntimeError("AccessDenied")
+            return {
+                "PhysicalTableMap": {"t1": {}},
+                "OutputColumns": [{"Name": "amount", "Type": "DECIMAL"}],
+            }
+
+        self.client.get_dataset.side_effect = describe
+        result = self.tools["list_datasets"](prefetch_details=True)
+        first, second = result["datasets"]
+        assert first["id"] == "ds-1"
+        assert first["physical_table_count"] == 1
+        assert first["output_columns"] == [{"name": "amount", "type": "DECIMAL"}]
+        assert second["id"] == "ds-2"
+        assert second["error"] == "AccessDenied"
+        assert "output_columns" not in second
+
+    def test_pages_and_prefetches_only_the_page(self):
+        self.client.list_datasets.return_value = [
+            {"Name": f"D{i}", "DataSetId": f"ds-{i}"} for i in range(5)
+        ]
+        self.client.get_dataset.return_value = {"PhysicalTableMap": {}}
+
+        first = self.tools["list_datasets"](limit=2, prefetch_details=True)
+        assert [d["id"] for d in first["datasets"]] == ["ds-0", "ds-1"]
+        assert first["total_count"] == 5
+        assert first["next_offset"] == 2
+        assert self.client.get_dataset.call_count == 2
+
+        last = self.tools["list_datasets"](limit=2, offset=4)
+        assert [d["id"] for d in last["datasets"]] == ["ds-4"]
+        assert last["has_more"] is False
+
+
+class TestWaitForRefreshTool:
+    """Test the wait_for_refresh tool."""
+
+    def test_projects_status_fields(self):
+        client = MagicMock()
+        client.wait_for_refresh.return_value = {
+            "status": "COMPLETED", "row_count": 10, "error": None,
+            "polls": 4, "timed_out": False,
+        }
+        result = registered_tools(register_dataset_tools, client)["wait_for_refresh"](
+            dataset_id="ds-1", ingestion_id="ing-1", timeout_seconds=60,
+        )
+        client.wait_for_refresh.assert_called_once_with(
+            "ds-1", "ing-1", timeout_seconds=60,
+        )
+        assert result["status"] == "COMPLETED"
+        assert result["rows_ingested"] == 10
+        assert result["polls"] == 4
+
+    def test_rejects_out_of_range_timeout(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["wait_for_refresh"](
+            dataset_id="ds-1", ingestion_id="ing-1", timeout_seconds=0,
+        )
+        assert result["isError"] is True
+        client.wait_for_refresh.assert_not_called()
+
+
+class TestListRecentRefreshes:
+    """Test the list_recent_refreshes tool."""
+
+    def test_status_fields_come_from_the_listing(self):
+        client = MagicMock()
+        client.list_recent_refreshes.return_value = [
+            {
+                "IngestionId": "ing-2",
+                "IngestionStatus": "FAILED",
+                "ErrorInfo": {"Type": "SQL_EXCEPTION", "Message": "bad"},
+                "CreatedTime": "2024-01-02",
+                "RequestType": "FULL_REFRESH",
+            },
+            {
+                "IngestionId": "ing-1",
+                "IngestionStatus": "COMPLETED",
+                "RowInfo": {"RowsIngested": 120},
+                "IngestionTimeInSeconds": 35,
+            },
+        ]
+        result = registered_tools(register_dataset_tools, client)["list_recent_refreshes"](
+            dataset_id="ds-1", limit=2,
+        )
+        failed, done = result["refreshes"]
+        assert failed["status"] == "FAILED"
+        assert failed["error"]["Type"] == "SQL_EXCEPTION"
+        assert failed["rows_ingested"] is None
+        assert done["rows_ingested"] == 120
+        assert done["duration_seconds"] == 35
+        client.get_refresh_status.assert_not_called()
+
+
+class TestSearchDatasetsTool:
+    """Test search_datasets paging."""
+
+    def test_pages_through_matches(self):
+        client = MagicMock()
+        client.search_datasets.return_value = [
+            {"Name": f"wbr {i}", "DataSetId": f"ds-{i}"} for i in range(3)
+        ]
+        tools = registered_tools(register_dataset_tools, client)
+
+        first = tools["search_datasets"](name="wbr", limit=2)
+        assert first["query"] == "wbr"
+        assert [d["id"] for d in first["datasets"]] == ["ds-0", "ds-1"]
+        assert first["total_count"] == 3
+        assert first["next_offset"] == 2
+
+        last = tools["search_datasets"](name="wbr", limit=2, offset=2)
+        assert [d["id"] for d in last["datasets"]] == ["ds-2"]
+        assert last["has_more"] is False
+
+
+class TestGetDatasetTool:
+    """Test the get_dataset tool."""
+
+    def _client(self, column_count):
+        client = MagicMock()
+        client.get_dataset.return_value = {
+            "Name": "Wide",
+            "OutputColumns": [
+                {"Name": f"c{i}", "Type": "STRING" if i % 3 else "INTEGER"}
+                for i in range(column_count)
+            ],
+        }
+        return client
+
+    def test_narrow_dataset_lists_every_column(self):
+        tools = registered_tools(register_dataset_tools, self._client(3))
+        result = tools["get_dataset"](dataset_id="ds-1")
+        assert result["total_columns"] == 3
+        assert len(result["output_columns"]) == 3
+        assert "columns_truncated" not in result
+
+    def test_wide_dataset_is_capped_with_type_counts(self):
+        result = registered_tools(register_dataset_tools, self._client(9))["get_dataset"](
+            dataset_id="ds-1", max_columns=4,
+        )
+        assert [c["name"] for c in result["output_columns"]] == ["c0", "c1", "c2", "c3"]
+        assert result["total_columns"] == 9
+        assert result["columns_truncated"] is True
+        assert result["column_types"] == {"INTEGER": 3, "STRING": 6}
+
+    def test_rejects_non_positive_cap(self):
+        client = self._client(3)
+        result = registered_tools(register_dataset_tools, client)["get_dataset"](
+            dataset_id="ds-1", max_columns=0,
+        )
+        assert result["isError"] is True
+        client.get_dataset.assert_not_called()
+
+
+class TestGetDatasetsTool:
+    """Test the get_datasets batch tool."""
+
+    def test_describes_each_once_in_order(self):
+        client = MagicMock()
+
+        def describe(dataset_id):
+            if dataset_id == "ds-bad":
+                raise RuntimeError("AccessDenied")
+            return {"Name": dataset_id.upper(), "PhysicalTableMap": {"t": {}}}
+
+        client.get_dataset.side_effect = describe
+        result = registered_tools(register_dataset_tools, client)["get_datasets"](
+            dataset_ids=["ds-2", "ds-bad", "ds-1", "ds-2"],
+        )
+        assert [d["dataset_id"] for d in result["datasets"]] == ["ds-2", "ds-1"]
+        assert result["datasets"][0]["name"] == "DS-2"
+        assert result["datasets"][0]["physical_table_count"] == 1
+        assert result["errors"] == {"ds-bad": "AccessDenied"}
+        assert client.get_dataset.call_count == 3
+        assert "sql" not in result["datasets"][0]
+        client.get_dataset_sql.assert_not_called()
+
+    def test_include_sql(self):
+        client = MagicMock()
+        client.get_dataset.return_value = {"Name": "orders"}
+        client.get_dataset_sql.side_effect = lambda ds: f"SELECT '{ds}'"
+        result = registered_tools(register_dataset_tools, client)["get_datasets"](
+            dataset_ids=["ds-1", "ds-2"], include_sql=True,
+        )
+        assert [d["sql"] for d in result["datasets"]] == [
+            "SELECT 'ds-1'", "SELECT 'ds-2'",
+        ]
+
+    def test_rejects_empty_list(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["get_datasets"](dataset_ids=[])
+        assert result["isError"] is True
+
+
+class TestUpdateDatasetSqlTool:
+    """Test update_dataset_sql input validation."""
+
+    def test_rejects_blank_sql_before_any_call(self):
+        client = MagicMock()
+        tool = registered_tools(register_dataset_tools, client)["update_dataset_sql"]
+        for sql in ("", "   ", "\n\t"):
+            result = tool(dataset_id="ds-1", new_sql=sql)
+            assert result["error_type"] == "validation"
+            assert "\n" not in result["error"]
+            assert "errors.pydantic.dev" not in result["error"]
+        client.update_dataset_sql.assert_not_called()
+
+    def test_sql_starting_with_comment_or_parenthesis_forwarded(self):
+        client = MagicMock()
+        tool = registered_tools(register_dataset_tools, client)["update_dataset_sql"]
+        for sql in (
+            "-- weekly rollup\nSELECT 1",
+            "/* weekly rollup */ SELECT 1",
+            "(SELECT 1) UNION ALL (SELECT 2)",
+        ):
+            result = tool(dataset_id="ds-1", new_sql=sql)
+            assert result["status"] == "success"
+            client.update_dataset_sql.assert_called_with(
+                "ds-1", sql, backup_first=True
+            )
+
+    def test_valid_sql_forwarded(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_sql"](
+            dataset_id="ds-1", new_sql="WITH a AS (SELECT 1) SELECT * FROM a",
+        )
+        assert result["status"] == "success"
+        client.update_dataset_sql.assert_called_once_with(
+            "ds-1", "WITH a AS (SELECT 1) SELECT * FROM a", backup_first=True
+        )
+
+
+class TestClearDatasetCacheTool:
+    """Test the clear_dataset_cache tool."""
+
+    def test_clears_list_and_one_dataset(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["clear_dataset_cache"](
+            dataset_id="ds-1",
+        )
+        assert result == {"status": "success", "scope": "ds-1"}
+        client.clear_dataset_cache.assert_called_once_with()
+        client.clear_dataset_details_cache.assert_called_once_with("ds-1")
+
+    def test_clears_everything_by_default(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["clear_dataset_cache"]()
+        assert result["scope"] == "all"
+        client.clear_dataset_details_cache.assert_called_once_with(None)
+
+
+class TestUpdateDatasetDefinitionTool:
+    """Test the update_dataset_definition tool."""
+
+    def test_parses_and_forwards_definition(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_definition"](
+            dataset_id="ds-1",
+            definition_json='{"PhysicalTableMap": {"t": {}}, "LogicalTableMap": {"l": {}}}',
+        )
+        assert result["status"] == "success"
+        client.update_dataset_definition.assert_called_once_with(
+            "ds-1",
+            {"PhysicalTableMap": {"t": {}}, "LogicalTableMap": {"l": {}}},
+            backup_first=True,
+        )
+
+    def test_rejects_missing_map_without_calling_client(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_definition"](
+            dataset_id="ds-1", definition_json='{"PhysicalTableMap": {"t": {}}}',
+        )
+        assert result["isError"] is True
+        assert result["error_type"] == "validation"
+        assert "LogicalTableMap" in result["error"]
+        client.update_dataset_definition.assert_not_called()
+
+    def test_rejects_map_only_nested_or_in_a_string(self):
+        client = MagicMock()
+        tool = registered_tools(register_dataset_tools, client)["update_dataset_definition"]
+        for definition_json in (
+            '{"PhysicalTableMap": {"t": {"LogicalTableMap": {"l": {}}}}}',
+            '{"PhysicalTableMap": {"t": {}}, "Name": "\\"LogicalTableMap\\""}',
+            '["PhysicalTableMap", "LogicalTableMap"]',
+        ):
+            result = tool(dataset_id="ds-1", definition_json=definition_json)
+            assert result["error_type"] == "validation"
+        client.update_dataset_definition.assert_not_called()
+
+    def test_accepts_escaped_keys(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_definition"](
+            dataset_id="ds-1",
+            definition_json='{"PhysicalTableMap": {"t": {}}, "Logical\\u0054ableMap": {"l": {}}}',
+        )
+        assert result["status"] == "success"
+        client.update_dataset_definition.assert_called_once()
+
+    def test_rejects_invalid_json(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_definition"](
+            dataset_id="ds-1",
+            definition_json='{"PhysicalTableMap": {}, "LogicalTableMap": ',
+        )
+        assert result["error_type"] == "validation"
+        client.update_dataset_definition.assert_not_called()
+
+    def test_rejects_oversized_definition(self):
+        from quicksight_mcp.tools._json import MAX_JSON_ARG_BYTES
+
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["update_dataset_definition"](
+            dataset_id="ds-1",
+            definition_json='{"PhysicalTableMap": {}, "LogicalTableMap": {}}'
+            + " " * MAX_JSON_ARG_BYTES,
+        )
+        assert result["error_type"] == "validation"
+        assert "too large" in result["error"]
+        client.update_dataset_definition.assert_not_called()
+
+
+class TestModifyDatasetSqlTool:
+    """Test the modify_dataset_sql tool."""
+
+    def test_echoes_short_text_and_clips_long_text(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["modify_dataset_sql"](
+            dataset_id="ds-1", find="status = 'a'", replace="x" * 150,
+        )
+        client.modify_dataset_sql.assert_called_once_with(
+            "ds-1", "status = 'a'", "x" * 150, backup_first=True, count=None,
+        )
+        assert result["find"] == "status = 'a'"
+        assert result["replace"] == "x" * 100 + "..."
+
+    def test_rejects_empty_find(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["modify_dataset_sql"](
+            dataset_id="ds-1", find="", replace="x",
+        )
+        assert result["error_type"] == "validation"
+        client.modify_dataset_sql.assert_not_called()
+
+
+class TestCreateDatasetTool:
+    """Test create_dataset input validation."""
+
+    ARN = "arn:aws:quicksight:us-east-1:123456789012:datasource/snowflake-prod"
+
+    def test_valid_input_reaches_client(self):
+        client = MagicMock()
+        client.create_dataset.return_value = "ds-new"
+        result = registered_tools(register_dataset_tools, client)["create_dataset"](
+            name="Orders", sql="SELECT 1", data_source_arn=self.ARN,
+        )
+        assert result["dataset_id"] == "ds-new"
+        client.create_dataset.assert_called_once()
+
+    def test_bad_import_mode_rejected_locally(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["create_dataset"](
+            name="Orders", sql="SELECT 1", data_source_arn=self.ARN,
+            import_mode="Spice",
+        )
+        assert result["error_type"] == "validation"
+        client.create_dataset.assert_not_called()
+
+    def test_bad_arn_rejected_locally(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["create_dataset"](
+            name="Orders", sql="SELECT 1", data_source_arn="snowflake-prod",
+        )
+        assert result["error_type"] == "validation"
+        client.create_dataset.assert_not_called()
+
+
+class TestGetRefreshStatusesTool:
+    """Test the get_refresh_statuses batch tool."""
+
+    def test_checks_each_in_order(self):
+        client = MagicMock()
+
+        def status(dataset_id, ingestion_id):
+            if ingestion_id == "ing-bad":
+                raise RuntimeError("ResourceNotFoundException")
+            return {"status": "COMPLETED", "row_count": 5, "error": None}
+
+        client.get_refresh_status.side_effect = status
+        tools = registered_tools(register_dataset_tools, client)
+        result = tools["get_refresh_statuses"](ingestions=[
+            {"dataset_id": "ds-1", "ingestion_id": "ing-1"},
+            {"dataset_id": "ds-2", "ingestion_id": "ing-bad"},
+        ])
+        ok, bad = result["statuses"]
+        assert ok == {
+            "dataset_id": "ds-1", "ingestion_id": "ing-1",
+            "status": "COMPLETED", "rows_ingested": 5, "error": None,
+        }
+        assert bad["status"] is None
+        assert bad["error"] == "ResourceNotFoundException"
+        assert result["count"] == 2
+
+    def test_rejects_entries_missing_ids(self):
+        client = MagicMock()
+        result = registered_tools(register_dataset_tools, client)["get_refresh_statuses"](
+            ingestions=[{"dataset_id": "ds-1"}],
+        )
+        assert result["isError"] is True
+        client.get_refresh_status.assert_not_called()
@@ -1,7 +1,12 @@
 """Tests for the @qs_tool decorator with structured logging + brain integration."""
 
+import threading
 from unittest.mock import MagicMock
 
+import pytest
+from pydantic import ValidationError
+
+from quicksight_mcp.tools import _recorder
 from quicksight_mcp.tools._decorator import qs_tool, _truncate_response
 from quicksight_mcp.safety.exceptions import QSAuthError, QSNotFoundError
 
@@ -30,6 +35,7 @@ class TestQsToolDecorator:
             return {"data": [1, 2, 3]}
 
         my_tool()
+        _recorder.drain()
         memory.record_call.assert_called_once()
         args = memory.record_call.call_args
         assert args[0][0] == "my_tool"  # tool_name
@@ -71,6 +77,7 @@ class TestQsToolDecorator:
             raise QSNotFoundError("Dataset", "ds-123")
 
         my_tool()
+        _recorder.drain()
         memory.record_call.assert_called_once()
         args = memory.record_call.call_args
         assert args[0][3] is False  # success=False
@@ -151,6 +158,7 @@ class TestQsToolDecorator:
 
         my_tool(analysis_id="a-789")
         # Verify memory was called with the error
+        _recorder.drain()
         memory.record_call.assert_called_once()
 
     def test_resource_id_extracted_from_dashboard_id(self):
@@ -164,6 +172,7 @@ class TestQsToolDecorator:
             return {"id": dashboard_id}
 
         my_tool(dashboard_id="d-456")
+        _recorder.drain()
         memory.record_call.assert_called_once()
 
     def test_no_resource_id_does_not_error(self):
@@ -178,6 +187,7 @@ class TestQsToolDecorator:
 
         result = my_tool()
         assert result == {"status": "ok"}
+        _recorder.drain()
         memory.record_call.assert_called_once()
 
     def test_json_decode_error_caught_by_decorator(self):
@@ -208,6 +218,179 @@ class TestQsToolDecorator:
         if call_args.kwargs.get("annotations"):
             assert call_args.kwargs["annotations"]["destructiveHint"] is True
 
+    def test_input_model_rejects_invalid_kwargs(self):
+        """input_model validation failures become structured validation errors."""
+        from quicksight_mcp.tools._models import RefreshStatusInput
+
+        mcp = MagicMock()
+        called = []
+
+        @qs_tool(mcp, None, input_model=RefreshStatusInput)
+        def my_tool(dataset_id: str = "", ingestion_id: str = "") -> dict:
+            called.append(True)
+            return {}
+
+        result = my_tool(dataset_id="", ingestion_id="ing-1")
+        assert result["isError"] is True
+        assert result["error_type"] == "validation"
+        assert called == []
+
+    def test_input_model_error_is_one_line_with_resource_id(self):
+        from quicksight_mcp.tools._models import RefreshStatusInput
+
+        mcp = MagicMock()
+        memory = MagicMock()
+        memory.get_recovery_suggestions = MagicMock(return_value=[])
+
+        @qs_tool(mcp, lambda: memory, input_model=RefreshStatusInput)
+        def my_tool(dataset_id: str = "", ingestion_id: str = "") -> dict:
+            return {}
+
+        result = my_tool(dataset_id="ds-1", ingestion_id="")
+        assert result["error"].startswith("ingestion_id: ")
+        assert "\n" not in result["error"]
+        assert "errors.pydantic.dev" not in result["error"]
+        memory.get_recovery_suggestions.assert_called_once_with("ds-1", "validation")
+
+    def test_input_model_accepts_valid_kwargs(self):
+        from quicksight_mcp.tools._models import RefreshStatusInput
+
+        mcp = MagicMock()
+
+        @qs_tool(mcp, None, input_model=RefreshStatusInput)
+        def my_tool(dataset_id: str = "", ingestion_id: str = "") -> dict:
+            return {"id": dataset_id}
+
+        assert my_tool(dataset_id="ds-1", ingestion_id="ing-1") == {"id": "ds-1"}
+
+
+class TestAwsErrors:
+    """Tests for structured AWS error responses and throttle backoff."""
+
+    def setup_method(self):
+        from quicksight_mcp.tools import _decorator
+
+        _decorator._backoff.clear()
+
+    @staticmethod
+    def _client_error(code: str) -> Exception:
+        from botocore.exceptions import ClientError
+
+        return ClientError({"Error": {"Code": code, "Message": "nope"}}, "DescribeDataSet")
+
+    def test_client_error_carries_code(self):
+        mcp = MagicMock()
+
+        @qs_tool(mcp, None)
+        def my_tool(dataset_id: str = "") -> dict:
+            raise self._client_error("AccessDeniedException")
+
+        result = my_tool(dataset_id="ds-1")
+        assert result["error_type"] == "api_error"
+        assert result["error_code"] == "AccessDeniedException"
+
+    def test_throttle_backs_off_per_resource(self):
+        mcp = MagicMock()
+        calls = []
+
+        @qs_tool(mcp, None)
+        def my_tool(dataset_id: str = "") -> dict:
+            calls.append(dataset_id)
+            if dataset_id == "ds-1":
+                raise self._client_error("ThrottlingException")
+            return {"ok": True}
+
+        first = my_tool(dataset_id="ds-1")
+        assert first["error_type"] == "rate_limited"
+        assert first["error_code"] == "ThrottlingException"
+        assert first["retry_after_s"] == 2.0
+
+        # Inside the window the call is answered without running the tool
+        again = my_tool(dataset_id="ds-1")
+        assert again["error_type"] == "rate_limited"
+        assert again["retry_after_s"] > 0
+        assert calls == ["ds-1"]
+
+        # Other resources are unaffected
+        assert my_tool(dataset_id="ds-2") == {"ok": True}
+
+    def test_throttle_without_resource_does_not_back_off(self):
+        mcp = MagicMock()
+        calls = []
+
+        @qs_tool(mcp, None)
+        def list_things() -> dict:
+            calls.append(True)
+            if len(calls) == 1:
+                raise self._client_error("ThrottlingException")
+            return {"ok": True}
+
+        assert list_things()["error_type"] == "rate_limited"
+        assert list_things() == {"ok": True}
+        assert len(calls) == 2
+
+    def test_invalid_input_reported_while_backing_off(self):
+        from quicksight_mcp.tools import _decorator
+        from quicksight_mcp.tools._models import RefreshStatusInput
+
+        mcp = MagicMock()
+
+        @qs_tool(mcp, None, input_model=RefreshStatusInput)
+        def my_tool(dataset_id: str = "", ingestion_id: str = "") -> dict:
+            return {}
+
+        _decorator._start_backoff(("my_tool", "ds-1"))
+        result = my_tool(dataset_id="ds-1", ingestion_id="")
+        assert result["error_type"] == "validation"
+
+    def test_backoff_doubles_and_clears_on_success(self):
+        from quicksight_mcp.tools import _decorator
+
+        mcp = MagicMock()
+        fail = [True]
+
+        @qs_tool(mcp, None)
+        def my_tool(dataset_id: str = "") -> dict:
+            if fail[0]:
+                raise self._client_error("ThrottlingException")
+            return {"ok": True}
+
+        key = ("my_tool", "ds-1")
+        my_tool(dataset_id="ds-1")
+        _decorator._backoff[key] = (0.0, _decorator._backoff[key][1])
+        assert my_tool(dataset_id="ds-1")["retry_after_s"] == 4.0
+
+        _decorator._backoff[key] = (0.0, _decorator._backoff[key][1])
+        fail[0] = False
+        assert my_tool(dataset_id="ds-1") == {"ok": True}
+        assert key not in _decorator._backoff
+
+
+class TestValidateHelper:
+    """Tests for the cached TypeAdapter validator."""
+
+    def test_adapter_is_cached_per_model(self):
+        from quicksight_mcp.tools._models import _ADAPTERS, DatasetIdInput, validate
+
+        validate(DatasetIdInput, {"dataset_id": "ds-1"})
+        adapter = _ADAPTERS[DatasetIdInput]
+        model = validate(DatasetIdInput, {"dataset_id": "ds-2"})
+        assert _ADAPTERS[DatasetIdInput] is adapter
+        assert model.dataset_id == "ds-2"
+
+    def test_extra_fields_still_rejected(self):
+        from quicksight_mcp.tools._models import DatasetIdInput, validate
+
+        with pytest.raises(ValidationError):
+            validate(DatasetIdInput, {"dataset_id": "ds-1", "bogus": 1})
+
+    def test_validated_models_are_frozen(self):
+        from quicksight_mcp.tools._models import DatasetIdInput, validate
+
+        model = validate(DatasetIdInput, {"dataset_id": "ds-1"})
+        with pytest.raises(ValidationError):
+            model.dataset_id = "ds-2"
+
 
 class TestTruncateResponse:
     """Tests for response truncation."""
@@ -220,13 +403,13 @@ class TestTruncateResponse:
         assert _truncate_response("hello", "test") == "hello"
 
     def test_large_response_truncated(self):
-        result = {"items": list(range(5000))}
+        result = {"items": list(range(10000))}
         truncated = _truncate_response(result, "test")
         assert truncated.get("_truncated") is True
-        assert len(truncated["items"]) < 5000
+        assert len(truncated["items"]) < 10000
 
     def test_truncation_note_present(self):
-        result = {"items": list(range(5000))}
+        result = {"items": list(range(10000))}
         truncated = _truncate_response(result, "test")
         assert "_note" in truncated
         assert "25000" in truncated["_note"] or "truncated" in truncated["_note"]
@@ -237,3 +420,38 @@ class TestTruncateResponse:
         truncated = _truncate_response(result, "test")
         # Should still have _truncated flag even if it can't shrink lists
         assert isinstance(truncated, dict)
+
+
+class TestRecorder:
+    """Tests for the background tool-call recorder."""
+
+    def test_tool_returns_before_recording_finishes(self):
+        mcp = MagicMock()
+        release = threading.Event()
+        memory = MagicMock()
+        memory.record_call.side_effect = lambda *a: release.wait(5)
+
+        @qs_tool(mcp, lambda: memory)
+        def my_tool() -> dict:
+            return {"status": "ok"}
+
+        assert my_tool() == {"status": "ok"}
+        release.set()
+        _recorder.drain()
+        memory.record_call.assert_called_once()
+
+    def test_full_queue_drops_oldest(self):
+        started, release = threading.Event(), threading.Event()
+        _recorder.submit(lambda: (started.set(), release.wait(5)))
+        assert started.wait(5)
+
+        seen = []
+        before = _recorder.dropped
+        for i in range(_recorder.QUEUE_SIZE + 1):
+            _recorder.submit(seen.append, i)
+        release.set()
+        _recorder.drain()
+
+        assert _recorder.dropped == before + 1
+        assert seen[0] == 1
+        assert seen[-1] == _recorder.QUEUE_SIZE
@@ -2,6 +2,7 @@
 
 import tempfile
 import os
+from unittest.mock import patch
 
 from quicksight_mcp.learning.tracker import UsageTracker
 from quicksight_mcp.learning.optimizer import Optimizer
@@ -44,6 +45,41 @@ class TestUsageTracker:
         workflows = [w["sequence"] for w in insights.get("common_workflows", [])]
         assert any("search_datasets -> get_dataset_sql" in w for w in workflows)
 
+    def test_insights_reused_until_next_call(self):
+        """Test that insights are recomputed only after a new call."""
+        self.tracker.record_call("list_datasets", {}, 100.0, True)
+        self.tracker.get_insights()
+        with patch.object(self.tracker, "_generate_suggestions") as gen:
+            self.tracker.get_insights()
+            gen.assert_not_called()
+
+            self.tracker.record_call("list_datasets", {}, 100.0, True)
+            gen.return_value = []
+            assert self.tracker.get_insights()["total_calls"] == 2
+            gen.assert_called_once()
+
+    def test_call_recorded_during_insights_not_lost(self):
+        """Test that a call recorded mid-computation forces a recompute."""
+        self.tracker.record_call("list_datasets", {}, 100.0, True)
+        generate = self.tracker._generate_suggestions
+
+        def record_meanwhile():
+            self.tracker.record_call("list_datasets", {}, 100.0, True)
+            return generate()
+
+        with patch.object(
+            self.tracker, "_generate_suggestions", side_effect=record_meanwhile
+        ):
+            assert self.tracker.get_insights()["total_calls"] == 1
+        assert self.tracker.get_insights()["total_calls"] == 2
+
+    def test_insights_returned_as_copy(self):
+        """Test that changing a returned result does not change the cache."""
+        self.tracker.record_call("list_datasets", {}, 100.0, True)
+        first = self.tracker.get_insights()
+        first["most_used_tools"].clear()
+        assert self.tracker.get_insights()["most_used_tools"] != []
+
     def test_error_recording(self):
         """Test that errors are recorded and classified."""
         self.tracker.record_call(
@@ -0,0 +1,132 @@
+"""Tests for the response formatting helpers in tools/_response.py."""
+
+import json
+
+from unittest.mock import patch
+
+from quicksight_mcp.tools import _response
+from quicksight_mcp.tools._response import (
+    CHARACTER_LIMIT,
+    format_error_response,
+    paginate_list,
+    truncate_if_needed,
+)
+
+
+class TestTruncateIfNeeded:
+    """Tests for truncate_if_needed."""
+
+    def test_small_response_unchanged(self):
+        result = {"items": [1, 2, 3]}
+        assert truncate_if_needed(result) == {"items": [1, 2, 3]}
+
+    def test_small_response_skips_serialization(self):
+        with patch.object(_response, "_json_size") as size:
+            truncate_if_needed({"items": ["a", "b"], "count": 2})
+            size.assert_not_called()
+
+    def test_escaped_control_characters_still_truncated(self):
+        # Each \x01 encodes as the six-byte escape \u0001
+        result = {"items": ["\x01" * 580] * 10}
+        assert _response._json_size(result) > CHARACTER_LIMIT
+        truncated = truncate_if_needed(result)
+        assert truncated["_truncated"] is True
+        assert _response._json_size(truncated) <= CHARACTER_LIMIT
+
+    def test_approx_size_stops_at_budget(self):
+        big = ["x" * 100 for _ in range(10_000)]
+        size = _response._approx_size(big, 500)
+        assert 500 < size < 20_000  # full estimate would be ~1 MB
+
+    def test_large_list_halved_to_fit(self):
+        result = {"items": ["x" * 50 for _ in range(800)]}
+        truncated = truncate_if_needed(result)
+        assert truncated["_truncated"] is True
+        assert len(truncated["items"]) == 400
+        assert len(json.dumps(truncated)) <= CHARACTER_LIMIT
+
+    def test_only_dropped_half_serialized(self):
+        items = ["x" * 50 for _ in range(800)]
+        result = {"items": items}
+        with patch.object(
+            _response, "_json_size", wraps=_response._json_size
+        ) as size:
+            truncate_if_needed(result)
+        lengths = [len(c.args[0]) for c in size.call_args_list
+                   if isinstance(c.args[0], list)]
+        assert lengths == [400]
+
+    def test_largest_list_truncated_first(self):
+        result = {
+            "small": list(range(10)),
+            "big": ["y" * 100 for _ in range(400)],
+        }
+        truncated = truncate_if_needed(result)
+        assert truncated["small"] == list(range(10))
+        assert len(truncated["big"]) == 200
+
+    def test_list_halved_repeatedly_until_fit(self):
+        result = {"items": ["x" * 50 for _ in range(3200)]}
+        truncated = truncate_if_needed(result)
+        assert len(truncated["items"]) == 400
+        assert len(json.dumps(truncated)) <= CHARACTER_LIMIT
+
+    def test_short_lists_halved_to_fit(self):
+        result = {"items": ["z" * 10_000 for _ in range(5)]}
+        truncated = truncate_if_needed(result)
+        assert len(truncated["items"]) == 2
+        assert truncated["_truncated"] is True
+
+    def test_input_not_modified(self):
+        items = ["x" * 50 for _ in range(800)]
+        result = {"items": items}
+        truncate_if_needed(result)
+        assert result == {"items": items}
+        assert len(items) == 800
+
+    def test_unshrinkable_response_replaced_with_note(self):
+        result = {"data": {f"key_{i}": "x" * 100 for i in range(500)}}
+        truncated = truncate_if_needed(result, "get_thing")
+        assert truncated["_truncated"] is True
+        assert "get_thing" in truncated["_note"]
+        assert "data" not in truncated
+
+
+class TestPaginateList:
+    """Tests for paginate_list."""
+
+    def test_first_page(self):
+        page = paginate_list(list(range(10)), limit=3)
+        assert page["items"] == [0, 1, 2]
+        assert page["total_count"] == 10
+        assert page["has_more"] is True
+        assert page["next_offset"] == 3
+
+    def test_last_page(self):
+        page = paginate_list(list(range(10)), limit=5, offset=5)
+        assert page["items"] == [5, 6, 7, 8, 9]
+        assert page["has_more"] is False
+        assert "next_offset" not in page
+
+    def test_single_page_reuses_source_list(self):
+        items = list(range(10))
+        page = paginate_list(items, limit=50)
+        assert page["items"] is items
+        assert page["count"] == 10
+        assert page["has_more"] is False
+
+
+class TestFormatErrorResponse:
+    """Tests for format_error_response."""
+
+    def test_minimal_error(self):
+        resp = format_error_response(ValueError("bad"))
+        assert resp == {"isError": True, "error_type": "unexpected", "error": "bad"}
+
+    def test_optional_fields_included_when_set(self):
+        resp = format_error_response(
+            ValueError("bad"), "validation", suggestions=["fix it"],
+        )
+        assert resp["error_type"] == "validation"
+        assert resp["suggestions"] == ["fix it"]
+        assert "metadata" not in resp
@@ -185,3 +185,40 @@ class TestServerWiring:
 
         # get_memory should be a callable
         assert callable(get_memory)
+
+    def test_get_client_concurrent_first_calls_share_instance(self):
+        """Concurrent first get_client() calls should build one client."""
+        import threading
+        from unittest.mock import patch
+
+        from quicksight_mcp import server
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def call():
+            barrier.wait()
+            results.append(server.get_client())
+
+        with patch.object(server, "_client", None), patch(
+            "quicksight_mcp.client.QuickSightClient", side_effect=object
+        ) as ctor:
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert ctor.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_each_tool_registered_once(self):
+        """No tool module should register a name that another already did."""
+        import asyncio
+
+        from quicksight_mcp.server import mcp
+
+        names = [t.name for t in asyncio.run(mcp.list_tools())]
+        assert len(names) == len(set(names))
+        assert "get_calculated_field" in names
+        assert "list_dashboards" in names
@@ -6,8 +6,17 @@ Covers:
 - modify_dataset_sql: find/replace on dataset SQL, ValueError on missing text
 - cancel_refresh: cancel_ingestion API delegation
 - _paginate: paginated list helper, auto-retry on ExpiredToken
+- dashboard caches: version history caching, eviction on publish/rollback
+- get_calculated_field: name index reuse and rebuild on definition change
+- get_analysis_definition / get_dataset: concurrent cache misses share one AWS call
+- add/update_calculated_field: skip the write when nothing would change
+- batch_update_calculated_fields: one write per batch, all-or-nothing
+- dataset cache: searches filter the cached name index, SQL writes evict it
+- wait_for_refresh: backoff schedule, terminal states, throttling, timeout
 """
 
+import copy
+import json
 import os
 from unittest.mock import MagicMock, patch
 
@@ -274,10 +283,13 @@ class TestModifyDatasetSql:
         self.client = _make_client()
 
     def test_modify_dataset_sql_replaces(self):
-        """modify_dataset_sql calls get_dataset_sql, replaces text, then update_dataset_sql."""
+        """modify_dataset_sql describes the dataset once, replaces text, and writes it."""
         original_sql = "SELECT * FROM orders WHERE status = 'active'"
-        self.client.get_dataset_sql = MagicMock(return_value=original_sql)
-        self.client.update_dataset_sql = MagicMock(return_value={'status': 'ok'})
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': original_sql}}},
+        })
+        self.client._call = MagicMock(return_value={'status': 'ok'})
 
         result = self.client.modify_dataset_sql(
             dataset_id='ds-123',
@@ -286,32 +298,92 @@ class TestModifyDatasetSql:
             backup_first=False,
         )
 
-        # Verify get was called
-        self.client.get_dataset_sql.assert_called_once_with('ds-123')
+        # The dataset is described once, uncached, and reused for the update
+        self.client.get_dataset.assert_called_once_with('ds-123', use_cache=False)
 
         # Verify update was called with the replaced SQL
-        self.client.update_dataset_sql.assert_called_once()
-        call_args = self.client.update_dataset_sql.call_args
-        new_sql = call_args[0][1]  # second positional arg
+        self.client._call.assert_called_once()
+        call_args = self.client._call.call_args
+        assert call_args[0][0] == 'update_data_set'
+        physical_map = call_args[1]['PhysicalTableMap']
+        new_sql = physical_map['t1']['CustomSql']['SqlQuery']
         assert new_sql == "SELECT * FROM orders WHERE status = 'completed'"
         assert result == {'status': 'ok'}
 
+    def test_modify_dataset_sql_backs_up_from_the_same_describe(self, tmp_path):
+        """With backup_first, the backup reuses the single describe."""
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT a'}}},
+        })
+        self.client._call = MagicMock(return_value={'status': 'ok'})
+
+        self.client.modify_dataset_sql(
+            dataset_id='ds-123', find='a', replace='b', backup_dir=str(tmp_path),
+        )
+
+        self.client.get_dataset.assert_called_once()
+        backups = list(tmp_path.glob('dataset_orders_*.json'))
+        assert len(backups) == 1
+        saved = json.loads(backups[0].read_text())
+        assert saved['PhysicalTableMap']['t1']['CustomSql']['SqlQuery'] == 'SELECT a'
+
+    def test_modify_dataset_sql_count_limits_replacements(self):
+        """count replaces only the first N occurrences; default replaces all."""
+        sql = "SELECT a FROM t1 JOIN t1_x ON t1.id = t1_x.id"
+        self.client.get_dataset = MagicMock(side_effect=lambda *a, **k: {
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': sql}}},
+        })
+        self.client._call = MagicMock(return_value={'status': 'ok'})
+
+        def written():
+            return self.client._call.call_args[1]['PhysicalTableMap']['t1']['CustomSql']['SqlQuery']
+
+        self.client.modify_dataset_sql('ds-1', 't1', 't2', backup_first=False, count=1)
+        assert written() == "SELECT a FROM t2 JOIN t1_x ON t1.id = t1_x.id"
+
+        self.client.modify_dataset_sql('ds-1', 't1', 't2', backup_first=False)
+        assert written() == "SELECT a FROM t2 JOIN t2_x ON t2.id = t2_x.id"
+
+    @pytest.mark.parametrize('count', [0, -1])
+    def test_modify_dataset_sql_rejects_count_below_one(self, count, tmp_path):
+        """count < 1 is rejected before any describe, backup or update."""
+        self.client.get_dataset = MagicMock()
+        self.client._call = MagicMock()
+
+        with pytest.raises(ValueError, match='count must be at least 1'):
+            self.client.modify_dataset_sql(
+                'ds-1', 't1', 't2', backup_dir=str(tmp_path), count=count,
+            )
+
+        self.client.get_dataset.assert_not_called()
+        self.client._call.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
     def test_modify_dataset_sql_not_found_raises(self):
         """When find text is not in current SQL, raises ValueError."""
         original_sql = "SELECT * FROM orders WHERE status = 'active'"
-        self.client.get_dataset_sql = MagicMock(return_value=original_sql)
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': original_sql}}},
+        })
+        self.client.backup_dataset = MagicMock()
 
         with pytest.raises(ValueError, match="Text to find not present"):
             self.client.modify_dataset_sql(
                 dataset_id='ds-123',
                 find="nonexistent_text",
                 replace="something_else",
-                backup_first=False,
             )
+        self.client.backup_dataset.assert_not_called()
 
     def test_modify_dataset_sql_no_custom_sql_raises(self):
         """When dataset has no Custom SQL, raises ValueError."""
-        self.client.get_dataset_sql = MagicMock(return_value=None)
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'RelationalTable': {'Name': 'orders'}}},
+        })
 
         with pytest.raises(ValueError, match="does not use Custom SQL"):
             self.client.modify_dataset_sql(
@@ -322,6 +394,33 @@ class TestModifyDatasetSql:
             )
 
 
+    def test_modify_dataset_sql_rejects_oversized_result(self):
+        """An edit that pushes the SQL past the API limit fails before any write."""
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT x'}}},
+        })
+        self.client.backup_dataset = MagicMock()
+        self.client._call = MagicMock()
+
+        with pytest.raises(ValueError, match="QuickSight accepts at most"):
+            self.client.modify_dataset_sql(
+                dataset_id='ds-123', find='x', replace='x' * 200_000,
+            )
+        self.client.backup_dataset.assert_not_called()
+        self.client._call.assert_not_called()
+
+    def test_update_dataset_sql_rejects_oversized_sql(self):
+        """update_dataset_sql checks the length before backing up."""
+        self.client.backup_dataset = MagicMock()
+        self.client.get_dataset = MagicMock()
+
+        with pytest.raises(ValueError, match="QuickSight accepts at most"):
+            self.client.update_dataset_sql('ds-123', 'S' * 168_001)
+        self.client.backup_dataset.assert_not_called()
+        self.client.get_dataset.assert_not_called()
+
+
 # =========================================================================
 # cancel_refresh
 # =========================================================================
@@ -423,3 +522,757 @@ class TestPaginate:
 
         results = self.client._paginate('list_data_sets', 'DataSetSummaries')
         assert results == []
+
+
+# =========================================================================
+# Dashboard caches
+# =========================================================================
+
+class TestDashboardCaches:
+    """Verify dashboard version caching and eviction on writes."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.client.clear_dashboard_cache()
+        self.client._call = MagicMock(return_value={
+            'DashboardVersionSummaryList': [
+                {'VersionNumber': 1}, {'VersionNumber': 3}, {'VersionNumber': 2},
+            ],
+        })
+
+    def teardown_method(self):
+        self.client.clear_dashboard_cache()
+
+    def test_versions_cached_and_sorted(self):
+        first = self.client.get_dashboard_versions('db-1', limit=2)
+        second = self.client.get_dashboard_versions('db-1')
+        assert [v['VersionNumber'] for v in first] == [3, 2]
+        assert [v['VersionNumber'] for v in second] == [3, 2, 1]
+        self.client._call.assert_called_once()
+
+    def test_search_stops_at_limit(self):
+        self.client.list_dashboards = MagicMock(return_value=[
+            {'Name': 'Sales A'}, {'Name': 'Ops'}, {'Name': 'sales b'},
+            {'Name': 'SALES C'},
+        ])
+        found = self.client.search_dashboards('sales', limit=2)
+        assert [d['Name'] for d in found] == ['Sales A', 'sales b']
+        assert len(self.client.search_dashboards('sales')) == 3
+
+    def test_rollback_reports_sdk_retries(self):
+        self.client._call.return_value = {
+            'DashboardId': 'db-1',
+            'ResponseMetadata': {'RetryAttempts': 2},
+        }
+        assert self.client.rollback_dashboard('db-1', 2)['retried'] == 2
+
+    def test_rollback_evicts_versions_and_list(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.get_dashboard_versions('db-1')
+        self.client.get_dashboard_versions('db-2')
+        client_mod._dashboard_cache['data'] = [{'DashboardId': 'db-1'}]
+
+        self.client.rollback_dashboard('db-1', 2)
+
+        assert 'db-1' not in client_mod._dashboard_versions_cache
+        assert 'db-2' in client_mod._dashboard_versions_cache
+        assert client_mod._dashboard_cache['data'] is None
+
+
+# =========================================================================
+# get_calculated_field name index
+# =========================================================================
+
+class TestCalculatedFieldIndex:
+    """Verify get_calculated_field reuses its per-analysis name index."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.fields = [
+            {'Name': 'Margin', 'Expression': '{a} - {b}'},
+            {'Name': 'Rate', 'Expression': '{a} / {b}'},
+        ]
+        self.client.get_analysis_definition = MagicMock(
+            return_value={'CalculatedFields': self.fields},
+        )
+
+    def teardown_method(self):
+        self.client.clear_analysis_def_cache()
+
+    def test_lookup_hits_and_misses(self):
+        assert self.client.get_calculated_field('an-1', 'Rate') is self.fields[1]
+        assert self.client.get_calculated_field('an-1', 'Nope') is None
+
+    def test_index_reused_for_same_definition(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.get_calculated_field('an-1', 'Margin')
+        index = client_mod._calc_field_index['an-1'][2]
+        self.client.get_calculated_field('an-1', 'Rate')
+        assert client_mod._calc_field_index['an-1'][2] is index
+
+    def test_index_rebuilt_after_in_place_delete(self):
+        self.client.get_calculated_field('an-1', 'Margin')
+        del self.fields[0]
+        assert self.client.get_calculated_field('an-1', 'Margin') is None
+
+
+# =========================================================================
+# get_analysis_definition single-flight
+# =========================================================================
+
+class TestAnalysisDefinitionSingleFlight:
+    """Verify concurrent cache misses share one describe call."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.client.clear_analysis_def_cache()
+
+    def teardown_method(self):
+        self.client.clear_analysis_def_cache()
+
+    def _run_concurrently(self, n):
+        import threading
+
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(self.client.get_analysis_definition('an-1'))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    def test_concurrent_misses_coalesce(self):
+        import threading
+
+        release = threading.Event()
+        definition = {'Sheets': []}
+
+        def slow_call(method, **kwargs):
+            release.wait(5)
+            return {'Definition': definition}
+
+        self.client._call = MagicMock(side_effect=slow_call)
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        results, errors = self._run_concurrently(5)
+
+        assert not errors
+        assert all(r is definition for r in results)
+        self.client._call.assert_called_once()
+
+    def test_failure_propagates_to_waiters(self):
+        import threading
+
+        release = threading.Event()
+
+        def failing_call(method, **kwargs):
+            release.wait(5)
+            raise RuntimeError('throttled')
+
+        self.client._call = MagicMock(side_effect=failing_call)
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        results, errors = self._run_concurrently(3)
+
+        assert not results
+        assert len(errors) == 3
+        assert self.client._call.call_count == 1
+
+    def test_read_racing_a_write_is_not_cached(self):
+        import threading
+
+        import quicksight_mcp.client as client_mod
+
+        started, release = threading.Event(), threading.Event()
+        old, new = {'CalculatedFields': []}, {'CalculatedFields': [{'Name': 'Rate'}]}
+        describes = []
+
+        def call(method, **kwargs):
+            describes.append(method)
+            if len(describes) == 1:
+                started.set()
+                release.wait(5)
+                return {'Definition': old}
+            return {'Definition': new}
+
+        self.client._call = MagicMock(side_effect=call)
+        stale = []
+        reader = threading.Thread(
+            target=lambda: stale.append(self.client.get_analysis_definition('an-1')),
+        )
+        reader.start()
+        assert started.wait(5)
+
+        # What every post-write verifier does after update_analysis
+        self.client.clear_analysis_def_cache('an-1')
+        fields = self.client.get_calculated_fields('an-1')
+        release.set()
+        reader.join()
+
+        assert stale[0] is old
+        assert fields == [{'Name': 'Rate'}]
+        assert client_mod._analysis_def_cache['an-1']['data'] is new
+
+
+# =========================================================================
+# add/update_calculated_field no-op detection
+# =========================================================================
+
+class TestCalculatedFieldNoop:
+    """Verify unchanged calculated fields skip the backup and update."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.client.get_analysis_definition_with_version = MagicMock(
+            return_value=(
+                {'CalculatedFields': [{
+                    'Name': 'Rate', 'Expression': '{a} / {b}',
+                    'DataSetIdentifier': 'ds1',
+                }]},
+                '2026-01-01T00:00:00Z',
+            ),
+        )
+        self.client.update_analysis = MagicMock(
+            return_value={'status': 'UPDATE_SUCCESSFUL'},
+        )
+
+    def test_update_same_expression_is_noop(self):
+        result = self.client.update_calculated_field('an-1', 'Rate', '{a} / {b}')
+        assert result['status'] == 'noop'
+        self.client.update_analysis.assert_not_called()
+
+    def test_update_new_expression_writes(self):
+        self.client.update_calculated_field('an-1', 'Rate', '{a} * 2')
+        self.client.update_analysis.assert_called_once()
+
+    def test_add_identical_field_exists(self):
+        result = self.client.add_calculated_field('an-1', 'Rate', '{a} / {b}', 'ds1')
+        assert result['status'] == 'exists'
+        self.client.update_analysis.assert_not_called()
+
+    def test_add_conflicting_field_raises(self):
+        with pytest.raises(ValueError, match='already exists'):
+            self.client.add_calculated_field('an-1', 'Rate', '{a}', 'ds1')
+
+
+# =========================================================================
+# batch_update_calculated_fields
+# =========================================================================
+
+class TestBatchUpdateCalculatedFields:
+    """Verify batched calculated-field edits share one write."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.definition = {'CalculatedFields': [
+            {'Name': 'Rate', 'Expression': '{a} / {b}', 'DataSetIdentifier': 'ds1'},
+            {'Name': 'Old', 'Expression': '{c}', 'DataSetIdentifier': 'ds1'},
+        ]}
+        self.client.get_analysis_definition_with_version = MagicMock(
+            return_value=(self.definition, '2026-01-01T00:00:00Z'),
+        )
+        self.client.update_analysis = MagicMock(
+            return_value={'status': 'UPDATE_SUCCESSFUL'},
+        )
+
+    def test_single_write_for_mixed_operations(self):
+        result = self.client.batch_update_calculated_fields('an-1', [
+            {'action': 'add', 'name': 'New', 'expression': '{d}',
+             'dataset_identifier': 'ds1'},
+            {'action': 'update', 'name': 'Rate', 'expression': '{a} * 2'},
+            {'action': 'delete', 'name': 'Old'},
+        ])
+        assert [r['status'] for r in result['results']] == [
+            'added', 'updated', 'deleted',
+        ]
+        self.client.update_analysis.assert_called_once()
+        written = self.client.update_analysis.call_args[0][1]['CalculatedFields']
+        assert {f['Name']: f['Expression'] for f in written} == {
+            'Rate': '{a} * 2', 'New': '{d}',
+        }
+
+    def test_invalid_operation_writes_nothing(self):
+        with pytest.raises(ValueError, match='not found'):
+            self.client.batch_update_calculated_fields('an-1', [
+                {'action': 'update', 'name': 'Rate', 'expression': '{a} * 2'},
+                {'action': 'delete', 'name': 'Missing'},
+            ])
+        self.client.update_analysis.assert_not_called()
+        # The cached definition was not touched by the rejected batch
+        assert self.definition['CalculatedFields'][0]['Expression'] == '{a} / {b}'
+
+    def test_all_noop_skips_write(self):
+        result = self.client.batch_update_calculated_fields('an-1', [
+            {'action': 'update', 'name': 'Rate', 'expression': '{a} / {b}'},
+        ])
+        assert result['update'] is None
+        self.client.update_analysis.assert_not_called()
+
+    def test_verification_checks_final_state(self):
+        self.client._verify_default = True
+        self.client.get_calculated_fields = MagicMock(return_value=[
+            {'Name': 'Rate', 'Expression': '{a} / {b}'},
+        ])
+        from quicksight_mcp.exceptions import ChangeVerificationError
+
+        with pytest.raises(ChangeVerificationError):
+            self.client.batch_update_calculated_fields('an-1', [
+                {'action': 'update', 'name': 'Rate', 'expression': '{a} * 2'},
+            ])
+
+
+# =========================================================================
+# dataset list cache
+# =========================================================================
+
+class TestDatasetCache:
+    """Verify dataset searches reuse the cached list and writes evict it."""
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.client.clear_dataset_cache()
+        self.client._paginate = MagicMock(return_value=[
+            {'Name': 'WBR Weekly', 'DataSetId': 'ds-1'},
+            {'Name': 'orders', 'DataSetId': 'ds-2'},
+            {'Name': 'wbr_ingest', 'DataSetId': 'ds-3'},
+        ])
+
+    def teardown_method(self):
+        self.client.clear_dataset_cache()
+
+    def test_searches_share_one_list_call(self):
+        first = self.client.search_datasets('wbr')
+        second = self.client.search_datasets('ORDERS')
+        assert [d['DataSetId'] for d in first] == ['ds-1', 'ds-3']
+        assert [d['DataSetId'] for d in second] == ['ds-2']
+        self.client._paginate.assert_called_once()
+
+    def test_name_index_built_with_list(self):
+        import quicksight_mcp.client as client_mod
+
+        datasets = self.client.list_datasets()
+        index = client_mod._dataset_cache['index']
+        assert [name for name, _ in index] == ['wbr weekly', 'orders', 'wbr_ingest']
+        assert index[0][1] is datasets[0]
+
+        self.client.search_datasets('wbr')
+        assert client_mod._dataset_cache['index'] is index
+
+    def test_repeated_search_reuses_matches(self):
+        import quicksight_mcp.client as client_mod
+
+        first = self.client.search_datasets('WBR')
+        first.clear()
+        second = self.client.search_datasets('wbr')
+        assert [d['DataSetId'] for d in second] == ['ds-1', 'ds-3']
+        assert list(client_mod._dataset_cache['searches']) == ['wbr']
+
+        self.client.clear_dataset_cache()
+        assert client_mod._dataset_cache['searches'] == {}
+
+    def test_update_sql_evicts_list(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.list_datasets()
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT 1'}}},
+        })
+        self.client._call = MagicMock(return_value={'Status': 200})
+
+        self.client.update_dataset_sql('ds-2', 'SELECT 2', backup_first=False)
+
+        assert client_mod._dataset_cache['data'] is None
+        assert client_mod._dataset_cache['index'] is None
+
+
+class TestDatasetSqlCache:
+    """Verify get_dataset_sql is cached and writes store the new SQL."""
+
+    def setup_method(self):
+        import quicksight_mcp.client as client_mod
+
+        client_mod._dataset_sql_cache.clear()
+        self.client = _make_client()
+        self.client.get_dataset = MagicMock(return_value={
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT 1'}}},
+        })
+        self.client._call = MagicMock(return_value={'Status': 200})
+
+    def teardown_method(self):
+        import quicksight_mcp.client as client_mod
+
+        client_mod._dataset_sql_cache.clear()
+
+    def test_repeat_reads_describe_once(self):
+        assert self.client.get_dataset_sql('ds-1') == 'SELECT 1'
+        assert self.client.get_dataset_sql('ds-1') == 'SELECT 1'
+        self.client.get_dataset.assert_called_once_with('ds-1', use_cache=True)
+
+        self.client.get_dataset_sql('ds-1', use_cache=False)
+        self.client.get_dataset.assert_called_with('ds-1', use_cache=False)
+
+    def test_update_writes_through(self):
+        self.client.get_dataset_sql('ds-1')
+        self.client.update_dataset_sql('ds-1', 'SELECT 2', backup_first=False)
+        calls = self.client.get_dataset.call_count
+
+        assert self.client.get_dataset_sql('ds-1') == 'SELECT 2'
+        assert self.client.get_dataset.call_count == calls
+
+    def test_read_finishing_after_write_keeps_new_sql(self):
+        import quicksight_mcp.client as client_mod
+
+        def describe(dataset_id, use_cache=True):
+            dataset = {
+                'Name': 'orders',
+                'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT 1'}}},
+            }
+            if use_cache:
+                # The write lands while this read is still in flight
+                self.client.update_dataset_sql('ds-1', 'SELECT 2', backup_first=False)
+            return dataset
+
+        self.client.get_dataset = MagicMock(side_effect=describe)
+        assert self.client.get_dataset_sql('ds-1') == 'SELECT 1'
+        assert client_mod._dataset_sql_cache['ds-1']['data'] == 'SELECT 2'
+
+    def test_definition_update_evicts(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.get_dataset_sql('ds-1')
+        self.client.update_dataset_definition(
+            'ds-1',
+            {'Name': 'orders', 'PhysicalTableMap': {'t': {}}, 'LogicalTableMap': {'l': {}}},
+            backup_first=False,
+        )
+        assert 'ds-1' not in client_mod._dataset_sql_cache
+
+
+class TestDatasetDescribeCache:
+    """Verify describe_data_set results are cached for reads only."""
+
+    def setup_method(self):
+        import quicksight_mcp.client as client_mod
+
+        client_mod._dataset_describe_cache.clear()
+        self.client = _make_client()
+        self.client._call = MagicMock(return_value={'DataSet': {
+            'Name': 'orders',
+            'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': 'SELECT 1'}}},
+        }})
+
+    def teardown_method(self):
+        import quicksight_mcp.client as client_mod
+
+        client_mod._dataset_describe_cache.clear()
+        client_mod._dataset_sql_cache.clear()
+
+    def test_repeat_reads_share_one_describe(self):
+        first = self.client.get_dataset('ds-1')
+        assert self.client.get_dataset('ds-1') is first
+        self.client._call.assert_called_once()
+
+        self.client.get_dataset('ds-1', use_cache=False)
+        assert self.client._call.call_count == 2
+
+    def test_concurrent_misses_coalesce(self):
+        import threading
+
+        release = threading.Event()
+        dataset = {'Name': 'orders'}
+
+        def slow_call(method, **kwargs):
+            release.wait(5)
+            return {'DataSet': dataset}
+
+        self.client._call = MagicMock(side_effect=slow_call)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.client.get_dataset('ds-1')))
+            for _ in range(4)
+        ]
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 4
+        assert all(r is dataset for r in results)
+        self.client._call.assert_called_once()
+
+    def test_clear_details_cache(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.get_dataset_sql('ds-1')
+        self.client.get_dataset_sql('ds-2')
+        self.client.clear_dataset_details_cache('ds-1')
+        assert list(client_mod._dataset_describe_cache) == ['ds-2']
+        assert list(client_mod._dataset_sql_cache) == ['ds-2']
+
+        self.client.clear_dataset_details_cache()
+        assert not client_mod._dataset_describe_cache
+        assert not client_mod._dataset_sql_cache
+
+    def test_sql_write_evicts_entry(self):
+        import quicksight_mcp.client as client_mod
+
+        self.client.get_dataset('ds-1')
+        self.client.update_dataset_sql('ds-1', 'SELECT 2', backup_first=False)
+        assert 'ds-1' not in client_mod._dataset_describe_cache
+
+    def test_read_racing_a_write_is_not_cached(self):
+        import threading
+
+        import quicksight_mcp.client as client_mod
+
+        started, release = threading.Event(), threading.Event()
+        describes = []
+
+        def call(method, **kwargs):
+            if method != 'describe_data_set':
+                return {'Status': 200}
+            describes.append(method)
+            if len(describes) == 1:
+                started.set()
+                release.wait(5)
+                sql = 'SELECT 1'
+            else:
+                sql = 'SELECT 1' if len(describes) == 2 else 'SELECT 2'
+            return {'DataSet': {
+                'Name': 'orders',
+                'PhysicalTableMap': {'t1': {'CustomSql': {'SqlQuery': sql}}},
+            }}
+
+        self.client._call = MagicMock(side_effect=call)
+        stale = []
+        reader = threading.Thread(target=lambda: stale.append(self.client.get_dataset('ds-1')))
+        reader.start()
+        assert started.wait(5)
+
+        self.client.update_dataset_sql('ds-1', 'SELECT 2', backup_first=False)
+        # Does not join the read that started before the write
+        fresh = self.client.get_dataset('ds-1')
+        release.set()
+        reader.join()
+
+        assert stale[0]['PhysicalTableMap']['t1']['CustomSql']['SqlQuery'] == 'SELECT 1'
+        assert fresh['PhysicalTableMap']['t1']['CustomSql']['SqlQuery'] == 'SELECT 2'
+        assert client_mod._dataset_describe_cache['ds-1']['data'] is fresh
+
+    def test_least_recently_used_entry_dropped(self):
+        import quicksight_mcp.client as client_mod
+
+        with patch.object(client_mod, '_DATASET_DESCRIBE_MAX', 2):
+            self.client.get_dataset('ds-1')
+            self.client.get_dataset('ds-2')
+            self.client.get_dataset('ds-1')
+            self.client.get_dataset('ds-3')
+        assert list(client_mod._dataset_describe_cache) == ['ds-1', 'ds-3']
+
+
+class TestUpdateDatasetDefinitionNoop:
+    """Verify an unchanged definition is neither backed up nor written."""
+
+    CURRENT = {
+        'Arn': 'arn:aws:quicksight:us-east-1:123456789012:dataset/ds-1',
+        'Name': 'orders',
+        'PhysicalTableMap': {'t': {'CustomSql': {'SqlQuery': 'SELECT 1'}}},
+        'LogicalTableMap': {'l': {'Alias': 'orders'}},
+        'ImportMode': 'SPICE',
+        'FieldFolders': {'f': {'columns': ['a']}},
+    }
+
+    def setup_method(self):
+        self.client = _make_client()
+        self.client.get_dataset = MagicMock(
+            side_effect=lambda *a, **k: copy.deepcopy(self.CURRENT),
+        )
+        self.client._write_dataset_backup = MagicMock()
+        self.client._call = MagicMock(return_value={'Status': 200})
+
+    def _definition(self, **overrides):
+        definition = copy.deepcopy(self.CURRENT)
+        del definition['Arn']
+        definition.update(overrides)
+        return definition
+
+    def test_unchanged_definition_is_noop(self):
+        result = self.client.update_dataset_definition('ds-1', self._definition())
+        assert result == {'status': 'noop'}
+        self.client._write_dataset_backup.assert_not_called()
+        self.client._call.assert_not_called()
+        self.client.get_dataset.assert_called_once()
+
+    def test_changed_definition_backs_up_and_writes(self):
+        self.client.update_dataset_definition(
+            'ds-1', self._definition(ImportMode='DIRECT_QUERY'),
+        )
+        self.client._write_dataset_backup.assert_called_once()
+        assert self.client._call.call_args.args[0] == 'update_data_set'
+        self.client.get_dataset.assert_called_once()
+
+    def test_dropping_optional_key_is_a_change(self):
+        definition = self._definition()
+        del definition['FieldFolders']
+        self.client.update_dataset_definition('ds-1', definition)
+        self.client._call.assert_called_once()
+
+
+# =========================================================================
+# wait_for_refresh
+# =========================================================================
+
+class TestWaitForRefresh:
+    """Verify SPICE refresh polling with backoff."""
+
+    def setup_method(self):
+        self.client = _make_client()
+
+    def test_delay_schedule_ramps_to_plateau(self):
+        from quicksight_mcp.client import _refresh_poll_delay
+
+        with patch('quicksight_mcp.client.random.uniform', return_value=1.0):
+            delays = [_refresh_poll_delay(n) for n in range(40)]
+        assert delays[:10] == [1.0] * 10
+        assert all(a < b for a, b in zip(delays[9:30], delays[10:30]))
+        assert delays[29] == delays[39] == 30.0
+
+    def test_returns_on_terminal_status(self):
+        self.client.get_refresh_status = MagicMock(side_effect=[
+            {'status': 'QUEUED'}, {'status': 'RUNNING'},
+            {'status': 'COMPLETED', 'row_count': 42},
+        ])
+        with patch('quicksight_mcp.client.time.sleep') as sleep:
+            result = self.client.wait_for_refresh('ds-1', 'ing-1')
+        assert result['status'] == 'COMPLETED'
+        assert result['row_count'] == 42
+        assert result['polls'] == 3
+        assert result['timed_out'] is False
+        assert sleep.call_count == 2
+
+    @staticmethod
+    def _client_error(code, message='Rate exceeded'):
+        from botocore.exceptions import ClientError
+
+        return ClientError({'Error': {'Code': code, 'Message': message}}, 'DescribeIngestion')
+
+    @pytest.mark.parametrize('code', [
+        'ThrottlingException', 'TooManyRequestsException', 'RequestLimitExceeded',
+    ])
+    def test_throttled_check_doubles_wait(self, code):
+        self.client.get_refresh_status = MagicMock(side_effect=[
+            self._client_error(code),
+            {'status': 'FAILED', 'error': {'Message': 'bad SQL'}},
+        ])
+        with patch('quicksight_mcp.client.random.uniform', return_value=1.0), \
+                patch('quicksight_mcp.client.time.sleep') as sleep:
+            result = self.client.wait_for_refresh('ds-1', 'ing-1')
+        assert result['status'] == 'FAILED'
+        sleep.assert_called_once_with(2.0)
+
+    def test_throttling_in_message_only_propagates(self):
+        self.client.get_refresh_status = MagicMock(side_effect=self._client_error(
+            'InvalidParameterValueException', 'Throttling settings are invalid',
+        ))
+        with pytest.raises(Exception, match='Throttling settings'):
+            self.client.wait_for_refresh('ds-1', 'ing-1')
+
+    def test_other_errors_propagate(self):
+        self.client.get_refresh_status = MagicMock(
+            side_effect=Exception('ResourceNotFoundException'),
+        )
+        with pytest.raises(Exception, match='ResourceNotFound'):
+            self.client.wait_for_refresh('ds-1', 'ing-1')
+
+    def test_times_out(self):
+        self.client.get_refresh_status = MagicMock(return_value={'status': 'RUNNING'})
+        clock = iter([0.0, 0.5, 5.0])
+        with patch('quicksight_mcp.client.time.monotonic', side_effect=lambda: next(clock)), \
+                patch('quicksight_mcp.client.time.sleep') as sleep:
+            result = self.client.wait_for_refresh('ds-1', 'ing-1', timeout_seconds=2)
+        assert result['timed_out'] is True
+        assert result['status'] == 'RUNNING'
+        assert result['polls'] == 2
+        sleep.assert_called_once()
+
+
+# =========================================================================
+# refresh_dataset de-duplication
+# =========================================================================
+
+class TestRefreshDedup:
+    """Verify a running refresh is reused instead of starting another."""
+
+    def setup_method(self):
+        import quicksight_mcp.client as client_mod
+
+        client_mod._refresh_inflight.clear()
+        self.client = _make_client()
+        self.client._call = MagicMock(return_value={'IngestionStatus': 'INITIALIZED'})
+
+    def _describe(self, status):
+        return {'Ingestion': {'IngestionStatus': status}}
+
+    def test_running_refresh_is_reused(self):
+        first = self.client.refresh_dataset('ds-1')
+        assert first['already_running'] is False
+
+        self.client._call.return_value = self._describe('RUNNING')
+        second = self.client.refresh_dataset('ds-1')
+        assert second['already_running'] is True
+        assert second['ingestion_id'] == first['ingestion_id']
+        assert second['status'] == 'RUNNING'
+        methods = [c.args[0] for c in self.client._call.call_args_list]
+        assert methods == ['create_ingestion', 'describe_ingestion']
+
+    def test_finished_refresh_allows_a_new_one(self):
+        first = self.client.refresh_dataset('ds-1')
+        self.client._call.return_value = self._describe('COMPLETED')
+        self.client.get_refresh_status('ds-1', first['ingestion_id'])
+
+        self.client._call.return_value = {'IngestionStatus': 'INITIALIZED'}
+        second = self.client.refresh_dataset('ds-1')
+        assert second['already_running'] is False
+        assert self.client._call.call_args.args[0] == 'create_ingestion'
+
+    def test_slow_refresh_does_not_block_other_datasets(self):
+        import threading
+
+        release = threading.Event()
+
+        def call(method, **kwargs):
+            if kwargs.get('DataSetId') == 'ds-slow':
+                release.wait(5)
+            return {'IngestionStatus': 'INITIALIZED'}
+
+        self.client._call = MagicMock(side_effect=call)
+        slow = threading.Thread(target=self.client.refresh_dataset, args=('ds-slow',))
+        slow.start()
+        try:
+            # ds-slow's create_ingestion is still in progress here
+            other = self.client.refresh_dataset('ds-fast')
+            assert other['already_running'] is False
+            assert slow.is_alive()
+        finally:
+            release.set()
+            slow.join()
+
+    def test_cancel_forgets_the_refresh(self):
+        first = self.client.refresh_dataset('ds-1')
+        self.client.cancel_refresh('ds-1', first['ingestion_id'])
+
+        second = self.client.refresh_dataset('ds-1')
+        assert second['already_running'] is False